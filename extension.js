@@ -50,9 +50,11 @@ class HCIIndicator extends PanelMenu.Button {
         try {
             if (key.includes('mode') || key.includes('auto-calibrate')) {
                 return this._settings.get_boolean(key);
-            } else if (key.includes('factor') || key.includes('threshold') || key.includes('confidence') || key.includes('cooldown')) {
+            } else if (key.includes('factor') || key.includes('threshold') || key.includes('confidence') || key.includes('cooldown') ||
+                       key.includes('scale') || key.includes('timeout')) {
                 return this._settings.get_double(key);
-            } else if (key.includes('index') || key.includes('fps') || key.includes('actions') || key.includes('margin')) {
+            } else if (key.includes('index') || key.includes('fps') || key.includes('actions') || key.includes('margin') ||
+                       key.includes('width') || key.includes('height')) {
                 return this._settings.get_int(key);
             } else {
                 return this._settings.get_string(key);
@@ -293,11 +295,16 @@ class HCIIndicator extends PanelMenu.Button {
             vars['HCI_CLICK_COOLDOWN'] = String(this._getSettingValue('click-cooldown') || 0.3);
             vars['HCI_CAMERA_INDEX'] = String(this._getSettingValue('camera-index') || 0);
             vars['HCI_CAMERA_FPS'] = String(this._getSettingValue('camera-fps') || 30);
+            vars['HCI_CAMERA_WIDTH'] = String(this._getSettingValue('camera-width') || 640);
+            vars['HCI_CAMERA_HEIGHT'] = String(this._getSettingValue('camera-height') || 480);
+            vars['HCI_INFERENCE_SCALE'] = String(this._getSettingValue('inference-scale') || 1.0);
+            vars['HCI_IDLE_TIMEOUT'] = String(this._getSettingValue('idle-timeout') ?? 5.0);
             vars['HCI_MAX_ACTIONS_PER_SECOND'] = String(this._getSettingValue('max-actions-per-second') || 3);
             vars['HCI_SCREEN_EDGE_MARGIN'] = String(this._getSettingValue('screen-edge-margin') || 50);
             
             // String ayarlar
             vars['HCI_LOG_LEVEL'] = this._getSettingValue('log-level') || 'INFO';
+            vars['HCI_CAMERA_FOURCC'] = this._getSettingValue('camera-fourcc') || 'MJPG';
             
             log(`HCI: Prepared environment variables: ${JSON.stringify(vars)}`);
         } catch (e) {
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark
+Kayitli bir video (ya da goruntu klasoru) uzerinde el algilamayi farkli
+inference olçeklerinde çaliştirir. Her olçek için gecikme ve tam
+çozunurluğe (olçek 1.0) gore landmark sapmasini raporlar.
+
+Kullanim:
+    python benchmarks/replay_benchmark.py kayit.mp4 --scales 1.0,0.75,0.5,0.35
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# src klasorunu path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import cv2  # noqa: E402
+
+from utils.image_ops import clamp_inference_scale, resize_for_inference  # noqa: E402
+
+IMAGE_EXTENSIONS = ('*.png', '*.jpg', '*.jpeg', '*.bmp')
+
+
+def load_frames(path: str, max_frames: Optional[int] = None, mirror: bool = True) -> List[np.ndarray]:
+    """Video dosyasindan ya da goruntu klasorunden BGR frame'leri yukle"""
+    frames = []
+
+    if os.path.isdir(path):
+        files = sorted(f for pattern in IMAGE_EXTENSIONS for f in glob.glob(os.path.join(path, pattern)))
+        for file_path in files[:max_frames]:
+            frame = cv2.imread(file_path)
+            if frame is not None:
+                frames.append(frame)
+    else:
+        cap = cv2.VideoCapture(path)
+        while max_frames is None or len(frames) < max_frames:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            frames.append(frame)
+        cap.release()
+
+    if mirror:
+        # Canli sistemle ayni girdi - ayna goruntu
+        frames = [cv2.flip(frame, 1) for frame in frames]
+    return frames
+
+
+def run_inference(frames: List[np.ndarray], scale: float, confidence: float = 0.7) -> Dict[str, Any]:
+    """Tum frame'leri verilen olçekte işle - landmark'lar ve sureler"""
+    import mediapipe as mp
+    mp_hands = mp.solutions.hands  # type: ignore
+
+    landmarks: List[Optional[np.ndarray]] = []
+    latencies = []
+
+    with mp_hands.Hands(max_num_hands=1,
+                        min_detection_confidence=confidence,
+                        min_tracking_confidence=confidence) as hands:
+        for frame in frames:
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+            start = time.perf_counter()
+            results = hands.process(resize_for_inference(rgb, scale))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            if results.multi_hand_landmarks:
+                hand = results.multi_hand_landmarks[0]
+                landmarks.append(np.array([(lm.x, lm.y) for lm in hand.landmark], dtype=np.float32))
+            else:
+                landmarks.append(None)
+
+    return {'landmarks': landmarks, 'latencies_ms': np.array(latencies)}
+
+
+def compare_to_reference(run: Dict[str, Any], reference: Dict[str, Any], frame_shape) -> Dict[str, Any]:
+    """Olçekli çaliştirmayi tam çozunurluk referansiyla karşilaştir"""
+    h, w = frame_shape[:2]
+    pixel_scale = np.array([w, h], dtype=np.float32)
+
+    errors = []
+    index_errors = []
+    agree = 0
+    for lm, ref in zip(run['landmarks'], reference['landmarks']):
+        if (lm is None) == (ref is None):
+            agree += 1
+        if lm is not None and ref is not None:
+            diff = np.linalg.norm((lm - ref) * pixel_scale, axis=1)
+            errors.append(float(diff.mean()))
+            index_errors.append(float(diff[8]))  # İşaret parmaği ucu - imleci suren nokta
+
+    latencies = run['latencies_ms']
+    detected = sum(1 for lm in run['landmarks'] if lm is not None)
+    total = len(run['landmarks'])
+
+    return {
+        'latency_mean_ms': float(latencies.mean()) if total else 0.0,
+        'latency_p95_ms': float(np.percentile(latencies, 95)) if total else 0.0,
+        'detection_rate': detected / total if total else 0.0,
+        'detection_agreement': agree / total if total else 0.0,
+        'landmark_error_px': float(np.mean(errors)) if errors else None,
+        'index_tip_error_px': float(np.mean(index_errors)) if index_errors else None,
+    }
+
+
+def benchmark_inference_scales(frames: List[np.ndarray], scales: List[float],
+                               confidence: float = 0.7) -> Dict[str, Any]:
+    """Her olçek için doğruluk/gecikme dengesini olç"""
+    reference = run_inference(frames, 1.0, confidence)
+
+    report = {}
+    for scale in scales:
+        run = reference if scale >= 1.0 else run_inference(frames, scale, confidence)
+        report[f"{scale:.2f}"] = compare_to_reference(run, reference, frames[0].shape)
+    return report
+
+
+def print_scale_report(report: Dict[str, Any]):
+    """Olçek raporunu tablo olarak yazdir"""
+    print(f"{'olçek':>6} | {'ort. ms':>8} | {'p95 ms':>7} | {'algilama':>8} | {'uyum':>6} | "
+          f"{'sapma px':>8} | {'uç px':>6}")
+    print("-" * 68)
+    for scale, row in report.items():
+        err = row['landmark_error_px']
+        tip = row['index_tip_error_px']
+        print(f"{scale:>6} | {row['latency_mean_ms']:8.2f} | {row['latency_p95_ms']:7.2f} | "
+              f"{row['detection_rate'] * 100:7.1f}% | {row['detection_agreement'] * 100:5.1f}% | "
+              f"{err if err is not None else float('nan'):8.2f} | {tip if tip is not None else float('nan'):6.2f}")
+
+
+def parse_args():
+    """Komut satiri argumanlarini parse et"""
+    parser = argparse.ArgumentParser(description='HCI replay benchmark')
+    parser.add_argument('input', help='Video dosyasi ya da goruntu klasoru')
+    parser.add_argument('--scales', default='1.0,0.75,0.5,0.35',
+                        help='Virgulle ayrilmiş inference olçekleri (varsayilan: 1.0,0.75,0.5,0.35)')
+    parser.add_argument('--max-frames', type=int, default=None, help='En fazla işlenecek frame sayisi')
+    parser.add_argument('--confidence', type=float, default=0.7, help='Minimum guven seviyesi')
+    parser.add_argument('--no-mirror', action='store_true', help='Frame\'leri aynalama')
+    parser.add_argument('--json', dest='json_path', help='Sonuçlari JSON olarak bu dosyaya yaz')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    frames = load_frames(args.input, args.max_frames, mirror=not args.no_mirror)
+    if not frames:
+        print(f"[X] Frame okunamadi: {args.input}")
+        return 1
+
+    scales = [clamp_inference_scale(s) for s in args.scales.split(',') if s.strip()]
+    print(f"{len(frames)} frame, olçekler: {scales}")
+
+    results = {'frames': len(frames), 'inference_scale': benchmark_inference_scales(frames, scales, args.confidence)}
+    print_scale_report(results['inference_scale'])
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.json_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Trace replay
+--record-trace ile kaydedilmiş landmark izini kamera ve MediaPipe olmadan
+tekrar oynatir. Varsayilan olarak sadece GestureDetector (filtreler ve
+gesture mantiği) çaliştirilir; --full ile GestureControlSystem.process_frame
+kullanilir (eylemler --execute verilmedikçe işletim sistemine gonderilmez).
+Saat kayittaki frame zamanlaridir (FrameClock) - bekleme sureleri ve
+kalibrasyon oynatma hizindan bağimsiz, canli çalişmadaki gibi işler.
+Detektore kayittaki (21, 3) diziler verilir; --landmark-objects eski
+landmark nesnesi girdisiyle oynatir (frame başina sureyi karşilaştirmak için).
+
+Kullanim:
+    python benchmarks/trace_replay.py oturum.npz
+    python benchmarks/trace_replay.py oturum.npz --landmark-objects
+    python benchmarks/trace_replay.py oturum.npz --full --json sonuc.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+
+# src klasorunu path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.clock import FrameClock  # noqa: E402
+from utils.landmark_trace import LandmarkTrace, TraceReplayer  # noqa: E402
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'gesture_map.json')
+
+
+def build_target(full: bool, execute: bool, clock, config_path: str = CONFIG_PATH):
+    """Oynatma hedefi - GestureDetector ya da headless GestureControlSystem"""
+    if not full:
+        from core.gesture_detector import GestureDetector
+        return GestureDetector(config_path, clock=clock)
+
+    from main import GestureControlSystem
+    system = GestureControlSystem(config_path, settings_override={'headless': True, 'auto_calibrate': False},
+                                  clock=clock)
+    if not execute:
+        # Kuru çaliştirma - imleç/tiklama işletim sistemine gitmez
+        system.action_handler.is_disabled = True
+    return system
+
+
+def replay_trace(path: str, full: bool = False, execute: bool = False, quiet: bool = True,
+                 landmark_objects: bool = False):
+    """İzi oynat - (istatistikler, eylem sayilari)"""
+    trace = LandmarkTrace.load(path)
+    clock = FrameClock()
+    target = build_target(full, execute, clock)
+
+    # Detektorun gesture mesajlari olçumu bozmasin
+    output = io.StringIO() if quiet else sys.stdout
+    with contextlib.redirect_stdout(output):
+        stats = TraceReplayer(trace).replay(target, clock=clock, landmark_objects=landmark_objects)
+
+    stats['duration_s'] = trace.duration
+    return stats, stats.pop('action_counts')
+
+
+def parse_args():
+    """Komut satiri argumanlarini parse et"""
+    parser = argparse.ArgumentParser(description='HCI landmark trace replay')
+    parser.add_argument('trace', help='--record-trace ile kaydedilmiş .npz dosyasi')
+    parser.add_argument('--full', action='store_true',
+                        help='GestureControlSystem.process_frame uzerinden oynat (eylem mantiği dahil)')
+    parser.add_argument('--execute', action='store_true',
+                        help='--full ile eylemleri gerçekten çaliştir (imleç hareket eder)')
+    parser.add_argument('--landmark-objects', action='store_true',
+                        help='Detektore dizi yerine landmark nesneleri ver (eski girdi yolu)')
+    parser.add_argument('--verbose', action='store_true', help='Detektor çiktisini gizleme')
+    parser.add_argument('--json', dest='json_path', help='Sonuçlari JSON olarak bu dosyaya yaz')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if not os.path.exists(args.trace):
+        print(f"[X] Trace bulunamadi: {args.trace}")
+        return 1
+
+    stats, actions = replay_trace(args.trace, args.full, args.execute, quiet=not args.verbose,
+                                  landmark_objects=args.landmark_objects)
+    print(f"{stats['frames']} frame ({stats['hand_frames']} elli), kayit suresi {stats['duration_s']:.1f}s")
+    print(f"Oynatma: {stats['elapsed_s'] * 1000:.0f} ms, {stats['replay_fps']:.0f} fps "
+          f"(gerçek zamanin {stats['realtime_factor']:.0f}x), "
+          f"frame başina {stats['per_frame_us']:.1f} us")
+    for action, count in sorted(actions.items(), key=lambda item: -item[1]):
+        print(f"   {action}: {count}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'stats': stats, 'actions': actions}, f, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.json_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -21,6 +21,11 @@ export HCI_CONFIDENCE_MINIMUM="${HCI_CONFIDENCE_MINIMUM:-0.7}"
 export HCI_CLICK_COOLDOWN="${HCI_CLICK_COOLDOWN:-0.3}"
 export HCI_CAMERA_INDEX="${HCI_CAMERA_INDEX:-0}"
 export HCI_CAMERA_FPS="${HCI_CAMERA_FPS:-30}"
+export HCI_CAMERA_WIDTH="${HCI_CAMERA_WIDTH:-640}"
+export HCI_CAMERA_HEIGHT="${HCI_CAMERA_HEIGHT:-480}"
+export HCI_CAMERA_FOURCC="${HCI_CAMERA_FOURCC:-MJPG}"
+export HCI_INFERENCE_SCALE="${HCI_INFERENCE_SCALE:-1.0}"
+export HCI_IDLE_TIMEOUT="${HCI_IDLE_TIMEOUT:-5.0}"
 export HCI_SHOW_NOTIFICATIONS="${HCI_SHOW_NOTIFICATIONS:-true}"
 export HCI_LOG_LEVEL="${HCI_LOG_LEVEL:-INFO}"
 export HCI_DEBUG_MODE="${HCI_DEBUG_MODE:-false}"
@@ -30,7 +35,7 @@ echo "   Tutorial Mode: $HCI_TUTORIAL_MODE"
 echo "   Safe Mode: $HCI_SAFE_MODE"
 echo "   Auto Calibrate: $HCI_AUTO_CALIBRATE"
 echo "   Smoothing: $HCI_SMOOTHING_FACTOR"
-echo "   Camera: $HCI_CAMERA_INDEX @ ${HCI_CAMERA_FPS}fps"
+echo "   Camera: $HCI_CAMERA_INDEX @ ${HCI_CAMERA_FPS}fps (${HCI_CAMERA_WIDTH}x${HCI_CAMERA_HEIGHT} $HCI_CAMERA_FOURCC)"
 echo "   Confidence: $HCI_CONFIDENCE_MINIMUM"
 echo "   Log Level: $HCI_LOG_LEVEL"
 
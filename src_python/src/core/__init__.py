@@ -3,6 +3,21 @@ Core moduller - Ana gesture algilama ve eylem kontrolu
 """
 
 from .gesture_detector import GestureDetector
-from .action_handler import ActionHandler
+
+# ActionHandler pyautogui ister - ekransiz ortamda (CI, trace tekrar oynatma)
+# detektor yine de kullanilabilsin. Sadece kurulu olmama ve ekran yokluğu
+# hatalari yutulur: pyautogui X11'de import sirasinda Xlib DisplayError
+# (eski surumlerde DISPLAY için KeyError) firlatir.
+_DISPLAY_ERRORS = (ImportError, KeyError)
+try:
+    from Xlib.error import DisplayError
+    _DISPLAY_ERRORS += (DisplayError,)
+except ImportError:
+    pass
+
+try:
+    from .action_handler import ActionHandler
+except _DISPLAY_ERRORS:
+    ActionHandler = None
 
 __all__ = ['GestureDetector', 'ActionHandler']
@@ -1,13 +1,14 @@
 import pyautogui
 import subprocess
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
 
 
 class ActionHandler:
     """Geliştirilmiş gesture eylemlerini gerçekleştiren modul"""
 
-    def __init__(self):
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock  # Eylem araliklari bu saatle olçulur
         self.is_disabled = False
         self.cursor_frozen = False
         self.drag_mode = False
@@ -31,6 +32,12 @@ class ActionHandler:
         self.max_actions_per_second = 3
         self.recent_actions = []
 
+        # Yakalamadan eyleme gecikme (frame bağlami verildiğinde)
+        self.action_latency_sum = 0.0
+        self.action_latency_count = 0
+        self.cursor_latency_sum = 0.0
+        self.cursor_latency_count = 0
+
     def enable_safe_mode(self, enabled: bool = True):
         """Guvenli modu etkinleştir/devre dişi birak"""
         self.safe_mode = enabled
@@ -39,7 +46,7 @@ class ActionHandler:
 
     def _is_action_safe(self, action: str) -> bool:
         """Eylemin guvenli olup olmadiğini kontrol et"""
-        current_time = time.time()
+        current_time = self.clock()
 
         # Son 1 saniyedeki eylemleri temizle
         self.recent_actions = [t for t in self.recent_actions if current_time - t < 1.0]
@@ -68,7 +75,7 @@ class ActionHandler:
 
     def _record_action(self, action: str, success: bool):
         """Eylem geçmişini kaydet"""
-        current_time = time.time()
+        current_time = self.clock()
         self.last_action_time[action] = current_time
 
         if success:
@@ -83,8 +90,23 @@ class ActionHandler:
             if len(self.action_history) > 100:
                 self.action_history.pop(0)
 
-    def execute_action(self, gesture_data: Dict[str, Any], cursor_pos: tuple) -> bool:
-        """Algilanan gesture'a gore eylemi gerçekleştir - geliştirilmiş"""
+    def _latency_ms(self, context) -> Optional[float]:
+        """Frame yakalanmasindan bu yana geçen sure (ms) - bağlam yoksa None
+
+        Hizli dosya oynatmada medya zamani duvar saatinin onune geçebilir;
+        negatif değerler gecikme sayilmaz.
+        """
+        if context is None:
+            return None
+        latency = (self.clock() - context.capture_time) * 1000
+        return latency if latency >= 0 else None
+
+    def execute_action(self, gesture_data: Dict[str, Any], cursor_pos: tuple, context=None) -> bool:
+        """Algilanan gesture'a gore eylemi gerçekleştir - geliştirilmiş
+
+        context (utils.frame_context.FrameContext) verilirse başarili eylemin
+        yakalamadan itibaren gecikmesi istatistiklere eklenir.
+        """
         if self.is_disabled:
             return False
 
@@ -163,6 +185,11 @@ class ActionHandler:
         # Eylemi kaydet
         self._record_action(action, success)
 
+        latency = self._latency_ms(context) if success else None
+        if latency is not None:
+            self.action_latency_sum += latency
+            self.action_latency_count += 1
+
         if success and self.safe_mode:
             print(f"✓ Eylem gerçekleştirildi: {action} (guven: {confidence:.2f})")
 
@@ -331,7 +358,8 @@ class ActionHandler:
         print(f"🔒 İmleç {status}")
         return True
 
-    def move_cursor(self, x: float, y: float, pinch_active: bool = False, smoothing: float = 0.3) -> bool:
+    def move_cursor(self, x: float, y: float, pinch_active: bool = False, smoothing: float = 0.3,
+                    context=None) -> bool:
         """İmleci hareket ettir - SADECE pinch aktifken hareket eder"""
         if self.is_disabled or self.cursor_frozen:
             return False
@@ -375,6 +403,11 @@ class ActionHandler:
                 new_y = current_y + (new_y - current_y) * ratio
 
             pyautogui.moveTo(new_x, new_y, _pause=False)
+
+            latency = self._latency_ms(context)
+            if latency is not None:
+                self.cursor_latency_sum += latency
+                self.cursor_latency_count += 1
             return True
         except Exception as e:
             print(f"İmleç hareket hatasi: {e}")
@@ -392,10 +425,19 @@ class ActionHandler:
             'last_actions': self.action_history[-5:] if self.action_history else []
         }
 
+    def get_latency_stats(self) -> Dict[str, float]:
+        """Ortalama yakalama -> eylem / imleç hareketi gecikmesi (ms)"""
+        return {
+            'avg_action_latency_ms': (self.action_latency_sum / self.action_latency_count
+                                      if self.action_latency_count else 0.0),
+            'avg_cursor_latency_ms': (self.cursor_latency_sum / self.cursor_latency_count
+                                      if self.cursor_latency_count else 0.0)
+        }
+
     def get_stats(self) -> Dict[str, Any]:
         """İstatistikleri dondur"""
         if not self.action_history:
-            return {'total_actions': 0}
+            return {'total_actions': 0, **self.get_latency_stats()}
 
         action_counts = {}
         successful_actions = 0
@@ -411,7 +453,8 @@ class ActionHandler:
             'successful_actions': successful_actions,
             'success_rate': successful_actions / len(self.action_history) * 100,
             'action_breakdown': action_counts,
-            'recent_actions_per_minute': len(self.recent_actions) * 60
+            'recent_actions_per_minute': len(self.recent_actions) * 60,
+            **self.get_latency_stats()
         }
 
     def _start_drag_safe(self, cursor_pos: tuple) -> bool:
@@ -1,6 +1,6 @@
 import math
 import time
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, Callable, Optional
 import json
 
 # Import sorununu çozmek için absolute import kullan
@@ -10,20 +10,28 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 try:
     from utils.smoothing_filters import AutoCalibrator, SmartCursor
+    from utils.hand_features import HandFeatures, landmark_array
+    from core.gesture_rules import GestureRules, pose_from_finger_count, result_type
 except ImportError:
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+    sys.path.append(os.path.dirname(__file__))
     from smoothing_filters import AutoCalibrator, SmartCursor
+    from hand_features import HandFeatures, landmark_array
+    from gesture_rules import GestureRules, pose_from_finger_count, result_type
 
 
 class GestureDetector:
     """ULTRA OPTİMİZE GESTİCR DETECTOR - Akilli filtreleme ve otomatik kalibrasyon"""
 
-    def __init__(self, config_path: str = "config/gesture_map.json"):
+    def __init__(self, config_path: str = "config/gesture_map.json", clock: Callable[[], float] = time.time):
         self.config = self._load_config(config_path)
 
+        # Zaman kaynaği - bekleme sureleri, kalibrasyon ve filtreler ayni saati kullanir
+        self.clock = clock
+
         # Yeni akilli sistemler
-        self.auto_calibrator = AutoCalibrator()
-        self.smart_cursor = SmartCursor()
+        self.auto_calibrator = AutoCalibrator(clock=clock)
+        self.smart_cursor = SmartCursor(clock=clock)
 
         # Legacy compatibility
         self.hand_size = None
@@ -38,7 +46,18 @@ class GestureDetector:
         self.pinch_events = []  # [(time, three_finger_mode), ...]
         self.last_action_time = 0
         self.prev_hand_pose = None
-        self.last_win_time = 0
+
+        # gesture_map.json kurallari (poz geçişleri, hareket) - dosya değişince yeniden derlenir
+        self.rules = GestureRules(config_path, self.config, clock=clock)
+
+        # Son frame'in el ozellikleri - ayni frame_id için yeniden kullanilir
+        self.features: Optional[HandFeatures] = None
+
+        # Frame sonuç onbelleği - ayni frame_id ikinci kez işlenmez (durumlu boru hatti)
+        self.last_frame_id: Optional[int] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+        self.repeated_frames = 0
+        self.strict_frames = False  # Debug: ayni frame'in ikinci çağrisi AssertionError verir
 
         # Perfoormance tracking
         self.frame_count = 0
@@ -54,17 +73,20 @@ class GestureDetector:
         except FileNotFoundError:
             return {"settings": {"click_cooldown": 0.2}}
 
-    def calibrate_hand(self, landmarks) -> bool:
-        """Akilli otomatik kalibrasyon"""
+    def calibrate_hand(self, landmarks, timestamp: Optional[float] = None) -> bool:
+        """Akilli otomatik kalibrasyon (timestamp: frame yakalama zamani)
+
+        landmarks HandFeatures ise kalibrasyon frame'in hazir ozelliklerini okur.
+        """
         if self.is_calibrated:
             return True
 
         # Otomatik kalibrasyon başlatilmamişsa başlat
         if not self.auto_calibrator.is_calibrating:
-            self.auto_calibrator.start_calibration()
+            self.auto_calibrator.start_calibration(timestamp)
 
         # Kalibrasyon orneği ekle
-        calibration_complete = self.auto_calibrator.add_calibration_sample(landmarks)
+        calibration_complete = self.auto_calibrator.add_calibration_sample(landmarks, timestamp)
 
         if calibration_complete:
             # Kalibrasyon parametrelerini al
@@ -106,60 +128,99 @@ class GestureDetector:
         return x < 100 or x > 1820 or y < 100 or y > 980
 
     def _count_extended_fingers(self, landmarks) -> int:
-        """Uzatilmiş parmak sayisi"""
+        """Uzatilmiş parmak sayisi (landmarks: HandFeatures ya da landmark'lar)"""
         if not self.hand_size:
             return 0  # Kalibrasyon yapilmamiş
 
-        wrist = (landmarks[0].x, landmarks[0].y)
-        finger_tips = [
-            (landmarks[4].x, landmarks[4].y),   # Thumb
-            (landmarks[8].x, landmarks[8].y),   # Index
-            (landmarks[12].x, landmarks[12].y),  # Middle
-            (landmarks[16].x, landmarks[16].y),  # Ring
-            (landmarks[20].x, landmarks[20].y),  # Pinky
-        ]
+        tip_distances = HandFeatures.from_landmarks(landmarks).tip_distances
+        return sum(1 for distance in tip_distances if distance > self.hand_size * 0.6)
 
-        extended = 0
-        for tip in finger_tips:
-            if self._distance(wrist, tip) > self.hand_size * 0.6:
-                extended += 1
+    def hand_features(self, landmarks, row: Optional[Dict[str, Any]] = None, context=None) -> HandFeatures:
+        """Frame'in el ozellikleri - ayni frame_id için bir kez oluşturulur
 
-        return extended
+        Kalibrasyon, gesture algilama ve parmak sayimi ayni nesneyi paylaşir.
+        row: process_hands'in toplu hesapladiği satir.
+        """
+        if isinstance(landmarks, HandFeatures):
+            features = landmarks
+        else:
+            frame_id = None if context is None else context.frame_id
+            cached = self.features
+            if frame_id is not None and cached is not None and cached.frame_id == frame_id:
+                return cached
+            features = HandFeatures(landmark_array(landmarks), frame_id, row)
+        self.features = features
+        return features
+
+    def detect_gesture(self, landmarks, features: Optional[Dict[str, Any]] = None,
+                       context=None) -> Dict[str, Any]:
+        """YENİ AKILLI GESTURE SİSTEMİ - Titreme onleyici ve otomatik optimize
+
+        landmarks (21, 3) dizi, MediaPipe landmark listesi ya da HandFeatures
+        olabilir; liste bir kez diziye çevrilir. Frame'in ozellikleri
+        (hand_features) kalibrasyon ve parmak sayimiyla paylaşilir. features
+        verilirse (utils.hand_features.hand_feature_rows satiri) mesafeler
+        yeniden hesaplanmaz - tum eller tek geçişte hazirlanir.
+        context (utils.frame_context.FrameContext) verilirse zamanlama
+        (bekleme sureleri, filtre hizlari, kalibrasyon) işleme ani yerine
+        frame'in yakalama zamanina gore yapilir.
+
+        Algilama durumludur (Kalman filtresi, pinch durumu, kalibrasyon
+        sayaçlari, tiklama zamanlamasi). Ayni frame_id ile ikinci çağri
+        boru hattini yeniden çaliştirmaz, ilk sonucun kopyasini dondurur;
+        strict_frames açiksa bu çift işleme AssertionError verir.
+        """
+        frame_id = self._frame_id(landmarks, context)
+        if frame_id is not None and frame_id == self.last_frame_id:
+            assert not self.strict_frames, f"GestureDetector: frame {frame_id} ikinci kez işlendi"
+            self.repeated_frames += 1
+            return dict(self.last_result)
+
+        result = self._detect_gesture(landmarks, features, context)
+        if frame_id is not None:
+            # Çağiran sonucu değiştirebilir (ikincil el eylemi) - onbellekte ayri kopya
+            self.last_frame_id = frame_id
+            self.last_result = dict(result)
+        return result
 
-    def detect_gesture(self, landmarks) -> Dict[str, Any]:
-        """YENİ AKILLI GESTURE SİSTEMİ - Titreme onleyici ve otomatik optimize"""
+    @staticmethod
+    def _frame_id(landmarks, context=None) -> Optional[int]:
+        """Çağrinin frame kimliği - frame bağlami ya da HandFeatures'tan"""
+        if context is not None:
+            return context.frame_id
+        return landmarks.frame_id if isinstance(landmarks, HandFeatures) else None
 
+    def _detect_gesture(self, landmarks, features: Optional[Dict[str, Any]], context) -> Dict[str, Any]:
+        """Tek frame'in gesture algilamasi - detect_gesture onbelleğinin arkasinda"""
         self.frame_count += 1
+        current_time = self.clock() if context is None else context.capture_time
+        features = self.hand_features(landmarks, features, context)
 
         # Otomatik kalibrasyon (ilk 90 frame)
         if not self.is_calibrated:
             if self.auto_calibration_frames < 90:  # 3 saniye @ 30fps
                 self.auto_calibration_frames += 1
-                self.calibrate_hand(landmarks)
+                self.calibrate_hand(features, current_time)
                 return {'type': 'calibration', 'action': None, 'confidence': 0.0, 'pinch_active': False}
             else:
                 # Manuel kalibrasyon yap
-                self.calibrate_hand(landmarks)
-
-        current_time = time.time()
+                self.calibrate_hand(features, current_time)
 
         # Ham pozisyonlar
-        thumb = (landmarks[4].x, landmarks[4].y)
-        index = (landmarks[8].x, landmarks[8].y)
-        middle = (landmarks[12].x, landmarks[12].y)
+        thumb, index, middle = features.thumb, features.index, features.middle
 
         # Akilli cursor pozisyonu hesapla (titreme filtreli)
         cursor_pos = self.smart_cursor.process_movement(
-            index[0], index[1], 1920, 1080  # Varsayilan çozunurluk
+            index[0], index[1], 1920, 1080, current_time  # Varsayilan çozunurluk
         )
 
         # 1. PINCH DETECTION (dinamik eşik)
-        pinch_distance = self._distance(thumb, index)
+        pinch_distance = features.pinch_distance
         is_pinch = pinch_distance < self.pinch_threshold
 
         # 2. DRAG DETECTION (3 parmak birlikte)
-        middle_to_thumb = self._distance(middle, thumb)
-        middle_to_index = self._distance(middle, index)
+        middle_to_thumb = features.middle_to_thumb
+        middle_to_index = features.middle_to_index
         is_drag_grip = (middle_to_thumb < self.pinch_threshold * 1.3 and
                         middle_to_index < self.pinch_threshold * 1.3 and
                         is_pinch)
@@ -279,57 +340,28 @@ class GestureDetector:
                 })
                 self.last_action_time = current_time
 
-        # 5. WIN TUŞU + APP SEÇME SİSTEMİ - Win menusu aç ve fare imleci konumlandir
-        extended_fingers = self._count_extended_fingers(landmarks)
-        current_pose = "fist" if extended_fingers <= 1 else ("open" if extended_fingers >= 4 else "partial")
-
-        # Win tuşu mantiği
-        if (self.prev_hand_pose == "fist" and current_pose == "open" and
-                current_time - self.last_win_time > 1.0):
+        # 5. KURAL TABANLI GESTURE'LAR (gesture_map.json) - Win menusu, hareket kurallari
+        extended_fingers = self._count_extended_fingers(features)
+        current_pose = pose_from_finger_count(extended_fingers)
 
-            # İlk açilma = Win menusu aç ve fare imleci konumlandir
-            if not getattr(self, 'win_menu_open', False):
-                # Elin orta kismina gore fare imleci konumlandir
+        self.rules.maybe_reload(current_time)
+        rule = self.rules.evaluate(features, current_pose, current_time)
+        if rule is not None:
+            result.update({
+                'type': result_type(rule.action),
+                'action': rule.action,
+                'confidence': rule.confidence,
+                'stable': True,
+                'rule': rule.name
+            })
+            if rule.cursor == 'hand_center':
+                # Elin orta kismina gore fare imleci konumlandir (Win menusu)
                 hand_center_x = (thumb[0] + index[0] + middle[0]) / 3
                 hand_center_y = (thumb[1] + index[1] + middle[1]) / 3
-
-                # Win menusu için cursor pozisyonunu guncelle
-                win_cursor_pos = self.smart_cursor.process_movement(
-                    hand_center_x, hand_center_y, 1920, 1080
+                result['cursor_pos'] = self.smart_cursor.process_movement(
+                    hand_center_x, hand_center_y, 1920, 1080, current_time
                 )
-
-                result.update({
-                    'type': 'system',
-                    'action': 'win_key',
-                    'confidence': 0.9,
-                    'stable': True,
-                    'cursor_pos': win_cursor_pos  # Win menusunde imleç konumlandir
-                })
-                self.win_menu_open = True
-                self.win_open_time = current_time
-                print("WIN MENuSu açildi - fare imleci konumlandirildi")
-
-        elif (current_pose == "fist" and self.prev_hand_pose == "open" and
-              getattr(self, 'win_menu_open', False)):
-
-            # İkinci kapanma = Sol tiklama ile uygulama seç
-            if current_time - getattr(self, 'win_open_time', 0) > 0.5:
-                result.update({
-                    'type': 'click',
-                    'action': 'left_click',
-                    'confidence': 0.9,
-                    'stable': True
-                })
-
-                self.win_menu_open = False
-                self.last_win_time = current_time
-                print("SOL TIKLAMA - uygulama seçildi")
-
-        # Win menusu timeout (3 saniye)
-        if (getattr(self, 'win_menu_open', False) and
-                current_time - getattr(self, 'win_open_time', 0) > 3.0):
-            self.win_menu_open = False
-            print("Win menusu timeout")
+            print(f"Kural: {rule.name} -> {rule.action}")
 
         # State guncellemeleri
         self.prev_pinch = is_pinch
@@ -338,6 +370,10 @@ class GestureDetector:
 
         return result
 
+    def predict_cursor(self, context=None) -> Tuple[float, float]:
+        """Inference atlanan frame için tahmini cursor pozisyonu (Kalman tahmini)"""
+        return self.smart_cursor.predict_movement(1920, 1080, None if context is None else context.capture_time)
+
     def _select_app_by_position(self, hand_x: float) -> str:
         """El pozisyonuna gore uygulama seçimi"""
         # Ekrani 5 bolgeye ayir
@@ -380,7 +416,7 @@ class GestureDetector:
         self.auto_calibration_frames = 0
 
         # Akilli sistemleri sifirla
-        self.auto_calibrator = AutoCalibrator()
+        self.auto_calibrator = AutoCalibrator(clock=self.clock)
         self.smart_cursor.reset()
 
         print(" Akilli kalibrasyon sistemi sifirlandi")
@@ -391,5 +427,6 @@ class GestureDetector:
             'total_frames': self.frame_count,
             'auto_calibration_frames': self.auto_calibration_frames,
             'calibration_complete': self.is_calibrated,
+            'repeated_frames': self.repeated_frames,
             'cursor_filter_stats': self.smart_cursor.get_stats()
         }
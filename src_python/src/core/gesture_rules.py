@@ -0,0 +1,444 @@
+"""
+Bildirimsel gesture kurallari
+gesture_map.json'daki "gestures" tanimlari yukleme aninda derlenir ve
+doğrulanir: her kural girdilerini (poz, parmak ucu konumlari), eşiklerini
+ve kendi durum makinesini taşir. Frame başina sadece girdisi değişen ya da
+zamanlayicisi bekleyen kurallar değerlendirilir - yeni bir gesture eklemek
+kod değişikliği gerektirmez ve sadece kendi koşullarinin maliyetini ekler.
+
+Bolumler:
+- pose_based: poz geçişi (from -> to). "after" ile başka bir kuralin
+  ardindan gelen zincir kurulur (min_delay/max_delay), "cooldown" ayni
+  kuralin tekrarini sinirlar, "cursor": "hand_center" imleci el merkezine
+  konumlandirir.
+- movement_based: parmak ucunun (bilege gore) movement_threshold'dan fazla
+  yer değiştirip min_duration boyunca oyle kalmasi (index_movement,
+  thumb_movement, both_movement).
+- disabled: sadece belge amaçli, derlenmez.
+
+Kurallar "enabled": false ile kapatilabilir. Doğrulama imkansiz kurallari
+(bilinmeyen eylem/poz, ayni poza geçiş, eşik ya da guven araliği dişi,
+olmayan ya da dongusel "after") RuleError ile reddeder. GestureRules dosyayi
+izler; değişince yeniden derler, hatali dosyada eski kurallarla devam eder.
+"""
+
+import json
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+POSES = ('fist', 'partial', 'open_palm')
+
+# ActionHandler.execute_action'in tanidiği eylemler
+ACTIONS = (
+    'left_click', 'right_click', 'drag', 'drag_start', 'drag_move', 'drag_end', 'open_app',
+    'scroll_up', 'scroll_down', 'navigate_back', 'navigate_forward', 'zoom_in', 'zoom_out',
+    'show_applications', 'win_key', 'show_desktop', 'workspace_left', 'workspace_right',
+    'toggle_mode', 'freeze_cursor'
+)
+
+MOVEMENT_INPUTS = {
+    'index_movement': ('index',),
+    'thumb_movement': ('thumb',),
+    'both_movement': ('index', 'thumb'),
+}
+SECTIONS = ('movement_based', 'pose_based', 'disabled')
+CURSOR_MODES = ('hand_center',)
+
+# Surekli girdilerde bu kadar altindaki değişim "değişmedi" sayilir (normalize koordinat)
+INPUT_EPSILON = 1e-4
+
+# gesture_map.json'da "gestures" yoksa - detektorun onceki sabit Win menusu davranişi
+DEFAULT_GESTURES = {
+    'pose_based': {
+        'fist_to_open': {
+            'action': 'win_key', 'type': 'pose_transition', 'from': 'fist', 'to': 'open_palm',
+            'cooldown': 1.0, 'cursor': 'hand_center', 'confidence': 0.9
+        },
+        'open_to_fist_select': {
+            'action': 'left_click', 'type': 'pose_transition', 'from': 'open_palm', 'to': 'fist',
+            'after': 'fist_to_open', 'min_delay': 0.5, 'max_delay': 3.0, 'confidence': 0.9
+        }
+    }
+}
+
+
+class RuleError(ValueError):
+    """Geçersiz gesture kurallari - errors tum sorunlari listeler"""
+
+    def __init__(self, errors: List[str]):
+        self.errors = list(errors)
+        super().__init__('; '.join(self.errors))
+
+
+def pose_from_finger_count(extended_fingers: int) -> str:
+    """Uzatilmiş parmak sayisindan poz"""
+    if extended_fingers <= 1:
+        return 'fist'
+    return 'open_palm' if extended_fingers >= 4 else 'partial'
+
+
+def result_type(action: str) -> str:
+    """detect_gesture sonucundaki 'type' alani"""
+    if action in ('left_click', 'right_click'):
+        return 'click'
+    if action.startswith('drag'):
+        return 'drag'
+    return 'system'
+
+
+def _relative(point: Tuple[float, float], origin: Tuple[float, float]) -> Tuple[float, float]:
+    return (point[0] - origin[0], point[1] - origin[1])
+
+
+# Girdi adi -> (HandFeatures, poz) ile hesaplama - sadece bir kuralin ihtiyaci varsa çağrilir
+INPUT_EXTRACTORS: Dict[str, Callable[[Any, str], Any]] = {
+    'pose': lambda features, pose: pose,
+    'index': lambda features, pose: _relative(features.index, features.wrist),
+    'thumb': lambda features, pose: _relative(features.thumb, features.wrist),
+}
+
+
+def _changed(old, new) -> bool:
+    if old is None or isinstance(new, str):
+        return old != new
+    return any(abs(a - b) > INPUT_EPSILON for a, b in zip(old, new))
+
+
+class Rule(ABC):
+    """Derlenmiş kural - girdiler, eşikler ve durum"""
+
+    __slots__ = ('name', 'action', 'confidence', 'inputs', 'cursor')
+
+    def __init__(self, name: str, action: str, confidence: float, inputs: Tuple[str, ...],
+                 cursor: Optional[str] = None):
+        self.name = name
+        self.action = action
+        self.confidence = confidence
+        self.inputs = inputs
+        self.cursor = cursor
+
+    @property
+    def waiting(self) -> bool:
+        """Girdi değişmese de değerlendirilmeli mi (zamanlayici bekliyor)"""
+        return False
+
+    @abstractmethod
+    def evaluate(self, values: Dict[str, Any], previous: Dict[str, Any], now: float) -> bool:
+        """Kural bu frame'de tetiklendi mi"""
+
+    def reset(self):
+        pass
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r} -> {self.action})"
+
+
+class PoseTransitionRule(Rule):
+    """Poz geçişi - isteğe bağli olarak başka bir kuralin ardindan (zincir)"""
+
+    __slots__ = ('from_pose', 'to_pose', 'cooldown', 'leader', 'min_delay', 'max_delay',
+                 'window', 'fired_at', 'consumed', 'last_end')
+
+    def __init__(self, name: str, action: str, confidence: float, from_pose: str, to_pose: str,
+                 cooldown: float = 0.0, min_delay: float = 0.0, max_delay: float = math.inf,
+                 cursor: Optional[str] = None):
+        super().__init__(name, action, confidence, ('pose',), cursor)
+        self.from_pose = from_pose
+        self.to_pose = to_pose
+        self.cooldown = cooldown
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.leader: Optional['PoseTransitionRule'] = None
+        self.window = 0.0  # Takipçilerin bekleyebileceği en uzun sure
+        self.reset()
+
+    def reset(self):
+        self.fired_at: Optional[float] = None
+        self.consumed = False
+        self.last_end = 0.0
+
+    def active(self, now: float) -> bool:
+        """Tetiklendi ve zinciri henuz tamamlanmadi/zaman aşimina uğramadi"""
+        return self.fired_at is not None and not self.consumed and now - self.fired_at <= self.window
+
+    def evaluate(self, values: Dict[str, Any], previous: Dict[str, Any], now: float) -> bool:
+        if previous.get('pose') != self.from_pose or values['pose'] != self.to_pose:
+            return False
+
+        leader = self.leader
+        if leader is not None:
+            if not leader.active(now) or now - leader.fired_at <= self.min_delay:
+                return False
+            leader.consumed = True
+            leader.last_end = now
+        elif self.active(now) or now - self.last_end <= self.cooldown:
+            return False
+
+        self.fired_at = now
+        self.consumed = False
+        self.last_end = now
+        return True
+
+
+class MovementRule(Rule):
+    """Parmak ucu (bilege gore) eşikten fazla yer değiştirip min_duration boyunca kalirsa"""
+
+    __slots__ = ('threshold', 'min_duration', 'rest', 'moving_since', 'fired')
+
+    def __init__(self, name: str, action: str, confidence: float, inputs: Tuple[str, ...],
+                 threshold: float, min_duration: float):
+        super().__init__(name, action, confidence, inputs)
+        self.threshold = threshold
+        self.min_duration = min_duration
+        self.reset()
+
+    def reset(self):
+        self.rest: Optional[Dict[str, Tuple[float, float]]] = None
+        self.moving_since: Optional[float] = None
+        self.fired = False
+
+    @property
+    def waiting(self) -> bool:
+        return self.moving_since is not None and not self.fired
+
+    def evaluate(self, values: Dict[str, Any], previous: Dict[str, Any], now: float) -> bool:
+        if self.rest is None:
+            self.rest = {name: values[name] for name in self.inputs}
+            return False
+
+        displaced = all(math.hypot(*_relative(values[name], self.rest[name])) > self.threshold
+                        for name in self.inputs)
+        if not displaced:
+            # Dinlenme konumu guncellenir, kural yeniden kurulur
+            self.rest = {name: values[name] for name in self.inputs}
+            self.moving_since = None
+            self.fired = False
+            return False
+
+        if self.moving_since is None:
+            self.moving_since = now
+        if not self.fired and now - self.moving_since >= self.min_duration:
+            self.fired = True
+            return True
+        return False
+
+
+class GestureRuleSet:
+    """Derlenmiş kurallar - frame başina sadece girdisi değişen kurallari değerlendirir"""
+
+    def __init__(self, rules: Iterable[Rule], disabled: Iterable[str] = ()):
+        self.rules = list(rules)
+        self.disabled = list(disabled)
+        # Sadece kurallarin kullandiği girdiler hesaplanir
+        self.inputs = tuple(dict.fromkeys(name for rule in self.rules for name in rule.inputs))
+        self.last: Dict[str, Any] = {}
+        self.evaluations = 0
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def get(self, name: str) -> Optional[Rule]:
+        return next((rule for rule in self.rules if rule.name == name), None)
+
+    def evaluate(self, features, pose: str, now: float) -> Optional[Rule]:
+        """Frame'i işle - tetiklenen ilk kural (tanim sirasiyla) ya da None"""
+        if not self.rules:
+            return None
+
+        values = {name: INPUT_EXTRACTORS[name](features, pose) for name in self.inputs}
+        changed = {name for name in self.inputs if _changed(self.last.get(name), values[name])}
+        previous, self.last = self.last, values
+
+        fired = None
+        for rule in self.rules:
+            if not rule.waiting and changed.isdisjoint(rule.inputs):
+                continue
+            self.evaluations += 1
+            if rule.evaluate(values, previous, now) and fired is None:
+                fired = rule
+        return fired
+
+    def reset(self):
+        self.last = {}
+        for rule in self.rules:
+            rule.reset()
+
+
+def _number(spec: Dict[str, Any], key: str, errors: List[str], where: str, default: Optional[float] = None,
+            minimum: float = 0.0, maximum: float = math.inf, inclusive_min: bool = True) -> float:
+    """Sayisal alan - yoksa default, aralik dişiysa hata"""
+    value = spec.get(key, default)
+    if value is None:
+        errors.append(f"{where}: '{key}' gerekli")
+        return 0.0
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        errors.append(f"{where}: '{key}' sayi olmali")
+        return 0.0
+    if value < minimum or (value == minimum and not inclusive_min) or value > maximum:
+        errors.append(f"{where}: '{key}' = {value} geçersiz araliktadir")
+    return float(value)
+
+
+def compile_rules(gestures: Optional[Dict[str, Any]], confidence_minimum: float = 0.8) -> GestureRuleSet:
+    """gesture_map.json "gestures" bolumunu doğrula ve derle
+
+    Guveni confidence_minimum altindaki kural hiç çaliştirilmeyeceğinden
+    reddedilir. Hatalarin tumu tek RuleError'da toplanir.
+    """
+    if gestures is None:
+        gestures = DEFAULT_GESTURES
+    errors: List[str] = []
+    if not isinstance(gestures, dict):
+        raise RuleError(["'gestures' bir nesne olmali"])
+
+    for section in gestures:
+        if section not in SECTIONS:
+            errors.append(f"Bilinmeyen bolum: {section} (seçenekler: {', '.join(SECTIONS)})")
+
+    rules: List[Rule] = []
+    specs: Dict[str, Dict[str, Any]] = {}
+    for section in ('movement_based', 'pose_based'):
+        for name, spec in (gestures.get(section) or {}).items():
+            where = f"{section}.{name}"
+            if not isinstance(spec, dict):
+                errors.append(f"{where}: kural bir nesne olmali")
+                continue
+            if name in specs:
+                errors.append(f"{where}: ayni isimde kural zaten var")
+                continue
+            specs[name] = spec
+            if not spec.get('enabled', True):
+                continue
+
+            action = spec.get('action')
+            if action not in ACTIONS:
+                errors.append(f"{where}: bilinmeyen eylem {action!r}")
+            confidence = _number(spec, 'confidence', errors, where, maximum=1.0)
+            if confidence < confidence_minimum:
+                errors.append(f"{where}: guven {confidence} < {confidence_minimum} - eylem hiç çaliştirilmez")
+
+            rule_type = spec.get('type')
+            if section == 'movement_based':
+                if rule_type not in MOVEMENT_INPUTS:
+                    errors.append(f"{where}: bilinmeyen hareket tipi {rule_type!r}")
+                    continue
+                threshold = _number(spec, 'movement_threshold', errors, where, maximum=1.0, inclusive_min=False)
+                min_duration = _number(spec, 'min_duration', errors, where, default=0.0)
+                rules.append(MovementRule(name, action, confidence, MOVEMENT_INPUTS[rule_type],
+                                          threshold, min_duration))
+                continue
+
+            if rule_type != 'pose_transition':
+                errors.append(f"{where}: bilinmeyen poz kurali tipi {rule_type!r}")
+                continue
+            from_pose, to_pose = spec.get('from'), spec.get('to')
+            for key, pose in (('from', from_pose), ('to', to_pose)):
+                if pose not in POSES:
+                    errors.append(f"{where}: bilinmeyen poz {key}={pose!r} (seçenekler: {', '.join(POSES)})")
+            if from_pose == to_pose:
+                errors.append(f"{where}: ayni poza geçiş hiç gerçekleşmez ({from_pose})")
+            cursor = spec.get('cursor')
+            if cursor is not None and cursor not in CURSOR_MODES:
+                errors.append(f"{where}: bilinmeyen imleç modu {cursor!r}")
+
+            min_delay = _number(spec, 'min_delay', errors, where, default=0.0)
+            max_delay = _number(spec, 'max_delay', errors, where, default=math.inf)
+            if max_delay <= min_delay:
+                errors.append(f"{where}: max_delay ({max_delay}) min_delay'den ({min_delay}) buyuk olmali")
+            rules.append(PoseTransitionRule(
+                name, action, confidence, from_pose, to_pose,
+                cooldown=_number(spec, 'cooldown', errors, where, default=0.0),
+                min_delay=min_delay, max_delay=max_delay, cursor=cursor))
+
+    # Zincirler: "after" mevcut, açik bir poz kuralini gostermeli ve dongu olmamali
+    by_name = {rule.name: rule for rule in rules}
+    for rule in rules:
+        leader_name = specs[rule.name].get('after')
+        if leader_name is None:
+            continue
+        leader = by_name.get(leader_name)
+        if not isinstance(rule, PoseTransitionRule) or not isinstance(leader, PoseTransitionRule):
+            errors.append(f"{rule.name}: 'after' açik bir poz kuralini gostermeli ({leader_name!r})")
+            continue
+        rule.leader = leader
+        leader.window = max(leader.window, rule.max_delay)
+
+    for rule in rules:
+        seen = set()
+        current = rule
+        while isinstance(current, PoseTransitionRule) and current.leader is not None:
+            if current.name in seen:
+                errors.append(f"{rule.name}: 'after' zinciri dongusel")
+                break
+            seen.add(current.name)
+            current = current.leader
+
+    if errors:
+        raise RuleError(errors)
+    return GestureRuleSet(rules, disabled=(gestures.get('disabled') or {}).keys())
+
+
+def _confidence_minimum(config: Dict[str, Any]) -> float:
+    return config.get('settings', {}).get('thresholds', {}).get('confidence_minimum', 0.8)
+
+
+class GestureRules:
+    """Dosyadan derlenmiş kurallar - dosya değişince yeniden derlenir (hot reload)
+
+    maybe_reload() en fazla check_interval saniyede bir dosyanin değişme
+    zamanina bakar. Yeni dosya geçersizse (JSON ya da kural hatasi) uyari
+    verilir ve eski kurallar kullanilmaya devam eder. Yeniden derlemede
+    kural durumlari (zincirler, hareket zamanlayicilari) sifirlanir.
+    """
+
+    def __init__(self, path: Optional[str] = None, config: Optional[Dict[str, Any]] = None,
+                 clock: Callable[[], float] = time.time, check_interval: float = 1.0):
+        self.path = path
+        self.clock = clock
+        self.check_interval = check_interval
+        self.reloads = 0
+
+        self._mtime = self._stat()
+        self._last_check = clock()
+        if config is None:
+            config = self._read() if self._mtime is not None else {}
+        self.rules = compile_rules(config.get('gestures'), _confidence_minimum(config))
+
+    def _stat(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime if self.path else None
+        except OSError:
+            return None
+
+    def _read(self) -> Dict[str, Any]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def maybe_reload(self, now: Optional[float] = None) -> bool:
+        """Dosya değiştiyse yeniden derle - yeni kurallar yuklendiyse True"""
+        now = self.clock() if now is None else now
+        if now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+
+        mtime = self._stat()
+        if mtime is None or mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        try:
+            config = self._read()
+            rules = compile_rules(config.get('gestures'), _confidence_minimum(config))
+        except (OSError, ValueError) as e:  # json.JSONDecodeError ve RuleError ValueError'dir
+            print(f"[X] Gesture kurallari yuklenemedi, eski kurallar kullaniliyor: {e}")
+            return False
+
+        self.rules = rules
+        self.reloads += 1
+        print(f"[✓] Gesture kurallari yeniden yuklendi: {len(rules)} kural")
+        return True
+
+    def evaluate(self, features, pose: str, now: float) -> Optional[Rule]:
+        return self.rules.evaluate(features, pose, now)
@@ -1,18 +1,44 @@
 import cv2
-import mediapipe as mp
 import pyautogui
 import time
 import math
 import json
 import os
 import argparse
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Callable, List
 
 from core.gesture_detector import GestureDetector
 from core.action_handler import ActionHandler
-
-mp_hands = mp.solutions.hands  # type: ignore
-mp_drawing = mp.solutions.drawing_utils  # type: ignore
+from utils.frame_grabber import LatestFrameGrabber
+from utils.pipeline import FramePipeline, BACKPRESSURE_POLICIES
+from utils.capture_profile import build_capture_candidates, negotiate_capture_profile, read_capture_profile
+from utils.frame_source import FrameSource, open_frame_source, PACING_MODES, PACING_REALTIME
+from utils.hand_roi import HandROITracker
+from utils.image_ops import (clamp_inference_scale, resize_for_inference, mirror_landmarks,
+                             mirror_in_place, to_rgb, FramePool)
+from utils.frame_scheduler import FrameScheduler, frame_budget_ms
+from utils.overlay import OverlayRenderer
+from utils.idle_controller import IdleController
+from utils.motion_gate import MotionGate, GATE_INFER
+from utils.landmark_trace import TraceRecorder
+from utils.inference_worker import InferenceWorker
+from utils.hand_backends import (create_hand_backend, BACKEND_SOLUTIONS, BACKEND_TASKS, HAND_BACKENDS,
+                                 DEFAULT_MODEL_PATH, DELEGATES)
+from utils.multi_camera import CameraScheduler, parse_sources
+from utils.hand_features import (compute_hand_features, hand_feature_rows, hand_keys, hands_to_array,
+                                 landmark_array, INDEX_TIP)
+from utils.latency_probe import LatencyProbe, FlashTest, format_report
+
+# MediaPipe sadece canli algilama için gerekli - trace tekrar oynatma onsuz çalişir
+try:
+    import mediapipe as mp
+    mp_hands = mp.solutions.hands  # type: ignore
+    mp_drawing = mp.solutions.drawing_utils  # type: ignore
+except ImportError:
+    mp = None
+    mp_hands = None
+    mp_drawing = None
 
 try:
     SCREEN_W, SCREEN_H = pyautogui.size()
@@ -20,16 +46,25 @@ except Exception as e:
     SCREEN_W, SCREEN_H = 0, 0
     print(f"[WARN] pyautogui.size() failed: {e}")
 
+# İmleci taşiyan eylemler - çoklu elde sadece birincil elden kabul edilir
+CURSOR_ACTIONS = ('drag', 'drag_start', 'drag_move')
+
 
 class GestureControlSystem:
     """Ana gesture kontrol sistemi"""
 
-    def __init__(self, config_path: str = "config/gesture_map.json", settings_override: Optional[Dict] = None):
+    def __init__(self, config_path: str = "config/gesture_map.json", settings_override: Optional[Dict] = None,
+                 clock: Callable[[], float] = time.time, action_handler: Optional[ActionHandler] = None):
         # Environment variables'dan ayarları al (oncelik: env vars > settings_override > config file > defaults)
         self.settings = self._load_settings_from_env(settings_override)
 
-        self.detector = GestureDetector(config_path)
-        self.action_handler = ActionHandler()
+        # Zaman kaynaği - tekrar oynatmada frame zamani (utils.clock.FrameClock)
+        self.clock = clock
+
+        # Detektor (ve filtre durumu) her sisteme ozel; çoklu kamerada eylem yoneticisi paylaşilir
+        self.config_path = config_path
+        self.detector = GestureDetector(config_path, clock=clock)
+        self.action_handler = action_handler if action_handler is not None else ActionHandler(clock=clock)
 
         # Config dosyasini da yukle (eski uyumluluk için)
         self.config = self._load_config(config_path)
@@ -39,6 +74,10 @@ class GestureControlSystem:
         self.prev_cursor_y = 0.0
         self.last_gesture_time = 0.0
 
+        # Son algilanan el - inference atlanan frame'lerde yeniden kullanilir
+        self.last_landmarks = None
+        self.last_gesture_info: Dict[str, Any] = {}
+
         # Ayarlari yukle - environment'dan gelen ayarlari kullan
         self.smoothing = self.settings.get('smoothing_factor', 0.3)
         self.sensitivity = self.settings.get('sensitivity', {})
@@ -49,6 +88,13 @@ class GestureControlSystem:
         self.tutorial_mode = self.settings.get('tutorial_mode', False)
         self.debug_mode = self.settings.get('debug_mode', False)
 
+        # Headless: onizleme yok, overlay çizimi tamamen atlanir
+        self.headless = self.settings.get('headless', False)
+        self.renderer: Optional[OverlayRenderer] = None
+        if not self.headless:
+            self.renderer = OverlayRenderer(self, mp_drawing, mp_hands.HAND_CONNECTIONS if mp_hands else None,
+                                            (SCREEN_W, SCREEN_H))
+
         # Guvenlik ayarlari
         self.safe_mode = self.settings.get('safe_mode', True)
         self.auto_calibrate = self.settings.get('auto_calibrate', True)
@@ -56,6 +102,97 @@ class GestureControlSystem:
         # Kamera ayarlari
         self.camera_index = self.settings.get('camera_index', 0)
         self.camera_fps = self.settings.get('camera_fps', 30)
+        self.capture_profile: Optional[Dict] = None  # configure_capture() sonrasi surucunun verdiği profil
+
+        # Frame kaynaği - bos ise kamera, aksi halde video dosyasi / goruntu klasoru
+        self.source = self.settings.get('source')
+        self.source_pacing = self.settings.get('source_pacing', PACING_REALTIME)
+        if self.source_pacing not in PACING_MODES:
+            print(f"Geçersiz kaynak hizi: {self.source_pacing} - {PACING_REALTIME} kullaniliyor")
+            self.source_pacing = PACING_REALTIME
+        self.source_loop = self.settings.get('source_loop', False)
+
+        # Çoklu kamera - birden fazla kaynak verilirse servis hepsini tek inference thread'inde işler
+        self.sources = parse_sources(self.settings.get('sources'))
+        self.multi_camera_poll_interval = self.settings.get('multi_camera_poll_interval', 0.5)
+        # Hiçbir kamera el gormezken toplam inference hizi (tum kameralar için tek kamera kadar)
+        self.multi_camera_idle_fps = self.settings.get('multi_camera_idle_fps', 30.0)
+
+        # Landmark izi kaydi - dolu ise oturum sonunda bu dosyaya yazilir
+        self.record_trace = self.settings.get('record_trace')
+        if self.record_trace and len(self.sources) > 1:
+            # Bir iz dosyasi tek bir kamera akişi tutar
+            print("Landmark kaydi çoklu kamerada desteklenmiyor - kapatildi")
+            self.record_trace = None
+
+        # Gecikme olçum modu - frame başina yakalama/inference/gesture/pyautogui damgalari.
+        # Flaş testi onizleme gerektirir ve olçum modunu da açar.
+        self.latency_flash_test = self.settings.get('latency_flash_test', False) and not self.headless
+        if self.settings.get('latency_flash_test') and self.headless:
+            print("Flaş testi headless modda kullanilamaz - kapatildi")
+        self.latency_report = self.settings.get('latency_report')
+        self.latency_probe: Optional[LatencyProbe] = None
+        if self.settings.get('latency_probe') or self.latency_flash_test or self.latency_report:
+            self.latency_probe = LatencyProbe()
+
+        # Pipeline ayarlari (aşamalar arasi kuyruk boyutu ve backpressure politikasi)
+        self.pipeline_queue_size = self.settings.get('pipeline_queue_size', 2)
+        self.pipeline_backpressure = self.settings.get('pipeline_backpressure', 'drop_oldest')
+        if self.pipeline_backpressure not in BACKPRESSURE_POLICIES:
+            print(f"Geçersiz backpressure politikasi: {self.pipeline_backpressure} - drop_oldest kullaniliyor")
+            self.pipeline_backpressure = 'drop_oldest'
+
+        # El bolgesi takibi - inference son el konumu etrafindaki kirpilmiş bolgede
+        self.roi_tracking = self.settings.get('roi_tracking', False)
+        self.roi_margin = self.settings.get('roi_margin', 0.3)
+
+        # Aynalama: False -> goruntu cv2.flip ile çevrilir, True -> sadece landmark x'leri
+        # aynalanir (goruntu çevrilmez, onizleme varsa sadece o aynalanir)
+        self.mirror_landmarks = self.settings.get('mirror_landmarks', False)
+
+        # Çoklu el - her el (handedness) kendi detektor durumuyla işlenir, imleci birincil el surer
+        self.max_num_hands = max(1, int(self.settings.get('max_num_hands', 1)))
+        self.hand_detectors: Dict[str, GestureDetector] = {}
+        self.primary_hand: Optional[str] = None
+
+        # Detektor/eylem durumu kilidi - eylem aşamasi (pipeline thread'i) ile klavye
+        # komutlari (ana thread) ayni anda durumu değiştirmesin
+        self.state_lock = threading.RLock()
+
+        # Ayri süreçte inference - frame'ler paylaşimli bellekle worker'a gider
+        self.inference_worker = self.settings.get('inference_worker', False)
+
+        # El algilama arka ucu - solutions (senkron) ya da tasks (HandLandmarker, async LIVE_STREAM)
+        self.hand_backend = self.settings.get('hand_backend', BACKEND_SOLUTIONS)
+        if self.hand_backend not in HAND_BACKENDS:
+            print(f"Geçersiz el arka ucu: {self.hand_backend} - {BACKEND_SOLUTIONS} kullaniliyor")
+            self.hand_backend = BACKEND_SOLUTIONS
+        self.hand_model_path = self.settings.get('hand_model_path', DEFAULT_MODEL_PATH)
+        self.hand_delegate = self.settings.get('hand_delegate', 'cpu')
+        if self.hand_delegate not in DELEGATES:
+            print(f"Geçersiz delegate: {self.hand_delegate} - cpu kullaniliyor")
+            self.hand_delegate = 'cpu'
+
+        # Inference çozunurluğu - RGB frame hands.process oncesi bu olçekte kuçultulur
+        self.inference_scale = clamp_inference_scale(self.settings.get('inference_scale', 1.0))
+
+        # Boşta guç modu - idle_timeout saniye el yoksa duşuk hiz ve çozunurluk
+        self.idle_timeout = self.settings.get('idle_timeout', 5.0)
+        self.idle_fps = self.settings.get('idle_fps', 5)
+        self.idle_inference_scale = clamp_inference_scale(self.settings.get('idle_inference_scale', 0.5))
+
+        # Hareket kapisi - durağan sahnede inference atlanir / son landmark'lar kullanilir
+        self.motion_gate = self.settings.get('motion_gate', False)
+        self.motion_threshold = self.settings.get('motion_threshold', 2.5)
+        self.motion_hand_threshold = self.settings.get('motion_hand_threshold', 1.5)
+
+        # Performans butçesi (config settings.performance, ayarlar/env ile ezilebilir)
+        # max_processing_time_ms verilmezse butçe target_fps'in frame suresidir
+        performance = self.config.get('settings', {}).get('performance', {})
+        self.target_fps = performance.get('target_fps', 30)
+        self.max_processing_time_ms = self.settings.get('max_processing_time_ms', frame_budget_ms(performance))
+        self.skip_frames_on_lag = self.settings.get(
+            'skip_frames_on_lag', performance.get('skip_frames_on_lag', True))
 
         # Hassasiyet ayarlari
         self.pinch_threshold = self.settings.get('pinch_threshold', 0.05)
@@ -85,14 +222,49 @@ class GestureControlSystem:
             'click_cooldown': 0.3,
             'camera_index': 0,
             'camera_fps': 30,
+            'camera_width': 640,
+            'camera_height': 480,
+            'camera_fourcc': 'MJPG',
+            'source': None,
+            'source_pacing': PACING_REALTIME,
+            'source_loop': False,
+            'record_trace': None,
+            'latency_probe': False,
+            'latency_flash_test': False,
+            'latency_report': None,
+            'sources': None,
+            'multi_camera_poll_interval': 0.5,
+            'multi_camera_idle_fps': 30.0,
+            'pipeline_queue_size': 2,
+            'pipeline_backpressure': 'drop_oldest',
+            'roi_tracking': False,
+            'roi_margin': 0.3,
+            'inference_scale': 1.0,
+            'inference_worker': False,
+            'max_num_hands': 1,
+            'hand_backend': BACKEND_SOLUTIONS,
+            'hand_model_path': DEFAULT_MODEL_PATH,
+            'hand_delegate': 'cpu',
+            'mirror_landmarks': False,
+            'idle_timeout': 5.0,
+            'idle_fps': 5,
+            'idle_inference_scale': 0.5,
+            'motion_gate': False,
+            'motion_threshold': 2.5,
+            'motion_hand_threshold': 1.5,
             'max_actions_per_second': 3,
             'screen_edge_margin': 50,
             'show_notifications': True,
             'log_level': 'INFO',
             'debug_mode': False,
+            'headless': False,
             'sensitivity': {'movement': 1.0, 'pinch_detection': 1.0}
         }
 
+        # Komut satiri / çağiran taraf ayarlari varsayilanlarin uzerine yazilir
+        if settings_override:
+            defaults.update(settings_override)
+
         # Environment variables'i kontrol et
         env_mappings = {
             'HCI_TUTORIAL_MODE': ('tutorial_mode', bool),
@@ -104,11 +276,44 @@ class GestureControlSystem:
             'HCI_CLICK_COOLDOWN': ('click_cooldown', float),
             'HCI_CAMERA_INDEX': ('camera_index', int),
             'HCI_CAMERA_FPS': ('camera_fps', int),
+            'HCI_CAMERA_WIDTH': ('camera_width', int),
+            'HCI_CAMERA_HEIGHT': ('camera_height', int),
+            'HCI_CAMERA_FOURCC': ('camera_fourcc', str),
+            'HCI_SOURCE': ('source', str),
+            'HCI_SOURCE_PACING': ('source_pacing', str),
+            'HCI_SOURCE_LOOP': ('source_loop', bool),
+            'HCI_RECORD_TRACE': ('record_trace', str),
+            'HCI_LATENCY_PROBE': ('latency_probe', bool),
+            'HCI_LATENCY_FLASH_TEST': ('latency_flash_test', bool),
+            'HCI_LATENCY_REPORT': ('latency_report', str),
+            'HCI_SOURCES': ('sources', str),
+            'HCI_MULTI_CAMERA_POLL_INTERVAL': ('multi_camera_poll_interval', float),
+            'HCI_MULTI_CAMERA_IDLE_FPS': ('multi_camera_idle_fps', float),
+            'HCI_PIPELINE_QUEUE_SIZE': ('pipeline_queue_size', int),
+            'HCI_PIPELINE_BACKPRESSURE': ('pipeline_backpressure', str),
+            'HCI_ROI_TRACKING': ('roi_tracking', bool),
+            'HCI_ROI_MARGIN': ('roi_margin', float),
+            'HCI_INFERENCE_SCALE': ('inference_scale', float),
+            'HCI_INFERENCE_WORKER': ('inference_worker', bool),
+            'HCI_MAX_NUM_HANDS': ('max_num_hands', int),
+            'HCI_HAND_BACKEND': ('hand_backend', str),
+            'HCI_HAND_MODEL': ('hand_model_path', str),
+            'HCI_HAND_DELEGATE': ('hand_delegate', str),
+            'HCI_MIRROR_LANDMARKS': ('mirror_landmarks', bool),
+            'HCI_IDLE_TIMEOUT': ('idle_timeout', float),
+            'HCI_IDLE_FPS': ('idle_fps', float),
+            'HCI_IDLE_INFERENCE_SCALE': ('idle_inference_scale', float),
+            'HCI_MOTION_GATE': ('motion_gate', bool),
+            'HCI_MOTION_THRESHOLD': ('motion_threshold', float),
+            'HCI_MOTION_HAND_THRESHOLD': ('motion_hand_threshold', float),
+            'HCI_MAX_PROCESSING_TIME_MS': ('max_processing_time_ms', float),
+            'HCI_SKIP_FRAMES_ON_LAG': ('skip_frames_on_lag', bool),
             'HCI_MAX_ACTIONS_PER_SECOND': ('max_actions_per_second', int),
             'HCI_SCREEN_EDGE_MARGIN': ('screen_edge_margin', int),
             'HCI_SHOW_NOTIFICATIONS': ('show_notifications', bool),
             'HCI_LOG_LEVEL': ('log_level', str),
             'HCI_DEBUG_MODE': ('debug_mode', bool),
+            'HCI_HEADLESS': ('headless', bool),
         }
 
         for env_var, (setting_key, value_type) in env_mappings.items():
@@ -146,17 +351,234 @@ class GestureControlSystem:
         if self.settings.get('log_level') == 'DEBUG':
             self.debug_mode = True
 
+        # Debug modunda ayni frame'in ikinci kez işlenmesi AssertionError verir
+        self.detector.strict_frames = self.debug_mode
+
         print("Ayarlar yuklendi:")
         print(f"   Tutorial modu: {self.tutorial_mode}")
         print(f"   Guvenli mod: {self.safe_mode}")
         print(f"   Otomatik kalibrasyon: {self.auto_calibrate}")
         print(f"   Smoothing: {self.smoothing}")
-        print(f"   Kamera: {self.camera_index} @ {self.camera_fps}fps")
+        print(f"   Kamera: {self.camera_index} @ {self.camera_fps}fps "
+              f"({self.settings.get('camera_width')}x{self.settings.get('camera_height')} "
+              f"{self.settings.get('camera_fourcc')})")
+        if self.source:
+            print(f"   Kaynak: {self.source} (hiz: {self.source_pacing}, tekrar: {self.source_loop})")
+        if len(self.sources) > 1:
+            print(f"   Çoklu kamera: {self.sources} (boştaki kamera yoklama: {self.multi_camera_poll_interval}s, "
+                  f"el yokken toplam: {self.multi_camera_idle_fps} FPS)")
+        if self.record_trace:
+            print(f"   Landmark kaydi: {self.record_trace}")
+        if self.latency_probe is not None:
+            print(f"   Gecikme olçumu: açik (flaş testi: {self.latency_flash_test}, rapor: {self.latency_report})")
+        print(f"   El bolgesi takibi: {self.roi_tracking} (margin: {self.roi_margin})")
+        print(f"   Inference olçeği: {self.inference_scale}")
+        print(f"   Inference süreci: {'ayri worker' if self.inference_worker else 'ana süreç'}")
+        if self.hand_backend == BACKEND_TASKS:
+            print(f"   El arka ucu: HandLandmarker (async) - model {self.hand_model_path}, {self.hand_delegate}")
+        if self.max_num_hands > 1:
+            print(f"   Çoklu el: en fazla {self.max_num_hands} el (el başina ayri detektor)")
+        print(f"   Aynalama: {'landmark' if self.mirror_landmarks else 'goruntu'}")
+        print(f"   Headless: {self.headless}")
+        print(f"   Hareket kapisi: {self.motion_gate} (eşik: {self.motion_threshold}/{self.motion_hand_threshold})")
+        if self.idle_timeout > 0:
+            print(f"   Boşta mod: {self.idle_timeout}s sonra {self.idle_fps}fps, olçek {self.idle_inference_scale}")
+        else:
+            print("   Boşta mod: kapali")
+        print(f"   Frame butçesi: {self.max_processing_time_ms:.0f} ms (hedef {self.target_fps} fps, "
+              f"gecikmede frame atla: {self.skip_frames_on_lag})")
+        print(f"   Pipeline: kuyruk={self.pipeline_queue_size}, backpressure={self.pipeline_backpressure}")
         print(f"   Guven seviyesi: {self.confidence_minimum}")
 
     def get_settings(self) -> Dict:
         """Mevcut ayarlari dondur"""
-        return self.settings.copy()
+        settings = self.settings.copy()
+        if self.capture_profile:
+            settings['capture_profile'] = dict(self.capture_profile)
+        return settings
+
+    def create_roi_tracker(self) -> Optional[HandROITracker]:
+        """Ayarlarda etkinse el bolgesi takipçisi oluştur"""
+        if not self.roi_tracking:
+            return None
+        if self.hand_backend == BACKEND_TASKS and not self.inference_worker:
+            # Async sonuç onceki frame'in kirpilmiş bolgesine ait olabilir - koordinatlar kayar
+            print("El bolgesi takibi async HandLandmarker ile kullanilamaz - kapatildi")
+            return None
+        return HandROITracker(margin=self.roi_margin)
+
+    def create_frame_scheduler(self) -> FrameScheduler:
+        """Performans butçesine gore frame zamanlayicisi oluştur"""
+        return FrameScheduler(max_processing_time_ms=self.max_processing_time_ms,
+                              skip_frames_on_lag=self.skip_frames_on_lag)
+
+    def create_idle_controller(self) -> IdleController:
+        """Boşta guç modu durum makinesi oluştur"""
+        return IdleController(idle_timeout=self.idle_timeout, idle_fps=self.idle_fps,
+                              idle_inference_scale=self.idle_inference_scale)
+
+    def create_motion_gate(self) -> Optional[MotionGate]:
+        """Ayarlarda etkinse hareket kapisi oluştur"""
+        if not self.motion_gate:
+            return None
+        return MotionGate(motion_threshold=self.motion_threshold,
+                          hand_motion_threshold=self.motion_hand_threshold)
+
+    def create_hands(self, max_num_hands: Optional[int] = None):
+        """El algilayici oluştur - context manager olarak kullanilir
+
+        inference_worker açiksa MediaPipe ayri süreçte çalişir (InferenceWorker),
+        aksi halde ana süreçte hand_backend ayarindaki arka uç (utils.hand_backends).
+        Hepsi ayni process() arayuzune sahip. HandLandmarker açilamazsa (model
+        yok, eski MediaPipe) solutions arka ucuna donulur. max_num_hands
+        verilmezse ayarlardaki el sayisi kullanilir.
+        """
+        if max_num_hands is None:
+            max_num_hands = self.max_num_hands
+        if self.inference_worker:
+            # Slotlar tam frame boyutunda - ROI kirpma/olçekleme her zaman daha kuçuk goruntu verir
+            profile = self.capture_profile or {}
+            frame_shape = (profile.get('height') or self.settings.get('camera_height', 480),
+                           profile.get('width') or self.settings.get('camera_width', 640), 3)
+            return InferenceWorker(frame_shape, max_num_hands=max_num_hands,
+                                   confidence=self.confidence_minimum)
+
+        if self.hand_backend == BACKEND_TASKS:
+            try:
+                return create_hand_backend(BACKEND_TASKS, max_num_hands=max_num_hands,
+                                           confidence=self.confidence_minimum,
+                                           model_path=self.hand_model_path, delegate=self.hand_delegate)
+            except (ImportError, AttributeError, OSError, RuntimeError, ValueError) as e:
+                print(f"HandLandmarker başlatilamadi ({e}) - {BACKEND_SOLUTIONS} kullaniliyor")
+                self.hand_backend = BACKEND_SOLUTIONS
+
+        return create_hand_backend(BACKEND_SOLUTIONS, max_num_hands=max_num_hands,
+                                   confidence=self.confidence_minimum)
+
+    def create_trace_recorder(self) -> Optional[TraceRecorder]:
+        """Ayarlarda dosya verilmişse landmark izi kaydedici oluştur"""
+        if not self.record_trace:
+            return None
+        return TraceRecorder(self.record_trace, metadata={
+            'source': str(self.source if self.source else self.camera_index),
+            'mirror_landmarks': self.mirror_landmarks,
+            'created': time.time()
+        })
+
+    def save_trace(self, recorder: Optional[TraceRecorder]):
+        """Kaydi dosyaya yaz ve ozetle"""
+        if recorder is None:
+            return
+        try:
+            path = recorder.save()
+            print(f"Landmark kaydi: {recorder.frame_count} frame, {recorder.hand_count} el -> {path}")
+        except (OSError, ValueError) as e:
+            print(f"Landmark kaydi yazilamadi: {e}")
+
+    def create_flash_test(self) -> Optional[FlashTest]:
+        """Ayarlarda etkinse onizleme flaşi ile ekran -> kamera gecikme testi"""
+        if not self.latency_flash_test:
+            return None
+        print("Flaş testi: kamerayi onizleme penceresine çevirin")
+        return FlashTest()
+
+    def save_latency_report(self, flash_test: Optional[FlashTest] = None) -> Optional[Dict[str, Any]]:
+        """Gecikme raporunu yazdir, ayarlarda dosya verilmişse JSON olarak kaydet"""
+        if self.latency_probe is None:
+            return None
+        report = self.latency_probe.report()
+        if flash_test is not None:
+            report['display_to_camera'] = flash_test.report()
+        print("Gecikme raporu (ms):")
+        print(format_report(report))
+        if self.latency_report:
+            try:
+                with open(self.latency_report, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2)
+                print(f"Gecikme raporu yazildi: {self.latency_report}")
+            except OSError as e:
+                print(f"Gecikme raporu yazilamadi: {e}")
+        return report
+
+    def infer_hands(self, hands, rgb, roi_tracker: Optional[HandROITracker] = None,
+                    scale: Optional[float] = None):
+        """MediaPipe el algilamasini ayarlara gore çaliştir
+
+        Opsiyonel ROI kirpma ve inference olçeği uygulanir; landmark'lar her
+        durumda tum frame'e gore normalize koordinatlarda doner. mirror_landmarks
+        açiksa rgb aynalanmamiş kabul edilir ve landmark x'leri aynalanir.
+        scale verilmezse ayarlardaki inference olçeği kullanilir.
+        """
+        roi = None
+        if roi_tracker is not None:
+            rgb, roi = roi_tracker.crop(rgb)
+
+        if scale is None:
+            scale = self.inference_scale
+        results = hands.process(resize_for_inference(rgb, scale))
+
+        if roi_tracker is not None:
+            # ROI goruntu uzayinda takip edilir - aynalamadan once guncelle
+            roi_tracker.update(results, roi)
+
+        if self.mirror_landmarks:
+            mirror_landmarks(results)
+        return results
+
+    def prepare_frame(self, frame, rgb_pool: Optional[FramePool] = None, convert: bool = True):
+        """Yakalanan frame'den inference girdisi hazirla - (frame, rgb)
+
+        Goruntu aynalama modunda frame yerinde çevrilir; RGB donuşumu pool
+        verilmişse onceden ayrilmiş tampona yazilir. convert False ise
+        (inference yapilmayacak frame) rgb None doner.
+        """
+        if not self.mirror_landmarks:
+            mirror_in_place(frame)
+        if not convert:
+            return frame, None
+        return frame, to_rgb(frame, rgb_pool)
+
+    def prepare_preview(self, frame):
+        """Gosterilecek frame'i hazirla - landmark aynalama modunda goruntu burada çevrilir"""
+        if self.mirror_landmarks and not self.headless:
+            mirror_in_place(frame)
+        return frame
+
+    def create_frame_source(self, source=None) -> FrameSource:
+        """Kaynaği aç - verilmezse ayarlardaki source, o da bos ise camera_index kamerasi"""
+        if source is None:
+            source = self.source if self.source else self.camera_index
+        return open_frame_source(source, pacing=self.source_pacing, loop=self.source_loop)
+
+    def create_camera_scheduler(self, camera_ids) -> CameraScheduler:
+        """Çoklu kamerada hangi frame'in işleneceğini seçen zamanlayici"""
+        idle_interval = 1.0 / self.multi_camera_idle_fps if self.multi_camera_idle_fps > 0 else 0.0
+        return CameraScheduler(camera_ids, poll_interval=self.multi_camera_poll_interval,
+                               idle_interval=idle_interval)
+
+    def configure_capture(self, capture) -> Dict:
+        """Kameradan ayarlardaki profili (çozunurluk/FPS/fourcc) iste
+
+        Surucu desteklemezse aday profillere sirayla geçilir; gerçekte verilen
+        profil kaydedilir ve get_settings() içinde raporlanir. Kayitli
+        kaynaklarda (video/goruntu) profil değiştirilemez, sadece okunur.
+        """
+        if not getattr(capture, 'live', True):
+            self.capture_profile = dict(read_capture_profile(capture), matched=True,
+                                        source=capture.description, pacing=capture.pacing)
+            profile = self.capture_profile
+            print(f"Kaynak: {profile['source']} - {profile['width']}x{profile['height']} "
+                  f"@ {profile['fps']:.0f}fps ({profile['pacing']})")
+            return profile
+
+        candidates = build_capture_candidates(self.settings)
+        self.capture_profile = negotiate_capture_profile(capture, self.camera_fps, candidates)
+
+        profile = self.capture_profile
+        note = "" if profile['matched'] else " (istenen profil desteklenmiyor)"
+        print(f"Kamera profili: {profile['width']}x{profile['height']} @ {profile['fps']:.0f}fps "
+              f"{profile['fourcc'] or '?'}{note}")
+        return profile
 
     def _load_config(self, config_path: str) -> Dict:
         """Konfigurasyon dosyasini yukle"""
@@ -172,8 +594,12 @@ class GestureControlSystem:
         print("\nEl kalibrasyonu başlatiliyor...")
         print("Lutfen elinizi kameranin onunde doğal pozisyonda tutun")
         print("3 saniye içinde kalibrasyon başlayacak...")
-        self.calibration_countdown = 90  # 3 saniye x 30 FPS
-        self.detector.reset_calibration()
+        with self.state_lock:
+            self.calibration_countdown = 90  # 3 saniye x 30 FPS
+            self.detector.reset_calibration()
+            for detector in self.hand_detectors.values():
+                if detector is not self.detector:
+                    detector.reset_calibration()
 
     def enable_tutorial_mode(self):
         """Tutorial modunu etkinleştir"""
@@ -183,16 +609,20 @@ class GestureControlSystem:
         print("Gerçek eylemler çaliştirilmayacak")
         self.action_handler.enable_safe_mode(True)
 
-    def _calculate_cursor_position(self, landmarks) -> tuple:
-        """İşaret parmağindan cursor pozisyonunu hesapla - akilli filtreleme"""
-        index_finger = landmarks[8]
+    def _calculate_cursor_position(self, landmarks, context=None) -> tuple:
+        """İşaret parmağindan cursor pozisyonunu hesapla - akilli filtreleme
+
+        context (FrameContext) verilirse process_frame'in ayni frame için
+        aldiği sonuç kullanilir - detektor (Kalman, pinch durumu) ikinci kez
+        ilerletilmez.
+        """
+        points = landmark_array(landmarks)
 
         # Ham koordinatlar
-        raw_x = index_finger.x
-        raw_y = index_finger.y
+        raw_x, raw_y = points[INDEX_TIP, :2].tolist()
 
-        # Gesture detector'dan filtrelenmiş pozisyonu al
-        gesture_info = self.detector.detect_gesture(landmarks)
+        # Gesture detector'dan filtrelenmiş pozisyonu al (frame onbelleğinden)
+        gesture_info = self.detector.detect_gesture(points, context=context)
 
         if 'cursor_pos' in gesture_info:
             return gesture_info['cursor_pos']
@@ -209,150 +639,96 @@ class GestureControlSystem:
         self.prev_cursor_x, self.prev_cursor_y = new_x, new_y
         return (new_x, new_y)
 
-    def _draw_calibration_overlay(self, frame):
-        """Kalibrasyon için overlay çiz"""
-        h, w, _ = frame.shape
-
-        if self.calibration_countdown > 0:
-            # Geri sayim goster
-            countdown_sec = self.calibration_countdown // 30
-            cv2.putText(frame, f"Kalibrasyon: {countdown_sec + 1}",
-                        (w // 2 - 100, h // 2), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 3)
-
-            # Hedef alan çiz
-            center_x, center_y = w // 2, h // 2
-            cv2.rectangle(frame, (center_x - 100, center_y - 100),
-                          (center_x + 100, center_y + 100), (0, 255, 255), 2)
-            cv2.putText(frame, "Elinizi burada tutun",
-                        (center_x - 80, center_y + 130), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-
-    def _draw_visual_feedback(self, frame, landmarks, cursor_pos: tuple, gesture_info: Dict):
-        """Gelişmiş gorsel geri bildirim - akilli sistem bilgileri"""
-        h, w, _ = frame.shape
-
-        # Kalibrasyon overlay'i
-        if self.calibration_countdown > 0:
-            self._draw_calibration_overlay(frame)
-            return
-
-        # El landmark'larini çiz
-        if mp_drawing and mp_hands:
-            mp_drawing.draw_landmarks(frame, landmarks, mp_hands.HAND_CONNECTIONS)
+    def detector_for(self, hand_key: Optional[str] = None) -> GestureDetector:
+        """Elin detektoru - tek el modunda (ya da anahtar yoksa) her zaman self.detector
 
-        # İşaret parmaği pozisyonu (mavi)
-        index_finger = landmarks.landmark[8]
-        cam_x, cam_y = int(index_finger.x * w), int(index_finger.y * h)
-        cv2.circle(frame, (cam_x, cam_y), 8, (255, 0, 0), -1)
+        İlk gorulen el mevcut detektoru (ve kalibrasyonunu) devralir, diğer
+        eller kendi pinch/surukleme/filtre durumlariyla yeni detektor alir.
+        """
+        if hand_key is None or self.max_num_hands <= 1:
+            return self.detector
 
-        # Filtrelenmiş cursor pozisyonu (yeşil)
-        if 'cursor_pos' in gesture_info:
-            filter_x, filter_y = gesture_info['cursor_pos']
-            vis_filter_x = int((filter_x / (SCREEN_W or w)) * w)
-            vis_filter_y = int((filter_y / (SCREEN_H or h)) * h)
-            cv2.circle(frame, (vis_filter_x, vis_filter_y), 6, (0, 255, 0), -1)
-
-        # Gesture durumunu goster
-        status_y = 30
-
-        # Kalibrasyon durumu - geliştirilmiş
-        cal_status = self.detector.get_calibration_status()
-        if cal_status['is_calibrated']:
-            cv2.putText(frame, f"✓ Akilli kalibrasyon (boyut: {cal_status.get('hand_size', 0):.3f})", (10, status_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        detector = self.hand_detectors.get(hand_key)
+        if detector is None:
+            if self.detector in self.hand_detectors.values():
+                detector = GestureDetector(self.config_path, clock=self.clock)
+                detector.strict_frames = self.detector.strict_frames
+            else:
+                detector = self.detector
+            self.hand_detectors[hand_key] = detector
+        return detector
+
+    def process_hands(self, frame, results, context=None) -> List[Dict[str, Any]]:
+        """Frame'deki tum elleri işle - el başina gesture bilgisi listesi
+
+        Tum ellerin mesafeleri tek NumPy geçişinde hesaplanir. Çoklu el
+        modunda her el handedness anahtariyla kendi detektorune gider;
+        birincil el (imleci suren) gorunduğu surece değişmez. context
+        (FrameContext) her ele aynen geçirilir.
+        """
+        hands = results.multi_hand_landmarks or []
+        points = hands_to_array(results)
+        rows = hand_feature_rows(compute_hand_features(points))
+
+        if self.max_num_hands <= 1:
+            keys: List[Optional[str]] = [None] * len(hands)
         else:
-            progress = (cal_status.get('frames_processed', 0) / 90) * 100
-            cv2.putText(frame, f"⏳ Otomatik kalibrasyon: {progress:.0f}%", (10, status_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
-        status_y += 20
-
-        # Pinch durumu - detayli
-        if gesture_info.get('pinch_active', False):
-            pinch_dist = gesture_info.get('raw_pinch_distance', 0)
-            pinch_thresh = gesture_info.get('pinch_threshold', 0)
-            cv2.putText(frame, f"Pinch aktif ({pinch_dist:.3f} < {pinch_thresh:.3f})", (10, status_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
-            status_y += 20
-
-        # Mevcut gesture
-        if gesture_info.get('action'):
-            confidence = gesture_info.get('confidence', 0)
-            stable = "OK" if gesture_info.get('stable', False) else "NO"
-
-            action_text = f"Gesture: {gesture_info['action']} ({confidence:.2f})"
-            cv2.putText(frame, action_text, (10, status_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
-            status_y += 20
-
-        # Sistem durumu
-        system_status = self.action_handler.get_status()
-        if system_status['disabled']:
-            cv2.putText(frame, "DEVRE DIŞI", (10, status_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
-            status_y += 30
-
-        if system_status['safe_mode']:
-            cv2.putText(frame, "GUVENLI MOD", (10, status_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-            status_y += 25
-
-        if system_status['cursor_frozen']:
-            cv2.putText(frame, "İMLEÇ DONDURULDU", (10, status_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 255), 2)
-            status_y += 25
-
-        if system_status['drag_mode']:
-            cv2.putText(frame, "SuRuKLEME MODU", (10, status_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-            status_y += 25
-
-        # Tutorial modu
-        if self.tutorial_mode:
-            cv2.putText(frame, "TUTORIAL MODU - Eylemler çaliştirilmiyor",
-                        (10, status_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
-            status_y += 20
-
-        # Performans istatistikleri (debug modu)
-        if self.debug_mode:
-            perf_stats = self.detector.get_performance_stats()
-            cv2.putText(frame, f"İşlenen frame: {perf_stats['total_frames']}",
-                        (10, h - 80), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-
-            cursor_stats = perf_stats.get('cursor_filter_stats', {})
-            if cursor_stats.get('total_movements', 0) > 0:
-                filter_rate = cursor_stats.get('filter_rate', 0) * 100
-                cv2.putText(frame, f"Filtreleme orani: {filter_rate:.1f}%",
-                            (10, h - 60), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-
-        # Yardim metni
-        if self.show_help:
-            help_y = h - 40
-            cv2.putText(frame, 'q: çik | c: kalibre et | h: yardimi gizle | t: tutorial | s: guvenli mod',
-                        (10, help_y), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-            help_y += 15
-            cv2.putText(frame, 'f: imleç dondur | d: devre dişi | SPACE: durakla | `: debug',
-                        (10, help_y), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-
-    def process_frame(self, frame, landmarks) -> Dict[str, Any]:
-        """Bir frame'i işle ve gesture algila - optimize edilmiş"""
-        self.frame_count += 1
+            keys = list(hand_keys(results))
+            if self.primary_hand not in keys:
+                self.primary_hand = keys[0]
+                self.detector = self.detector_for(self.primary_hand)
+
+        return [self.process_frame(frame, landmarks, hand_key=key, features=row, context=context, points=hand_points)
+                for landmarks, key, row, hand_points in zip(hands, keys, rows, points)]
+
+    def process_frame(self, frame, landmarks, hand_key: Optional[str] = None,
+                      features: Optional[Dict[str, Any]] = None, context=None, points=None) -> Dict[str, Any]:
+        """Bir frame'i işle ve gesture algila - optimize edilmiş
+
+        hand_key verilirse el kendi detektoruyle işlenir; imleç hareketi ve
+        surukleme sadece birincil elden gelir, diğer eller tiklama/sistem
+        eylemlerini tetikleyebilir. features: process_hands'in toplu hesapladiği satir.
+        context (utils.frame_context.FrameContext) verilirse detektor, filtreler
+        ve eylem yoneticisi frame'in yakalama zamanini kullanir. points: elin
+        (21, 3) dizisi - verilmezse landmark nesnelerinden bir kez oluşturulur.
+        Elin ozellikleri (HandFeatures) frame başina bir kez hesaplanir.
+        """
+        detector = self.detector_for(hand_key)
+        # Elin frame ozellikleri bir kez - kalibrasyon ve gesture algilama paylaşir
+        hand = detector.hand_features(landmarks if points is None else points, features, context)
+        primary = hand_key is None or hand_key == self.primary_hand
+        if primary:
+            self.frame_count += 1
 
         # Kalibrasyon geri sayimi (legacy)
-        if self.calibration_countdown > 0:
+        if primary and self.calibration_countdown > 0:
             self.calibration_countdown -= 1
             if self.calibration_countdown == 0:
                 print("Manuel kalibrasyon başlatiliyor...")
-                self.detector.calibrate_hand(landmarks.landmark)
+                detector.calibrate_hand(hand, context.capture_time if context else None)
 
         # Gesture algila (bu işlem cursor pozisyonunu da hesaplar)
-        gesture_info = self.detector.detect_gesture(landmarks.landmark)
+        gesture_info = detector.detect_gesture(hand, context=context)
+        probe = self.latency_probe
+        if primary and probe is not None:
+            probe.mark(context, 'gesture')
+        if hand_key is not None:
+            gesture_info['hand'] = hand_key
+            gesture_info['primary'] = primary
 
         # Filtrelenmiş cursor pozisyonunu al
         cursor_pos = gesture_info.get('cursor_pos', (0, 0))
 
         # İmleci hareket ettir - SADECE pinch aktifken VE akilli filtreleme ile
         pinch_active = gesture_info.get('pinch_active', False)
-        if pinch_active and gesture_info.get('type') != 'calibration':
-            self.action_handler.move_cursor(cursor_pos[0], cursor_pos[1], pinch_active, 1.0)
+        if primary and pinch_active and gesture_info.get('type') != 'calibration':
+            moved = self.action_handler.move_cursor(cursor_pos[0], cursor_pos[1], pinch_active, 1.0, context)
+            if moved and probe is not None:
+                probe.mark(context, 'output')
+
+        # İkincil el imleci suruklemez - tek fare imleci birincil ele ait
+        if not primary and gesture_info['action'] in CURSOR_ACTIONS:
+            gesture_info['action'] = None
 
         # Gesture eylemini gerçekleştir
         if gesture_info['action'] and gesture_info.get('type') != 'calibration':
@@ -360,7 +736,7 @@ class GestureControlSystem:
 
             # Tutorial modunda gerçek eylemleri çaliştirma
             if not self.tutorial_mode:
-                should_execute = self.detector.should_execute_action(
+                should_execute = detector.should_execute_action(
                     gesture_info['type'],
                     gesture_info['action'],
                     gesture_info.get('confidence', 0),
@@ -368,26 +744,80 @@ class GestureControlSystem:
                 )
 
                 if should_execute:
-                    success = self.action_handler.execute_action(gesture_info, cursor_pos)
+                    success = self.action_handler.execute_action(gesture_info, cursor_pos, context)
                     if success:
+                        if probe is not None:
+                            probe.mark(context, 'output')
                         self.successful_actions += 1
-                        self.last_gesture_time = time.time()
+                        self.last_gesture_time = context.capture_time if context else self.clock()
             else:
                 # Tutorial modunda sadece bilgi goster
                 confidence = gesture_info.get('confidence', 0)
                 stable = "OK" if gesture_info.get('stable', False) else "NO"
                 print(f"Tutorial: {gesture_info['action']} (guven: {confidence:.2f}, stabil: {stable})")
 
-        # Gorsel geri bildirim
-        self._draw_visual_feedback(frame, landmarks, cursor_pos, gesture_info)
+        # Gorsel geri bildirim (headless modda çizim yok)
+        if self.renderer is not None:
+            self.renderer.draw_feedback(frame, landmarks, gesture_info)
+
+        if primary:
+            self.last_landmarks = landmarks
+            self.last_gesture_info = gesture_info
+        return gesture_info
+
+    def process_skipped_frame(self, frame, context=None) -> Optional[Dict[str, Any]]:
+        """Inference atlanan frame'i işle - son landmark'lar ve imleç tahmini
+
+        Yeni gesture eylemi tetiklenmez; pinch devam ediyorsa imleç Kalman
+        tahminiyle hareket ettirilir.
+        """
+        if self.last_landmarks is None:
+            return None
+
+        cursor_pos = self.detector.predict_cursor(context)
+        gesture_info = dict(self.last_gesture_info, action=None, cursor_pos=cursor_pos, predicted=True)
+
+        pinch_active = gesture_info.get('pinch_active', False)
+        if pinch_active and gesture_info.get('type') != 'calibration':
+            moved = self.action_handler.move_cursor(cursor_pos[0], cursor_pos[1], pinch_active, 1.0, context)
+            if moved and self.latency_probe is not None:
+                self.latency_probe.mark(context, 'output')
 
+        if self.renderer is not None:
+            self.renderer.draw_feedback(frame, self.last_landmarks, gesture_info)
         return gesture_info
 
-    def handle_keyboard_input(self, key: int) -> bool:
-        """Klavye girişlerini işle"""
+    def clear_last_hand(self):
+        """El kayboldu - atlanan frame'lerde eski landmark kullanilmasin"""
+        self.last_landmarks = None
+        self.last_gesture_info = {}
+
+    def handle_keyboard_input(self, key: int, pipeline: Optional[FramePipeline] = None) -> bool:
+        """Klavye girişlerini işle
+
+        Ana thread'de çağrilir; durum değiştiren komutlar state_lock altinda
+        çaliştirilir. SPACE, verilen pipeline'i (imleç/tiklama dahil) duraklatir.
+        """
         if key == ord('q'):
             return False  # Çik
-        elif key == ord('c'):
+        if key == ord(' '):  # SPACE - durakla
+            # Kilit tutulmadan beklenir; eylem aşamasi elindeki frame'i bitirip durur
+            if pipeline is not None:
+                pipeline.pause()
+            try:
+                input("Sistem duraklatildi. Devam etmek için Enter'a basin...")
+            finally:
+                if pipeline is not None:
+                    pipeline.resume()
+            return True
+
+        with self.state_lock:
+            self._handle_command_key(key)
+        return True
+
+    def _handle_command_key(self, key: int):
+        """Durum değiştiren klavye komutlari - state_lock altinda çağrilir"""
+        if key == ord('c'):
             self.start_calibration()
         elif key == ord('h'):
             self.show_help = not self.show_help
@@ -406,14 +836,10 @@ class GestureControlSystem:
             self.action_handler._toggle_cursor_freeze()
         elif key == ord('d'):
             self.action_handler._toggle_disabled_mode()
-        elif key == ord(' '):  # SPACE - durakla
-            input("Sistem duraklatildi. Devam etmek için Enter'a basin...")
         elif key == ord('`'):  # Backtick - debug mode
             self.debug_mode = not self.debug_mode
             print(f"Debug modu {'etkin' if self.debug_mode else 'kapali'}")
 
-        return True
-
     def get_session_stats(self) -> Dict[str, Any]:
         """Oturum istatistiklerini dondur"""
         action_stats = self.action_handler.get_stats()
@@ -445,31 +871,35 @@ def run(camera_index=0, settings_override: Optional[Dict] = None):
         settings_override = {}
 
     # Camera index'i ayarlardan al veya parametre olarak kullan
-    final_camera_index = settings_override.get('camera_index', camera_index)
+    settings_override.setdefault('camera_index', camera_index)
 
-    cap = cv2.VideoCapture(final_camera_index)
+    # Moduler sistemi başlat - ayarlarla birlikte
+    gesture_system = GestureControlSystem(settings_override=settings_override)
+    headless = gesture_system.headless
+
+    # Frame kaynaği: kamera, video dosyasi ya da goruntu klasoru (--source)
+    cap = gesture_system.create_frame_source()
     if not cap.isOpened():
-        print(f"Kamera açilamadi (index: {final_camera_index}).")
+        print(f"Kaynak açilamadi: {cap.description}.")
         return
 
     # Ensure window is created from main thread and use a resizable window
-    try:
-        cv2.namedWindow('Gesture Control - Kullanici Dostu Versiyon', cv2.WINDOW_NORMAL)
-        # On some platforms OpenCV/Qt can complain about threads; startWindowThread helps
-        cv2.startWindowThread()
-    except Exception:
-        # non-fatal, continue
-        pass
-
-    # Moduler sistemi başlat - ayarlarla birlikte
-    gesture_system = GestureControlSystem(settings_override=settings_override)
+    if not headless:
+        try:
+            cv2.namedWindow('Gesture Control - Kullanici Dostu Versiyon', cv2.WINDOW_NORMAL)
+            # On some platforms OpenCV/Qt can complain about threads; startWindowThread helps
+            cv2.startWindowThread()
+        except Exception:
+            # non-fatal, continue
+            pass
+    else:
+        print("Headless mod - onizleme yok, çikmak için Ctrl+C")
 
-    # MediaPipe hands modeli - ayarlardan guven seviyesi al
-    confidence_level = gesture_system.confidence_minimum
+    # Kamera profilini ayarla (çozunurluk, FPS, MJPG)
+    gesture_system.configure_capture(cap)
 
-    with mp_hands.Hands(max_num_hands=1,
-                        min_detection_confidence=confidence_level,
-                        min_tracking_confidence=confidence_level) as hands:
+    # MediaPipe hands modeli (ayarlara gore ana süreçte ya da worker süreçte)
+    with gesture_system.create_hands() as hands:
 
         # Otomatik kalibrasyon oner - ayarlardan kontrol et
         if gesture_system.auto_calibrate:
@@ -480,54 +910,237 @@ def run(camera_index=0, settings_override: Optional[Dict] = None):
 
         frame_count = 0
         start_time = time.time()
-        target_fps = gesture_system.camera_fps
-
-        while True:
-            ok, frame = cap.read()
-            if not ok:
-                print("Kamera verisi alinamadi")
-                break
-
-            # Aynayi çevir
-            frame = cv2.flip(frame, 1)
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-            # El algilama
-            results = hands.process(rgb)
-
-            if results.multi_hand_landmarks:
-                for landmarks in results.multi_hand_landmarks:
-                    # Frame'i işle ve gesture algila
-                    gesture_info = gesture_system.process_frame(frame, landmarks)
-            else:
-                # El algilanmadiğinda bilgi goster
-                h, w, _ = frame.shape
-                cv2.putText(frame, "El algilanmadi - Elinizi kameranin onune getirin",
-                            (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
-
-                # Kalibrasyon durumunda yardim goster
-                if gesture_system.calibration_countdown > 0:
-                    gesture_system._draw_calibration_overlay(frame)
-
-            # FPS hesapla ve goster
-            frame_count += 1
-            if frame_count % 30 == 0:  # Her 30 frame'de bir guncelle
-                elapsed = time.time() - start_time
-                fps = frame_count / elapsed
-                cv2.putText(frame, f"FPS: {fps:.1f}", (frame.shape[1] - 100, 30),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-
-            # Frame'i goster
-            cv2.imshow('Gesture Control - Kullanici Dostu Versiyon', frame)
-
-            # Klavye girişi kontrolu
-            key = cv2.waitKey(1) & 0xFF
-            if not gesture_system.handle_keyboard_input(key):
-                break
+        # Frame tamponlari yeniden kullanilir - her tampon işi bitince (gosterildikten ya
+        # da kuyrukta atildiktan sonra) havuza doner. Hatta ayni anda bulunabilecek frame
+        # sayisi + grabber'in tuttuğu iki tampon (slot ve yazilan) ile kararli durumda
+        # yeni ayirma olmaz; RGB tamponu sadece yakalama ile inference arasinda yaşar
+        queue_size = gesture_system.pipeline_queue_size
+        capture_pool = FramePool(FramePipeline.max_items_in_flight(3, queue_size) + 2)
+        rgb_pool = FramePool(queue_size + 2)
+
+        # Kamera okumasi ayri thread'de - inference yavaşlarsa eski frame'ler atilir
+        # Kayitli kaynak hizli okunuyorsa frame atilmaz (her frame işlenir)
+        grabber = LatestFrameGrabber(cap, pool=capture_pool, lossless=cap.lossless).start()
+
+        # El uzun sure gorulmezse duşuk hiz/çozunurluk
+        idle = gesture_system.create_idle_controller()
+
+        # Opsiyonel hareket kapisi - karar capture thread'inde, el durumu inference'tan
+        gate = gesture_system.create_motion_gate()
+
+        # Gecikme olçumu (opsiyonel) - damgalar aşama thread'lerinden, flaş ana thread'de
+        probe = gesture_system.latency_probe
+        flash_test = gesture_system.create_flash_test()
+
+        # 1. aşama: yakalama + aynalama + BGR->RGB
+        def capture_stage():
+            while True:
+                # Boşta modda sonraki yoklamaya kadar uyu - aradaki frame'ler grabber'da
+                # decode edilmeden atilir
+                grabber.decode_interval = idle.decode_interval
+                wait = idle.wait_time()
+                if wait > 0:
+                    time.sleep(wait)
+
+                last_id = grabber.last_frame_id
+                ok, frame = grabber.read()
+                if not ok:
+                    print("Kamera verisi alinamadi" if cap.live else "Kaynak sona erdi")
+                    return None
+                if idle.should_process(grabber.last_frame_id - last_id):
+                    break
+                grabber.release(frame)
+
+            decision = gate.decide(gate.measure(frame)) if gate is not None else GATE_INFER
+            brightness = flash_test.measure(frame) if flash_test is not None else None
+            frame, rgb = gesture_system.prepare_frame(frame, rgb_pool, convert=decision == GATE_INFER)
+            return {'frame': frame, 'rgb': rgb, 'gate': decision, 'context': grabber.frame_context(),
+                    'brightness': brightness}
+
+        # El bolgesi takibi (opsiyonel) - sadece inference thread'inde kullanilir
+        roi_tracker = gesture_system.create_roi_tracker()
+
+        # Butçe aşilinca bazi frame'lerde inference atlanir
+        scheduler = gesture_system.create_frame_scheduler()
+
+        # Opsiyonel landmark izi kaydi - sadece inference thread'inden yazilir
+        recorder = gesture_system.create_trace_recorder()
+
+        # 2. aşama: MediaPipe el algilama (ROI kirpma ve inference olçeği dahil)
+        def inference_stage(item):
+            rgb = item.pop('rgb')
+            if item['gate'] != GATE_INFER:
+                # Hareket yok - el yoksa inference atlanir, el varsa son landmark'lar
+                item['results'] = gate.gated_results(item['gate'])
+                idle.update(bool(item['results'].multi_hand_landmarks))
+                if recorder is not None:
+                    recorder.record(item['results'], item['context'].capture_time)
+                return item
+
+            if not scheduler.should_infer():
+                rgb_pool.release(rgb)
+                item['results'] = None
+                return item
+
+            infer_start = time.perf_counter()
+            scale = idle.inference_scale(gesture_system.inference_scale)
+            item['results'] = gesture_system.infer_hands(hands, rgb, roi_tracker, scale)
+            rgb_pool.release(rgb)
+            scheduler.record((time.perf_counter() - infer_start) * 1000)
+            if probe is not None:
+                probe.mark(item['context'], 'inference')
+
+            idle.update(bool(item['results'].multi_hand_landmarks))
+            if gate is not None:
+                gate.update(item['results'])
+            if recorder is not None:
+                recorder.record(item['results'], item['context'].capture_time)
+            return item
+
+        renderer = gesture_system.renderer
+
+        # 3. aşama: gesture algilama + eylem + overlay (headless modda çizim yok)
+        def action_stage(item):
+            frame = gesture_system.prepare_preview(item['frame'])
+            results = item['results']
+
+            # Klavye komutlari (ana thread) ile ayni anda detektor durumuna dokunulmasin
+            with gesture_system.state_lock:
+                if results is None:
+                    # Inference atlandi - son el ve imleç tahmini ile devam et
+                    item['gesture_info'] = gesture_system.process_skipped_frame(frame, item['context'])
+                elif results.multi_hand_landmarks:
+                    # Tum elleri işle - bilgi olarak birincil elinki tutulur
+                    gesture_system.process_hands(frame, results, item['context'])
+                    item['gesture_info'] = gesture_system.last_gesture_info
+                else:
+                    gesture_system.clear_last_hand()
+
+                    # El algilanmadiğinda bilgi goster
+                    if renderer is not None:
+                        renderer.draw_no_hand(frame)
+
+            if probe is not None:
+                probe.finish(item['context'])
+            return item
+
+        def release_item(item):
+            """Oğe ile iş bitti - tamponlari havuzlara geri ver"""
+            grabber.release(item['frame'])
+            rgb_pool.release(item.get('rgb'))
+
+        pipeline = FramePipeline(
+            capture_stage,
+            [('inference', inference_stage), ('action', action_stage)],
+            queue_size=gesture_system.pipeline_queue_size,
+            backpressure=gesture_system.pipeline_backpressure,
+            on_drop=release_item
+        ).start()
+
+        shown = None
+        try:
+            while True:
+                item = pipeline.get_output(timeout=0.1)
+                if item is None:
+                    if pipeline.finished:
+                        break
+                    # Yeni frame yok - pencereyi canli tut
+                    if not headless and not gesture_system.handle_keyboard_input(cv2.waitKey(1) & 0xFF, pipeline):
+                        break
+                    continue
+
+                # Onceki frame gosterildi - tamponu artik yeniden yazilabilir
+                if shown is not None:
+                    release_item(shown)
+                shown = item
+                frame = item['frame']
+
+                # FPS hesapla ve goster
+                frame_count += 1
+                if frame_count % 30 == 0:  # Her 30 frame'de bir guncelle
+                    elapsed = time.time() - start_time
+                    fps = frame_count / elapsed
+                    if renderer is not None:
+                        renderer.draw_fps(frame, fps)
+
+                    if gesture_system.debug_mode:
+                        print(f"Kuyruk derinlikleri: {pipeline.get_queue_depths()}")
+
+                if headless:
+                    continue
+
+                # Flaş testi - kamera flaşi gorene kadar onizleme beyaz
+                if flash_test is not None and flash_test.update(item['brightness'], item['context'].capture_time):
+                    frame = flash_test.flash_frame(frame)
+
+                # Frame'i goster
+                cv2.imshow('Gesture Control - Kullanici Dostu Versiyon', frame)
+
+                # Klavye girişi kontrolu
+                key = cv2.waitKey(1) & 0xFF
+                if flash_test is not None:
+                    flash_test.displayed()
+                if not gesture_system.handle_keyboard_input(key, pipeline):
+                    break
+        except KeyboardInterrupt:
+            print("\nKullanici tarafindan durduruldu")
+
+        grabber.stop()
+        pipeline.stop()
+        gesture_system.save_trace(recorder)
+        gesture_system.save_latency_report(flash_test)
+        grabber_stats = grabber.get_stats()
+        print(f"Atilan eski frame: {grabber_stats['frames_dropped']}/{grabber_stats['frames_captured']}")
+        source_stats = cap.get_stats()
+        print(f"Kaynak: {source_stats['source']}, {source_stats['frames_read']} frame, "
+              f"{source_stats['read_fps']:.1f} fps ({source_stats['pacing']})")
+        idle_stats = idle.get_stats()
+        print(f"Boşta mod: aktif {idle_stats['time_active_s']:.0f}s, boşta {idle_stats['time_idle_s']:.0f}s, "
+              f"duty cycle %{idle_stats['duty_cycle'] * 100:.0f}, "
+              f"decode edilmeyen frame: {grabber_stats['frames_not_decoded']}")
+        if gate is not None:
+            gate_stats = gate.get_stats()
+            print(f"Hareket kapisi: %{gate_stats['skip_ratio'] * 100:.0f} atlandi "
+                  f"({gate_stats['frames_static']} durağan, {gate_stats['frames_reused']} tekrar), "
+                  f"olçum {gate_stats['avg_measure_ms']:.2f} ms")
+        scheduler_stats = scheduler.get_stats()
+        print(f"Atlanan inference: {scheduler_stats['frames_skipped']}/"
+              f"{scheduler_stats['frames_inferred'] + scheduler_stats['frames_skipped']} "
+              f"(ort. {scheduler_stats['avg_processing_ms']:.1f} ms, butçe {scheduler_stats['budget_ms']:.0f} ms)")
+        if isinstance(hands, InferenceWorker):
+            worker_stats = hands.get_stats()
+            print(f"Inference worker: {worker_stats['frames']} frame, inference "
+                  f"{worker_stats['avg_infer_ms']:.1f} ms, aktarim {worker_stats['avg_overhead_ms']:.2f} ms, "
+                  f"zaman aşimi {worker_stats['timeouts']}")
+        elif hands.asynchronous:
+            backend_stats = hands.get_stats()
+            print(f"HandLandmarker ({backend_stats['delegate']}): {backend_stats['frames_submitted']} gonderildi, "
+                  f"{backend_stats['frames_dropped']} meşgulken atlandi, "
+                  f"gecikme {backend_stats['avg_latency_ms']:.1f} ms")
+        else:
+            backend_stats = hands.get_stats()
+            print(f"Inference: {backend_stats['frames']} frame, ort. {backend_stats['avg_infer_ms']:.1f} ms")
+        latency_stats = gesture_system.action_handler.get_latency_stats()
+        print(f"Yakalama -> eylem gecikmesi: imleç {latency_stats['avg_cursor_latency_ms']:.1f} ms, "
+              f"eylem {latency_stats['avg_action_latency_ms']:.1f} ms")
+        if roi_tracker is not None:
+            roi_stats = roi_tracker.get_stats()
+            print(f"El bolgesi takibi: %{roi_stats['roi_ratio'] * 100:.0f} kirpilmiş frame, "
+                  f"piksel orani {roi_stats['pixel_ratio']:.2f}")
+        for pool_name, pool in (('kamera', capture_pool), ('rgb', rgb_pool)):
+            pool_stats = pool.get_stats()
+            print(f"Frame tamponu ({pool_name}): {pool_stats['allocations']} ayirma, "
+                  f"isinma sonrasi {pool_stats['steady_state_allocations']}")
+        for stage_name, stage_stats in pipeline.get_stats().items():
+            print(f"   {stage_name}: {stage_stats['avg_time_ms']:.1f} ms/frame, "
+                  f"maks. kuyruk {stage_stats['queue']['max_depth']}/{stage_stats['queue']['capacity']}, "
+                  f"atilan {stage_stats['queue']['items_dropped']}")
 
     # Kapaniş istatistikleri
     cap.release()
-    cv2.destroyAllWindows()
+    if not headless:
+        cv2.destroyAllWindows()
 
 # Eski run fonksiyonu için backward compatibility
 
@@ -553,18 +1166,23 @@ def run_legacy(camera_index=0):
     CLICK_DIST = 0.05
     CLICK_COOLDOWN = 0.6
 
+    # Tek thread - okuma ve RGB tamponlari her frame yeniden kullanilir
+    frame = None
+    rgb_pool = FramePool(1)
+
     with mp_hands.Hands(max_num_hands=1,
                         min_detection_confidence=0.6,
                         min_tracking_confidence=0.6) as hands:
         while True:
-            ok, frame = cap.read()
+            ok, frame = cap.read(image=frame)
             if not ok:
                 break
 
-            frame = cv2.flip(frame, 1)
+            mirror_in_place(frame)
             h, w, _ = frame.shape
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            rgb = to_rgb(frame, rgb_pool)
             res = hands.process(rgb)
+            rgb_pool.release(rgb)
 
             if res.multi_hand_landmarks:
                 lm = res.multi_hand_landmarks[0].landmark
@@ -650,6 +1268,7 @@ def parse_args():
     parser.add_argument('--auto-calibrate', action='store_true', default=True, help='Otomatik kalibrasyonu etkinleştir')
     parser.add_argument('--no-auto-calibrate', action='store_true', help='Otomatik kalibrasyonu devre dişi birak')
     parser.add_argument('--debug', action='store_true', help='Debug modunu etkinleştir')
+    parser.add_argument('--headless', action='store_true', help='Onizleme penceresi ve overlay çizimi olmadan çaliştir')
 
     # Hassasiyet ayarlari
     parser.add_argument('--smoothing', type=float, default=0.3, help='Cursor yumuşakliği (0.1-0.9)')
@@ -659,6 +1278,54 @@ def parse_args():
 
     # Kamera ayarlari
     parser.add_argument('--fps', type=int, default=30, help='Kamera FPS (15-60)')
+    parser.add_argument('--width', type=int, default=640, help='Kamera yakalama genişliği (varsayilan: 640)')
+    parser.add_argument('--height', type=int, default=480, help='Kamera yakalama yuksekliği (varsayilan: 480)')
+    parser.add_argument('--fourcc', type=str, default='MJPG', help='Kamera piksel formati (MJPG, YUYV)')
+
+    # Kayitli kaynak (kamerasiz benchmark / profil)
+    parser.add_argument('--source', type=str, default=None,
+                        help='Kamera yerine video dosyasi ya da goruntu klasoru (ya da kamera numarasi)')
+    parser.add_argument('--pacing', choices=PACING_MODES, default=PACING_REALTIME,
+                        help='Kayitli kaynak hizi: realtime (dosya FPS\'i) veya fast (beklemeden, frame atmadan)')
+    parser.add_argument('--loop', action='store_true', help='Kayitli kaynak bitince başa don')
+    parser.add_argument('--record-trace', type=str, default=None,
+                        help='Landmark izini bu .npz dosyasina kaydet (benchmarks/trace_replay.py ile oynatilir)')
+
+    parser.add_argument('--latency-probe', action='store_true',
+                        help='Gecikme olçum modu: yakalama/inference/gesture/pyautogui aşama yuzdelikleri')
+    parser.add_argument('--flash-test', action='store_true',
+                        help='Onizleme flaşi ile ekran -> kamera gecikmesini olç (kamera ekrani gormeli)')
+    parser.add_argument('--latency-report', type=str, default=None,
+                        help='Gecikme raporunu bu JSON dosyasina yaz (olçum modunu açar)')
+    parser.add_argument('--inference-scale', type=float, default=1.0,
+                        help='Inference oncesi goruntu olçeği (0.1-1.0, gosterim tam çozunurlukte kalir)')
+    parser.add_argument('--inference-worker', action='store_true',
+                        help='MediaPipe\'i ayri süreçte çaliştir (frame\'ler paylaşimli bellekle aktarilir)')
+    parser.add_argument('--hand-backend', choices=HAND_BACKENDS, default=BACKEND_SOLUTIONS,
+                        help='El algilama arka ucu: solutions (senkron) veya tasks (HandLandmarker, async)')
+    parser.add_argument('--hand-model', type=str, default=DEFAULT_MODEL_PATH,
+                        help='tasks arka ucu için hand_landmarker.task model dosyasi')
+    parser.add_argument('--hand-delegate', choices=DELEGATES, default='cpu',
+                        help='tasks arka ucu için inference donanimi (cpu, gpu)')
+    parser.add_argument('--max-hands', type=int, default=1,
+                        help='Ayni anda izlenecek en fazla el sayisi (her el ayri gesture durumuyla)')
+    parser.add_argument('--max-processing-ms', type=float, default=None,
+                        help='Frame başina işleme butçesi (varsayilan: config performance.max_processing_time_ms)')
+    parser.add_argument('--no-frame-skip', action='store_true',
+                        help='Butçe aşilsa da inference atlama')
+    parser.add_argument('--mirror-landmarks', action='store_true',
+                        help='Goruntuyu çevirmek yerine landmark koordinatlarini aynala')
+    parser.add_argument('--idle-timeout', type=float, default=5.0,
+                        help='Bu kadar saniye el gorulmezse duşuk guç moduna geç (0 = kapali)')
+    parser.add_argument('--motion-gate', action='store_true',
+                        help='Durağan sahnede inference\'i atla (frame farki ile)')
+    parser.add_argument('--roi-tracking', action='store_true',
+                        help='Inference\'i son el konumu etrafindaki kirpilmiş bolgede çaliştir')
+
+    # Pipeline ayarlari
+    parser.add_argument('--queue-size', type=int, default=2, help='Aşamalar arasi kuyruk boyutu (varsayilan: 2)')
+    parser.add_argument('--backpressure', choices=BACKPRESSURE_POLICIES, default='drop_oldest',
+                        help='Kuyruk dolunca davraniş: drop_oldest (en eskiyi at) veya block (bekle)')
 
     return parser.parse_args()
 
@@ -674,19 +1341,49 @@ if __name__ == '__main__':
         settings_override = {
             'camera_index': args.camera_index,
             'camera_fps': args.fps,
+            'camera_width': args.width,
+            'camera_height': args.height,
+            'camera_fourcc': args.fourcc,
+            'source_pacing': args.pacing,
+            'source_loop': args.loop,
+            'roi_tracking': args.roi_tracking,
+            'mirror_landmarks': args.mirror_landmarks,
+            'idle_timeout': args.idle_timeout,
+            'motion_gate': args.motion_gate,
+            'inference_scale': args.inference_scale,
+            'inference_worker': args.inference_worker,
+            'max_num_hands': args.max_hands,
+            'hand_backend': args.hand_backend,
+            'hand_model_path': args.hand_model,
+            'hand_delegate': args.hand_delegate,
+            'latency_probe': args.latency_probe,
+            'latency_flash_test': args.flash_test,
+            'pipeline_queue_size': args.queue_size,
+            'pipeline_backpressure': args.backpressure,
             'tutorial_mode': args.tutorial_mode,
             'safe_mode': args.safe_mode and not args.no_safe_mode,
             'auto_calibrate': args.auto_calibrate and not args.no_auto_calibrate,
             'debug_mode': args.debug,
+            'headless': args.headless,
             'smoothing_factor': args.smoothing,
             'pinch_threshold': args.pinch_threshold,
             'confidence_minimum': args.confidence,
             'click_cooldown': args.click_cooldown,
         }
+        if args.max_processing_ms is not None:
+            settings_override['max_processing_time_ms'] = args.max_processing_ms
+        if args.no_frame_skip:
+            settings_override['skip_frames_on_lag'] = False
+        if args.source is not None:
+            settings_override['source'] = args.source
+        if args.record_trace is not None:
+            settings_override['record_trace'] = args.record_trace
+        if args.latency_report is not None:
+            settings_override['latency_report'] = args.latency_report
 
         print("HCI Gesture Control başlatiliyor...")
         print(f"Ayarlar: Tutorial={args.tutorial_mode}, Safe={settings_override['safe_mode']}, Auto-cal={settings_override['auto_calibrate']}")
-        print(f"Kamera: {args.camera_index} @ {args.fps}fps")
+        print(f"Kamera: {args.source or args.camera_index} @ {args.fps}fps")
         print(f"Hassasiyet: smoothing={args.smoothing}, confidence={args.confidence}")
 
         # Varsayilan olarak moduler sistemi çaliştir
@@ -0,0 +1,398 @@
+"""
+Toplu çevrimdişi analiz
+Kayitli videolar, goruntu klasorleri ve landmark izleri (.npz) ayri
+süreçlerde (ProcessPoolExecutor, varsayilan çekirdek başina bir worker) tam
+algilama zincirinden geçirilir: MediaPipe -> GestureDetector (SmartCursor
+filtreleri dahil) -> eylem karari. Eylemler işletim sistemine gonderilmez;
+NullActionBackend sadece sayar. Her dosya için gesture olay zaman çizelgesi,
+eylem sayilari ve aşama sureleri (okuma, inference, gesture) JSON/CSV yazilir.
+
+Komut satiri: src_python/hci-analyze (main() fonksiyonu).
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from .clock import FrameClock
+from .frame_source import PACING_FAST, open_frame_source
+from .hand_features import compute_hand_features, hand_feature_rows, hand_keys, hands_to_array
+from .image_ops import clamp_inference_scale, mirror_in_place, resize_for_inference, to_rgb
+from .inference_worker import create_mediapipe_hands
+from .landmark_trace import LandmarkTrace
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'gesture_map.json')
+
+TRACE_EXTENSIONS = ('.npz',)
+STAGES = ('decode', 'inference', 'gesture')
+EVENT_FIELDS = ('t', 'frame', 'hand', 'type', 'action', 'confidence', 'executed', 'cursor_x', 'cursor_y')
+OUTPUT_FORMATS = ('json', 'csv', 'both')
+
+
+class NullActionBackend:
+    """ActionHandler yerine - eylemleri yurutmez, sadece sayar"""
+
+    def __init__(self):
+        self.actions: Counter = Counter()
+        self.cursor_moves = 0
+
+    def move_cursor(self, x: float, y: float, pinch_active: bool = False, speed: float = 1.0, context=None):
+        self.cursor_moves += 1
+
+    def execute_action(self, gesture_data: Dict[str, Any], cursor_pos: tuple, context=None) -> bool:
+        self.actions[gesture_data.get('action')] += 1
+        return True
+
+
+class StageTimer:
+    """Aşama başina frame sureleri (ms)"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+
+    def add(self, stage: str, elapsed_ms: float):
+        self.samples[stage].append(elapsed_ms)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Aşama başina sayi, toplam, ortalama, p95 ve en buyuk sure"""
+        summary = {}
+        for stage, samples in self.samples.items():
+            if not samples:
+                continue
+            values = np.asarray(samples)
+            summary[stage] = {
+                'count': len(values),
+                'total_ms': float(values.sum()),
+                'mean_ms': float(values.mean()),
+                'p95_ms': float(np.percentile(values, 95)),
+                'max_ms': float(values.max())
+            }
+        return summary
+
+
+class GestureAnalyzer:
+    """Bir kaydin hands.process sonuçlarini GestureDetector'larla işler
+
+    Canli sistemdeki gibi her el (çoklu el modunda handedness anahtariyla)
+    kendi detektorune gider ve mesafeler tek NumPy geçişinde hesaplanir.
+    Saat frame zamanidir - bekleme sureleri kaydin hizindan bağimsizdir.
+    """
+
+    def __init__(self, config_path: str = CONFIG_PATH, max_num_hands: int = 1):
+        self.config_path = config_path
+        self.max_num_hands = max(1, max_num_hands)
+        self.clock = FrameClock()
+        self.backend = NullActionBackend()
+        self.detectors: Dict[Optional[str], Any] = {}
+
+        self.events: List[Dict[str, Any]] = []
+        self.frames = 0
+        self.hand_frames = 0
+        self._first_timestamp: Optional[float] = None
+
+    def _detector(self, hand_key: Optional[str]):
+        detector = self.detectors.get(hand_key)
+        if detector is None:
+            from core.gesture_detector import GestureDetector
+            detector = GestureDetector(self.config_path, clock=self.clock)
+            self.detectors[hand_key] = detector
+        return detector
+
+    def process(self, frame_index: int, timestamp: float, results):
+        """Tek frame'in sonucunu işle - eylemler olay listesine eklenir"""
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+        self.clock.set(timestamp)
+        self.frames += 1
+
+        hands = getattr(results, 'multi_hand_landmarks', None) or []
+        if not hands:
+            return
+        self.hand_frames += 1
+
+        points = hands_to_array(results)
+        rows = hand_feature_rows(compute_hand_features(points))
+        keys = hand_keys(results) if self.max_num_hands > 1 else [None] * len(hands)
+        for hand_points, key, row in zip(points, keys, rows):
+            detector = self._detector(key)
+            info = detector.detect_gesture(hand_points, row)
+            if info.get('type') == 'calibration':
+                continue
+
+            cursor_pos = info.get('cursor_pos', (0, 0))
+            if info.get('pinch_active'):
+                self.backend.move_cursor(cursor_pos[0], cursor_pos[1], True, 1.0)
+            if not info.get('action'):
+                continue
+
+            executed = (detector.should_execute_action(info['type'], info['action'], info.get('confidence', 0),
+                                                       info.get('stable', False))
+                        and self.backend.execute_action(info, cursor_pos))
+            self.events.append({
+                't': round(timestamp - self._first_timestamp, 4),
+                'frame': frame_index,
+                'hand': key or '',
+                'type': info.get('type'),
+                'action': info['action'],
+                'confidence': info.get('confidence', 0.0),
+                'executed': bool(executed),
+                'cursor_x': round(float(cursor_pos[0]), 1),
+                'cursor_y': round(float(cursor_pos[1]), 1)
+            })
+
+    def get_result(self) -> Dict[str, Any]:
+        """Olaylar, algilanan ve yurutulen eylem sayilari"""
+        return {
+            'frames': self.frames,
+            'hand_frames': self.hand_frames,
+            'events': self.events,
+            'actions': dict(Counter(event['action'] for event in self.events)),
+            'executed_actions': dict(self.backend.actions),
+            'cursor_moves': self.backend.cursor_moves,
+            'calibrated': bool(self.detectors) and all(detector.is_calibrated
+                                                       for detector in self.detectors.values())
+        }
+
+
+def is_trace(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in TRACE_EXTENSIONS
+
+
+def _analyze_trace(path: str, analyzer: GestureAnalyzer, timer: StageTimer) -> Dict[str, Any]:
+    """Landmark izi - inference yok, kayitli sonuçlar doğrudan işlenir"""
+    trace = LandmarkTrace.load(path)
+    for index in range(len(trace)):
+        start = time.perf_counter()
+        results = trace.results(index)
+        timer.add('decode', (time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        analyzer.process(index, float(trace.timestamps[index]), results)
+        timer.add('gesture', (time.perf_counter() - start) * 1000)
+    return {'kind': 'trace', 'duration_s': trace.duration}
+
+
+def _analyze_video(path: str, analyzer: GestureAnalyzer, timer: StageTimer, hands_factory: Callable,
+                   confidence: float, inference_scale: float, mirror: bool) -> Dict[str, Any]:
+    """Video / goruntu klasoru - her frame beklemeden okunur ve MediaPipe ile işlenir"""
+    source = open_frame_source(path, pacing=PACING_FAST)
+    if not source.isOpened():
+        raise ValueError(f"Kaynak açilamadi: {path}")
+    fps = source.get(cv2.CAP_PROP_FPS) or 30.0
+
+    hands = hands_factory(max_num_hands=analyzer.max_num_hands, confidence=confidence)
+    index = 0
+    try:
+        while True:
+            start = time.perf_counter()
+            ok, frame = source.read()
+            if not ok:
+                break
+            timer.add('decode', (time.perf_counter() - start) * 1000)
+
+            # Canli sistemle ayni girdi - ayna goruntu
+            start = time.perf_counter()
+            if mirror:
+                mirror_in_place(frame)
+            results = hands.process(resize_for_inference(to_rgb(frame), inference_scale))
+            timer.add('inference', (time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            analyzer.process(index, index / fps, results)
+            timer.add('gesture', (time.perf_counter() - start) * 1000)
+            index += 1
+    finally:
+        close = getattr(hands, 'close', None)
+        if close is not None:
+            close()
+        source.release()
+
+    return {'kind': 'images' if os.path.isdir(path) else 'video',
+            'duration_s': index / fps, 'fps': fps}
+
+
+def analyze_file(path: str, config_path: str = CONFIG_PATH, max_num_hands: int = 1, confidence: float = 0.7,
+                 inference_scale: float = 1.0, mirror: bool = True,
+                 hands_factory: Callable = create_mediapipe_hands, quiet: bool = True) -> Dict[str, Any]:
+    """Tek kaydi analiz et - hata olursa sonuçta 'error' alani dolu doner
+
+    Worker süreçte çaliştirilir; hands_factory modul seviyesinde (pickle
+    edilebilir) olmalidir. quiet açiksa detektor mesajlari bastirilir.
+    """
+    start = time.perf_counter()
+    analyzer = GestureAnalyzer(config_path, max_num_hands)
+    timer = StageTimer()
+    result: Dict[str, Any] = {'file': path, 'error': None}
+
+    output = io.StringIO() if quiet else sys.stdout
+    try:
+        with contextlib.redirect_stdout(output):
+            if is_trace(path):
+                result.update(_analyze_trace(path, analyzer, timer))
+            else:
+                result.update(_analyze_video(path, analyzer, timer, hands_factory, confidence,
+                                             clamp_inference_scale(inference_scale), mirror))
+    except Exception as e:  # Tek bozuk dosya tum analizi durdurmasin
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    result.update(analyzer.get_result())
+    result['stages'] = timer.summary()
+    result['elapsed_s'] = time.perf_counter() - start
+    return result
+
+
+def analyze_files(paths: List[str], workers: Optional[int] = None,
+                  on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+                  **options) -> List[Dict[str, Any]]:
+    """Kayitlari süreç havuzunda analiz et - sonuçlar girdi sirasiyla
+
+    workers verilmezse çekirdek sayisi kadar worker; 1 ise ayni süreçte
+    çaliştirilir. on_result her dosya bittiğinde (bitiş sirasiyla) çağrilir.
+    """
+    workers = min(workers or os.cpu_count() or 1, max(1, len(paths)))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+
+    if workers <= 1:
+        for i, path in enumerate(paths):
+            results[i] = analyze_file(path, **options)
+            if on_result is not None:
+                on_result(results[i])
+        return results  # type: ignore
+
+    # spawn - MediaPipe/OpenCV thread'leri fork ile kopyalanmasin
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('spawn')) as pool:
+        futures = {pool.submit(analyze_file, path, **options): i for i, path in enumerate(paths)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:  # Worker çoktu (bellek, sinyal)
+                results[i] = {'file': paths[i], 'error': f"{type(e).__name__}: {e}", 'events': [],
+                              'actions': {}, 'stages': {}}
+            if on_result is not None:
+                on_result(results[i])
+    return results  # type: ignore
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Tum dosyalarin toplami"""
+    actions: Counter = Counter()
+    for result in results:
+        actions.update(result.get('actions', {}))
+    return {
+        'files': len(results),
+        'failed': sum(1 for result in results if result.get('error')),
+        'frames': sum(result.get('frames', 0) for result in results),
+        'hand_frames': sum(result.get('hand_frames', 0) for result in results),
+        'actions': dict(actions)
+    }
+
+
+def write_json(results: List[Dict[str, Any]], path: str) -> str:
+    """Tum sonuçlari (olay zaman çizelgeleri dahil) tek JSON dosyasina yaz"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'summary': summarize(results), 'files': results}, f, indent=2)
+    return path
+
+
+def write_csv(results: List[Dict[str, Any]], directory: str) -> List[str]:
+    """summary.csv (dosya başina bir satir) ve dosya başina olay CSV'leri yaz"""
+    os.makedirs(directory, exist_ok=True)
+    written = []
+
+    action_names = sorted({action for result in results for action in result.get('actions', {})})
+    stage_columns = [f"{stage}_{metric}" for stage in STAGES for metric in ('mean_ms', 'p95_ms')]
+    summary_path = os.path.join(directory, 'summary.csv')
+    with open(summary_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['file', 'kind', 'frames', 'hand_frames', 'duration_s', 'elapsed_s', 'error']
+                        + [f"action_{name}" for name in action_names] + stage_columns)
+        for result in results:
+            stages = result.get('stages', {})
+            writer.writerow(
+                [result['file'], result.get('kind', ''), result.get('frames', 0), result.get('hand_frames', 0),
+                 round(result.get('duration_s', 0.0), 3), round(result.get('elapsed_s', 0.0), 3),
+                 result.get('error') or '']
+                + [result.get('actions', {}).get(name, 0) for name in action_names]
+                + [round(stages.get(stage, {}).get(metric, 0.0), 3)
+                   for stage in STAGES for metric in ('mean_ms', 'p95_ms')])
+    written.append(summary_path)
+
+    for i, result in enumerate(results):
+        name = os.path.splitext(os.path.basename(os.path.normpath(result['file'])))[0]
+        events_path = os.path.join(directory, f"{i:03d}_{name}.events.csv")
+        with open(events_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=EVENT_FIELDS)
+            writer.writeheader()
+            writer.writerows(result.get('events', []))
+        written.append(events_path)
+    return written
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Komut satiri argumanlarini parse et"""
+    parser = argparse.ArgumentParser(
+        prog='hci-analyze',
+        description='Kayitli videolar / goruntu klasorleri / landmark izleri uzerinde toplu gesture analizi')
+    parser.add_argument('inputs', nargs='+', help='Video dosyalari, goruntu klasorleri ya da .npz izleri')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Paralel worker süreç sayisi (varsayilan: çekirdek sayisi, 1 = ayni süreçte)')
+    parser.add_argument('--output', default='analysis', help='Sonuç klasoru (varsayilan: analysis)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='both', help='Çikti formati')
+    parser.add_argument('--config', default=CONFIG_PATH, help='Gesture konfigurasyon dosyasi')
+    parser.add_argument('--max-hands', type=int, default=1, help='Frame başina en fazla el sayisi')
+    parser.add_argument('--confidence', type=float, default=0.7, help='MediaPipe minimum guven seviyesi')
+    parser.add_argument('--inference-scale', type=float, default=1.0, help='Inference oncesi goruntu olçeği')
+    parser.add_argument('--no-mirror', action='store_true',
+                        help='Videolari aynalamadan işle (kayit zaten aynalanmişsa)')
+    parser.add_argument('--verbose', action='store_true', help='Detektor çiktisini gizleme')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    missing = [path for path in args.inputs if not os.path.exists(path)]
+    if missing:
+        for path in missing:
+            print(f"[X] Bulunamadi: {path}")
+        return 1
+
+    def report(result):
+        if result.get('error'):
+            print(f"[X] {result['file']}: {result['error']}")
+        else:
+            print(f"[✓] {result['file']}: {result['frames']} frame ({result['hand_frames']} elli), "
+                  f"{len(result['events'])} olay, {result['elapsed_s']:.1f}s")
+
+    start = time.perf_counter()
+    results = analyze_files(args.inputs, workers=args.workers, on_result=report,
+                            config_path=args.config, max_num_hands=args.max_hands,
+                            confidence=args.confidence, inference_scale=args.inference_scale,
+                            mirror=not args.no_mirror, quiet=not args.verbose)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(args.output, exist_ok=True)
+    if args.format in ('json', 'both'):
+        print(f"JSON: {write_json(results, os.path.join(args.output, 'analysis.json'))}")
+    if args.format in ('csv', 'both'):
+        print(f"CSV: {write_csv(results, args.output)[0]} (+ dosya başina olaylar)")
+
+    summary = summarize(results)
+    print(f"{summary['files']} dosya, {summary['frames']} frame, {elapsed:.1f}s "
+          f"({summary['failed']} hatali)")
+    for action, count in sorted(summary['actions'].items(), key=lambda item: -item[1]):
+        print(f"   {action}: {count}")
+    return 1 if summary['failed'] == summary['files'] else 0
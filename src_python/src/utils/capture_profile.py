@@ -0,0 +1,111 @@
+"""
+Kamera yakalama profili
+Kameradan çozunurluk, FPS ve fourcc (MJPG/YUYV) ister, surucunun gerçekte
+verdiği değerleri geri okur. İstenen profil desteklenmiyorsa aday listesinde
+sirayla bir sonrakine geçer.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import cv2
+
+# Aday profiller - once dusuk bant genişlikli MJPG denenir
+DEFAULT_CAPTURE_PROFILES = [
+    {'width': 640, 'height': 480, 'fourcc': 'MJPG'},
+    {'width': 640, 'height': 480, 'fourcc': 'YUYV'},
+    {'width': 1280, 'height': 720, 'fourcc': 'MJPG'},
+    {'width': 320, 'height': 240, 'fourcc': 'YUYV'},
+]
+
+
+def fourcc_to_str(code: float) -> str:
+    """CAP_PROP_FOURCC değerini 4 karakterlik koda çevir"""
+    code = int(code)
+    if code <= 0:
+        return ''
+    return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00 ')
+
+
+def read_capture_profile(capture) -> Dict[str, Any]:
+    """Kameranin şu anki (surucunun kabul ettiği) profilini oku"""
+    return {
+        'width': int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        'height': int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        'fps': float(capture.get(cv2.CAP_PROP_FPS)),
+        'fourcc': fourcc_to_str(capture.get(cv2.CAP_PROP_FOURCC))
+    }
+
+
+def apply_capture_profile(capture, profile: Dict[str, Any], fps: Optional[float] = None) -> Dict[str, Any]:
+    """Tek bir profili iste ve surucunun verdiği profili dondur"""
+    # Fourcc once ayarlanmali - bazi V4L2 suruculeri çozunurluğu fourcc'ye gore sinirlar
+    fourcc = profile.get('fourcc')
+    if fourcc:
+        capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc[:4].ljust(4)))
+
+    if profile.get('width'):
+        capture.set(cv2.CAP_PROP_FRAME_WIDTH, profile['width'])
+    if profile.get('height'):
+        capture.set(cv2.CAP_PROP_FRAME_HEIGHT, profile['height'])
+
+    requested_fps = fps if fps is not None else profile.get('fps')
+    if requested_fps:
+        capture.set(cv2.CAP_PROP_FPS, requested_fps)
+
+    return read_capture_profile(capture)
+
+
+def _profile_mismatches(requested: Dict[str, Any], effective: Dict[str, Any]) -> int:
+    """Surucunun vermediği istenen alan sayisi (genişlik, yukseklik, fourcc)"""
+    mismatches = 0
+    if requested.get('width') and effective['width'] != requested['width']:
+        mismatches += 1
+    if requested.get('height') and effective['height'] != requested['height']:
+        mismatches += 1
+    if requested.get('fourcc') and effective['fourcc'] and effective['fourcc'] != requested['fourcc']:
+        mismatches += 1
+    return mismatches
+
+
+def negotiate_capture_profile(capture, fps: Optional[float] = None,
+                              candidates: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Aday profilleri sirayla dene, ilk kabul edileni kullan
+
+    Hiçbiri tam kabul edilmezse en az alani tutmayan aday (eşitlikte listede
+    once gelen, yani tercih edilen) yeniden istenir; kamera son denenen
+    yedek profilde kalmaz ('matched': False).
+    """
+    if candidates is None:
+        candidates = DEFAULT_CAPTURE_PROFILES
+
+    effective = read_capture_profile(capture)
+    best = None
+    best_mismatches = None
+    for requested in candidates:
+        effective = apply_capture_profile(capture, requested, fps)
+        mismatches = _profile_mismatches(requested, effective)
+        if mismatches == 0:
+            return {**effective, 'requested': dict(requested, fps=fps), 'matched': True}
+        if best_mismatches is None or mismatches < best_mismatches:
+            best, best_mismatches = requested, mismatches
+
+    if best is None:
+        return {**effective, 'requested': {}, 'matched': False}
+    if best is not candidates[-1]:
+        effective = apply_capture_profile(capture, best, fps)
+    return {**effective, 'requested': dict(best, fps=fps), 'matched': False}
+
+
+def build_capture_candidates(settings: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Ayarlardaki profili başa koyarak aday listesini oluştur"""
+    preferred = {
+        'width': settings.get('camera_width'),
+        'height': settings.get('camera_height'),
+        'fourcc': (settings.get('camera_fourcc') or '').upper()
+    }
+
+    candidates = [preferred]
+    for profile in DEFAULT_CAPTURE_PROFILES:
+        if profile != preferred:
+            candidates.append(profile)
+    return candidates
@@ -0,0 +1,55 @@
+"""
+Saat arayuzu
+Detektor, filtreler ve eylem yoneticisi zamani doğrudan time.time() yerine
+verilen saatten okur. Saat, saniye cinsinden float donduren herhangi bir
+çağrilabilir nesnedir (time.time dahil). Canli çalişmada duvar saati,
+kayit tekrarinda frame zaman damgasi ya da elle ilerletilen sanal saat
+kullanilir - bekleme sureleri ve kalibrasyon tekrarda da ayni davranir.
+"""
+
+import time
+from typing import Callable, Optional
+
+Clock = Callable[[], float]
+
+
+class WallClock:
+    """Gerçek zaman - time.time()"""
+
+    def __call__(self) -> float:
+        return time.time()
+
+
+class FrameClock:
+    """İşlenen frame'in yakalama zamani
+
+    set() ile her frame'den once guncellenir; henuz frame yoksa yedek saat
+    (varsayilan duvar saati) kullanilir.
+    """
+
+    def __init__(self, fallback: Optional[Clock] = None):
+        self.fallback = fallback or time.time
+        self.timestamp: Optional[float] = None
+
+    def set(self, timestamp: float):
+        self.timestamp = timestamp
+
+    def __call__(self) -> float:
+        return self.timestamp if self.timestamp is not None else self.fallback()
+
+
+class VirtualClock:
+    """Elle ilerletilen saat - testler ve sabit adimli simulasyon için"""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def set(self, timestamp: float):
+        self.now = timestamp
+
+    def advance(self, seconds: float) -> float:
+        self.now += seconds
+        return self.now
+
+    def __call__(self) -> float:
+        return self.now
@@ -0,0 +1,29 @@
+"""
+Frame bağlami
+Her frame yakalandiği anin zaman damgasini (kamerada grab() hemen sonrasi,
+kayitli kaynakta medya zamani) taşir. Detektor, filtreler ve eylem
+yoneticisi işleme anindaki saat yerine bu zamani kullanir - işleme
+gecikmesindeki dalgalanma el hizi olarak okunmaz, yakalamadan eyleme kadar
+geçen gerçek gecikme olçulebilir.
+"""
+
+import time
+from typing import Any, Callable, Optional
+
+
+class FrameContext:
+    """Tek frame'in kimliği ve yakalama zamani (time.time tabaninda)"""
+
+    __slots__ = ('frame_id', 'capture_time', 'camera_id')
+
+    def __init__(self, frame_id: int, capture_time: float, camera_id: Optional[Any] = None):
+        self.frame_id = frame_id
+        self.capture_time = capture_time
+        self.camera_id = camera_id
+
+    def age_ms(self, now: Optional[float] = None, clock: Callable[[], float] = time.time) -> float:
+        """Yakalamadan bu yana geçen sure (ms)"""
+        return ((clock() if now is None else now) - self.capture_time) * 1000
+
+    def __repr__(self) -> str:
+        return f"FrameContext(frame_id={self.frame_id}, capture_time={self.capture_time:.3f})"
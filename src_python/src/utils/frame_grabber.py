@@ -0,0 +1,194 @@
+"""
+Thread'li kamera okuyucu
+Kamera okumasini ayri bir thread'e tasir, sadece en yeni frame'i tutar ve
+eskimiş frame'leri atar. Boylece inference kameradan yavaş kalsa bile
+gecikme bir inference suresiyle sinirli kalir. Kayitli kaynaklar hizli
+okunurken (lossless) frame atilmaz - slot tuketilene kadar beklenir.
+decode_interval verilirse (boşta guç modu) frame'ler kameradan alinmaya
+devam eder ama sadece bu aralikla decode edilir; kamera tamponu taze kalir.
+Kaynak kendi yakalama zamanini veriyorsa (FrameSource.frame_time) o,
+vermiyorsa okuma hemen sonrasi saat frame'in zaman damgasi olur.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .frame_context import FrameContext
+
+
+class LatestFrameGrabber:
+    """Tek slotlu frame tamponu - yakalama thread'i + en yeni frame"""
+
+    def __init__(self, capture, name: str = "hci-frame-grabber", pool=None, lossless: bool = False,
+                 clock: Callable[[], float] = time.time, release_previous: bool = False):
+        self.capture = capture
+        self.name = name
+        self.clock = clock
+
+        # True ise eski frame atilmaz, yakalama tuketiciyi bekler (benchmark / tekrar oynatma)
+        self.lossless = lossless
+
+        # Opsiyonel FramePool - verilirse cap.read(image=...) ile tamponlar yeniden kullanilir.
+        # Grabber yazilan ve slottaki iki tamponu tutar; teslim edilen frame tuketicinindir
+        # ve release() ile geri verilene kadar uzerine yazilmaz. release_previous=True ise
+        # (tek thread'li donguler) onceki frame bir sonraki read()'de geri verilir.
+        self.pool = pool
+        self.release_previous = release_previous
+        self._delivered_frame = None
+
+        # >0 ise iki decode arasi en az bu kadar saniye - aradaki frame'ler sadece grab()
+        # ile alinir (kaynakta grab() yoksa ya da lossless modda her frame okunur)
+        self.decode_interval = 0.0
+        self._decode_time = float('-inf')
+
+        # Tek slot: sadece en son yakalanan frame tutulur
+        self._condition = threading.Condition()
+        self._frame = None
+        self._frame_id = 0
+        self._consumed_id = 0
+        self._frame_time = 0.0
+        self._delivered_time = 0.0
+        self._capture_ok = True
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # İstatistikler
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self.frames_not_decoded = 0
+        self.last_capture_time = 0.0
+
+    def start(self) -> 'LatestFrameGrabber':
+        """Yakalama thread'ini başlat"""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+
+        self._stop_event.clear()
+        self._capture_ok = True
+        self._thread = threading.Thread(target=self._capture_loop, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def _capture_loop(self):
+        """Kameradan surekli oku, slotu en yeni frame ile değiştir"""
+        can_grab = not self.lossless and hasattr(self.capture, 'grab')
+        while not self._stop_event.is_set():
+            if can_grab and self.decode_interval > 0 and self.clock() - self._decode_time < self.decode_interval:
+                # Boşta: frame alinir ama decode edilmez
+                if self.capture.grab():
+                    self.frames_not_decoded += 1
+                    continue
+                with self._condition:
+                    self._capture_ok = False
+                    self._condition.notify_all()
+                break
+
+            self._decode_time = self.clock()
+            if self.pool is not None:
+                buffer = self.pool.acquire()
+                ok, frame = self.capture.read(image=buffer)
+                self.pool.adopt(buffer, frame if ok else None)
+            else:
+                ok, frame = self.capture.read()
+            capture_time = getattr(self.capture, 'frame_time', None) or self.clock()
+
+            with self._condition:
+                if not ok:
+                    if self.pool is not None:
+                        self.pool.release(buffer)
+                    self._capture_ok = False
+                    self._condition.notify_all()
+                    break
+
+                if self.lossless:
+                    self._condition.wait_for(
+                        lambda: self._frame_id == self._consumed_id or self._stop_event.is_set())
+                    if self._stop_event.is_set():
+                        break
+
+                # Tuketilmemiş frame uzerine yaziliyorsa eskimiş demektir - tamponu
+                # kimseye verilmedi, hemen tekrar kullanilir
+                if self._frame is not None and self._frame_id != self._consumed_id:
+                    self.frames_dropped += 1
+                    if self.pool is not None:
+                        self.pool.release(self._frame)
+
+                self._frame = frame
+                self._frame_time = capture_time
+                self._frame_id += 1
+                self.frames_captured += 1
+                self.last_capture_time = capture_time
+                self._condition.notify_all()
+
+    def read(self, timeout: Optional[float] = None) -> Tuple[bool, Optional[Any]]:
+        """En yeni frame'i dondur - cv2.VideoCapture.read() ile ayni imza
+
+        Yeni bir frame gelene kadar bekler; ayni frame iki kez verilmez.
+        Kamera hatasi, durdurma veya timeout durumunda (False, None) doner.
+        """
+        with self._condition:
+            has_new = self._condition.wait_for(
+                lambda: (self._frame_id != self._consumed_id or
+                         not self._capture_ok or self._stop_event.is_set()),
+                timeout=timeout
+            )
+
+            if not has_new or self._frame_id == self._consumed_id:
+                return False, None
+
+            self._consumed_id = self._frame_id
+            self._delivered_time = self._frame_time
+            self.frames_delivered += 1
+            if self.pool is not None and self.release_previous:
+                # Tek thread'li tuketici onceki frame ile işini bitirdi
+                self.pool.release(self._delivered_frame)
+                self._delivered_frame = self._frame
+            self._condition.notify_all()
+            return True, self._frame
+
+    def release(self, frame):
+        """Tuketici frame ile işini bitirdi - tamponu havuza geri ver"""
+        if self.pool is not None:
+            self.pool.release(frame)
+
+    @property
+    def last_frame_id(self) -> int:
+        """Son teslim edilen frame'in sira numarasi"""
+        return self._consumed_id
+
+    @property
+    def has_new_frame(self) -> bool:
+        """Henuz teslim edilmemiş frame var mi? (beklemeden)"""
+        return self._frame_id != self._consumed_id
+
+    def frame_context(self, camera_id: Optional[Any] = None) -> FrameContext:
+        """Son teslim edilen frame'in bağlami - pipeline boyunca taşinir"""
+        return FrameContext(self._consumed_id, self._delivered_time, camera_id)
+
+    def isOpened(self) -> bool:
+        """Kamera açik ve okuma devam ediyor mu?"""
+        return self._capture_ok and self.capture.isOpened()
+
+    def stop(self, timeout: float = 2.0):
+        """Yakalama thread'ini durdur (kamerayi serbest birakmaz)"""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Yakalama istatistikleri"""
+        return {
+            'frames_captured': self.frames_captured,
+            'frames_delivered': self.frames_delivered,
+            'frames_dropped': self.frames_dropped,
+            'frames_not_decoded': self.frames_not_decoded,
+            'drop_rate': self.frames_dropped / self.frames_captured if self.frames_captured else 0.0,
+            'last_capture_time': self.last_capture_time
+        }
@@ -0,0 +1,95 @@
+"""
+Frame zamanlayici
+gesture_map.json'daki settings.performance butçesine gore inference
+yapilacak frame'leri seçer. İşleme suresi butçeyi aşarsa bazi frame'lerde
+inference atlanir (son landmark'lar ve imleç tahmini kullanilir); yuk
+azalinca normal hiza geri donulur.
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+
+def frame_budget_ms(performance: Dict[str, Any]) -> float:
+    """settings.performance butçesi - max_processing_time_ms yoksa target_fps'in frame suresi"""
+    if performance.get('max_processing_time_ms') is not None:
+        return float(performance['max_processing_time_ms'])
+    return 1000.0 / max(1, performance.get('target_fps', 30))
+
+
+class FrameScheduler:
+    """İşleme suresi butçesine gore frame atlama karari verir"""
+
+    def __init__(self, max_processing_time_ms: float = 33.0, skip_frames_on_lag: bool = True,
+                 max_skip: int = 3, smoothing: float = 0.2, recover_ratio: float = 0.8):
+        self.budget_ms = float(max_processing_time_ms)
+        self.enabled = bool(skip_frames_on_lag) and self.budget_ms > 0
+        self.max_skip = max(0, int(max_skip))    # İki inference arasinda en fazla atlanacak frame
+        self.smoothing = smoothing               # İşleme suresi EMA katsayisi
+        self.recover_ratio = recover_ratio       # EMA butçenin bu oranin altina inince atlama azalir
+
+        self.avg_processing_ms: Optional[float] = None
+        self.skip_interval = 0   # Her inference'tan sonra atlanacak frame sayisi
+        self._pending_skips = 0
+
+        # İstatistikler
+        self.frames_inferred = 0
+        self.frames_skipped = 0
+        self.over_budget_count = 0
+        self.max_skip_used = 0
+
+    def should_infer(self) -> bool:
+        """Bu frame'de inference yapilmali mi?"""
+        if self._pending_skips > 0:
+            self._pending_skips -= 1
+            self.frames_skipped += 1
+            return False
+
+        self.frames_inferred += 1
+        return True
+
+    def record(self, processing_ms: float):
+        """Inference yapilan frame'in işleme suresini kaydet ve atlama araliğini guncelle"""
+        if self.avg_processing_ms is None:
+            self.avg_processing_ms = processing_ms
+        else:
+            self.avg_processing_ms += (processing_ms - self.avg_processing_ms) * self.smoothing
+
+        if processing_ms > self.budget_ms:
+            self.over_budget_count += 1
+
+        if not self.enabled:
+            return
+
+        avg = self.avg_processing_ms
+        if avg > self.budget_ms:
+            # Frame başina ortalama maliyet butçeye inecek kadar atla
+            needed = min(self.max_skip, math.ceil(avg / self.budget_ms) - 1)
+            self.skip_interval = max(self.skip_interval, needed)
+        elif self.skip_interval > 0 and avg < self.budget_ms * self.recover_ratio:
+            # Yuk azaldi - kademeli olarak normal hiza don
+            self.skip_interval -= 1
+
+        self.max_skip_used = max(self.max_skip_used, self.skip_interval)
+        self._pending_skips = self.skip_interval
+
+    def reset(self):
+        """Zamanlayiciyi sifirla"""
+        self.avg_processing_ms = None
+        self.skip_interval = 0
+        self._pending_skips = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Zamanlama istatistikleri"""
+        total = self.frames_inferred + self.frames_skipped
+        return {
+            'enabled': self.enabled,
+            'budget_ms': self.budget_ms,
+            'avg_processing_ms': self.avg_processing_ms or 0.0,
+            'skip_interval': self.skip_interval,
+            'max_skip_used': self.max_skip_used,
+            'frames_inferred': self.frames_inferred,
+            'frames_skipped': self.frames_skipped,
+            'skip_rate': self.frames_skipped / total if total else 0.0,
+            'over_budget_count': self.over_budget_count
+        }
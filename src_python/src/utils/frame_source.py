@@ -0,0 +1,285 @@
+"""
+Frame kaynaklari
+Canli kamera, video dosyasi ve goruntu klasoru ayni arayuzle okunur
+(cv2.VideoCapture ile ayni read/get/set/isOpened/release imzalari). Kayitli
+kaynaklar gerçek zamanli (dosyanin FPS'inde) ya da olabildiğince hizli
+okunabilir - kamerasiz makinelerde tum pipeline ayni girdiyle olçulur.
+"""
+
+import glob
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+PACING_REALTIME = 'realtime'  # Kaynağin FPS'inde oku (canli kamera gibi)
+PACING_FAST = 'fast'          # Bekleme yok - her frame işlenir, hiçbiri atilmaz
+PACING_MODES = (PACING_REALTIME, PACING_FAST)
+
+IMAGE_EXTENSIONS = ('*.png', '*.jpg', '*.jpeg', '*.bmp')
+
+
+class FrameSource(ABC):
+    """Frame kaynaği temel sinifi - cv2.VideoCapture uyumlu arayuz"""
+
+    live = False  # Canli kaynak (kamera) - hiz kaynağa bağli, pacing uygulanmaz
+
+    def __init__(self, pacing: str = PACING_REALTIME, fps: Optional[float] = None, loop: bool = False):
+        if pacing not in PACING_MODES:
+            raise ValueError(f"Geçersiz pacing: {pacing} (seçenekler: {', '.join(PACING_MODES)})")
+        self.pacing = pacing
+        self.fps = fps
+        self.loop = loop
+
+        self._start_time: Optional[float] = None
+        self._time_base: Optional[float] = None
+
+        # Son okunan frame'in yakalama zamani (time.time tabaninda)
+        self.frame_time: Optional[float] = None
+
+        # İstatistikler
+        self.frames_read = 0
+        self.loops = 0
+
+    @property
+    def lossless(self) -> bool:
+        """Frame atilmamali mi? - hizli okumada her frame işlenir"""
+        return not self.live and self.pacing == PACING_FAST
+
+    @property
+    def description(self) -> str:
+        return self.__class__.__name__
+
+    def _pace(self):
+        """Gerçek zamanli modda sonraki frame'in zamanina kadar bekle"""
+        now = time.perf_counter()
+        if self._start_time is None:
+            self._start_time = now
+            return
+
+        if self.live or self.pacing != PACING_REALTIME or not self.fps:
+            return
+
+        due = self._start_time + self.frames_read / self.fps
+        if due > now:
+            time.sleep(due - now)
+
+    @abstractmethod
+    def _read_frame(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """Kaynaktan bir frame oku - pacing ve dongu read() içinde"""
+
+    def _rewind(self) -> bool:
+        """Başa don - desteklenmiyorsa False"""
+        return False
+
+    def _frame_timestamp(self) -> float:
+        """Okunan frame'in yakalama zamani - kayitli kaynakta medya zamani
+
+        İlk frame okunduğu anin duvar saati, sonrakiler FPS adimlariyla ilerler;
+        hizli okumada da zaman kaydin hizinda akar (donguler dahil).
+        """
+        if self._time_base is None:
+            self._time_base = time.time()
+        if not self.fps:
+            return time.time()
+        return self._time_base + (self.frames_read - 1) / self.fps
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """Sonraki frame - image verilirse (uygun boyuttaysa) ona yazilir"""
+        self._pace()
+
+        ok, frame = self._read_frame(image)
+        if not ok and self.loop and self.frames_read > 0 and self._rewind():
+            self.loops += 1
+            ok, frame = self._read_frame(image)
+
+        if ok:
+            self.frames_read += 1
+            self.frame_time = self._frame_timestamp()
+        return ok, frame
+
+    def grab(self) -> bool:
+        """Sonraki frame'i al ama dondurme - kayitli kaynakta okuyup atar"""
+        ok, _ = self.read()
+        return ok
+
+    @abstractmethod
+    def isOpened(self) -> bool:
+        """Kaynak açik ve okunabilir mi"""
+
+    def release(self):
+        pass
+
+    def get(self, prop_id: int) -> float:
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Okuma istatistikleri"""
+        elapsed = time.perf_counter() - self._start_time if self._start_time is not None else 0.0
+        return {
+            'source': self.description,
+            'pacing': 'live' if self.live else self.pacing,
+            'frames_read': self.frames_read,
+            'loops': self.loops,
+            'elapsed_s': elapsed,
+            'read_fps': self.frames_read / elapsed if elapsed > 0 else 0.0
+        }
+
+
+class CameraSource(FrameSource):
+    """Canli kamera - cv2.VideoCapture'a yonlendirir"""
+
+    live = True
+
+    def __init__(self, camera_index: int = 0):
+        super().__init__()
+        self.camera_index = camera_index
+        self.capture = cv2.VideoCapture(camera_index)
+        self._grab_time = 0.0
+
+    @property
+    def description(self) -> str:
+        return f"kamera {self.camera_index}"
+
+    def _read_frame(self, image=None):
+        # Zaman damgasi grab() hemen sonrasi - decode (MJPG) suresi dahil edilmez
+        if not self.capture.grab():
+            return False, None
+        self._grab_time = time.time()
+        if image is not None:
+            return self.capture.retrieve(image=image)
+        return self.capture.retrieve()
+
+    def _frame_timestamp(self) -> float:
+        return self._grab_time
+
+    def grab(self) -> bool:
+        """Frame'i kameradan al, decode etme (boşta modda atlanan frame'ler)"""
+        ok = self.capture.grab()
+        if ok:
+            self.frames_read += 1
+        return ok
+
+    def isOpened(self) -> bool:
+        return self.capture.isOpened()
+
+    def release(self):
+        self.capture.release()
+
+    def get(self, prop_id: int) -> float:
+        return self.capture.get(prop_id)
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return self.capture.set(prop_id, value)
+
+
+class VideoFileSource(FrameSource):
+    """Video dosyasi - FPS dosyadan okunur (yoksa 30)"""
+
+    def __init__(self, path: str, pacing: str = PACING_REALTIME, loop: bool = False,
+                 fps: Optional[float] = None):
+        super().__init__(pacing=pacing, fps=fps, loop=loop)
+        self.path = path
+        self.capture = cv2.VideoCapture(path)
+        if self.fps is None:
+            self.fps = self.capture.get(cv2.CAP_PROP_FPS) or 30.0
+
+    @property
+    def description(self) -> str:
+        return f"video {os.path.basename(self.path)}"
+
+    def _read_frame(self, image=None):
+        if image is not None:
+            return self.capture.read(image=image)
+        return self.capture.read()
+
+    def _rewind(self) -> bool:
+        return self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def isOpened(self) -> bool:
+        return self.capture.isOpened()
+
+    def release(self):
+        self.capture.release()
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        return self.capture.get(prop_id)
+
+
+class ImageSequenceSource(FrameSource):
+    """Goruntu klasoru - dosyalar ad sirasiyla, verilen FPS'te okunur"""
+
+    def __init__(self, directory: str, pacing: str = PACING_REALTIME, loop: bool = False,
+                 fps: Optional[float] = None):
+        super().__init__(pacing=pacing, fps=fps or 30.0, loop=loop)
+        self.directory = directory
+        self.files: List[str] = sorted(f for pattern in IMAGE_EXTENSIONS
+                                       for f in glob.glob(os.path.join(directory, pattern)))
+        self._index = 0
+        self._shape: Optional[Tuple[int, ...]] = None
+
+        # Boyut bilgisi için ilk goruntuyu oku
+        if self.files:
+            first = cv2.imread(self.files[0])
+            if first is not None:
+                self._shape = first.shape
+
+    @property
+    def description(self) -> str:
+        return f"goruntu klasoru {self.directory} ({len(self.files)} dosya)"
+
+    def _read_frame(self, image=None):
+        while self._index < len(self.files):
+            frame = cv2.imread(self.files[self._index])
+            self._index += 1
+            if frame is None:
+                continue
+            if image is not None and image.shape == frame.shape and image.dtype == frame.dtype:
+                np.copyto(image, frame)
+                return True, image
+            return True, frame
+        return False, None
+
+    def _rewind(self) -> bool:
+        self._index = 0
+        return bool(self.files)
+
+    def isOpened(self) -> bool:
+        return self._shape is not None
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        if self._shape is None:
+            return 0.0
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self._shape[1])
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self._shape[0])
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.files))
+        return 0.0
+
+
+def open_frame_source(source: Union[int, str, None] = 0, pacing: str = PACING_REALTIME,
+                      loop: bool = False, fps: Optional[float] = None) -> FrameSource:
+    """Kaynak tanimindan uygun FrameSource oluştur
+
+    Tamsayi (ya da rakam dizisi) -> kamera, klasor -> goruntu dizisi,
+    diğer yollar -> video dosyasi. Açilip açilmadiği isOpened() ile kontrol edilmeli.
+    """
+    if source is None or source == '':
+        source = 0
+    if isinstance(source, int) or str(source).isdigit():
+        return CameraSource(int(source))
+    if os.path.isdir(source):
+        return ImageSequenceSource(source, pacing=pacing, loop=loop, fps=fps)
+    return VideoFileSource(source, pacing=pacing, loop=loop, fps=fps)
@@ -0,0 +1,266 @@
+"""
+El landmark arka uçlari
+Algilama dongusu el algilayiciyi sadece process(rgb) -> sonuç arayuzuyle
+kullanir; sonuç her zaman multi_hand_landmarks / multi_handedness alanli
+(mp.solutions.hands ile ayni) yapidir. İki arka uç var:
+
+- solutions: eski senkron mp.solutions.hands - process() inference bitene
+  kadar bekler.
+- tasks: MediaPipe Tasks HandLandmarker, LIVE_STREAM modunda. process()
+  frame'i detect_async ile gonderir ve beklemeden son tamamlanan sonucu
+  dondurur; sonuç callback'i MediaPipe thread'inde gelir. Yakalama ve gesture
+  işleme inference'i beklemez. Model dosyasi ve delegate (cpu/gpu) seçilebilir.
+
+Tasks sonuçlari detektorun beklediği yapiya (landmark_trace.TraceHand)
+normalize edilir. Async sonuç bir onceki frame'e ait olabilir - bu yuzden
+kirpilmiş bolge (ROI) takibi bu arka uçla kullanilmaz.
+"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .landmark_trace import HANDEDNESS_CODES, HANDEDNESS_UNKNOWN, results_from_arrays
+
+NUM_LANDMARKS = 21
+
+BACKEND_SOLUTIONS = 'solutions'
+BACKEND_TASKS = 'tasks'
+HAND_BACKENDS = (BACKEND_SOLUTIONS, BACKEND_TASKS)
+
+DELEGATES = ('cpu', 'gpu')
+DEFAULT_MODEL_PATH = 'models/hand_landmarker.task'
+MODEL_URL = ('https://storage.googleapis.com/mediapipe-models/hand_landmarker/'
+             'hand_landmarker/float16/latest/hand_landmarker.task')
+
+
+def normalize_landmarker_result(result) -> Tuple[np.ndarray, List[int]]:
+    """HandLandmarkerResult -> ((el sayisi, 21, 3) dizi, yon kodlari)"""
+    hands = getattr(result, 'hand_landmarks', None) or []
+    handedness = getattr(result, 'handedness', None) or []
+
+    landmarks = np.array([[(lm.x, lm.y, lm.z) for lm in hand] for hand in hands],
+                         dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+    codes = []
+    for i in range(len(hands)):
+        try:
+            codes.append(HANDEDNESS_CODES.get(handedness[i][0].category_name, HANDEDNESS_UNKNOWN))
+        except (AttributeError, IndexError):
+            codes.append(HANDEDNESS_UNKNOWN)
+    return landmarks, codes
+
+
+class HandBackend(ABC):
+    """El algilayici arayuzu - process(rgb) ve context manager"""
+
+    name = ''
+    asynchronous = False  # True ise process() sonucu onceki bir frame'e ait olabilir
+
+    @abstractmethod
+    def process(self, image: np.ndarray):
+        """RGB frame -> multi_hand_landmarks / multi_handedness alanli sonuç"""
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> 'HandBackend':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'backend': self.name}
+
+
+class SolutionsHandsBackend(HandBackend):
+    """Eski senkron mp.solutions.hands"""
+
+    name = BACKEND_SOLUTIONS
+
+    def __init__(self, max_num_hands: int = 1, confidence: float = 0.7):
+        import mediapipe
+        self.hands = mediapipe.solutions.hands.Hands(max_num_hands=max_num_hands,  # type: ignore
+                                                     min_detection_confidence=confidence,
+                                                     min_tracking_confidence=confidence)
+        self.frames = 0
+        self.infer_time_sum = 0.0
+
+    def process(self, image: np.ndarray):
+        start = time.perf_counter()
+        results = self.hands.process(image)
+        self.infer_time_sum += (time.perf_counter() - start) * 1000
+        self.frames += 1
+        return results
+
+    def close(self):
+        self.hands.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'backend': self.name,
+            'frames': self.frames,
+            'avg_infer_ms': self.infer_time_sum / self.frames if self.frames else 0.0
+        }
+
+
+class _TasksLandmarker:
+    """MediaPipe Tasks HandLandmarker (LIVE_STREAM) - numpy RGB kabul eder"""
+
+    def __init__(self, result_callback: Callable, model_path: str, max_num_hands: int,
+                 confidence: float, delegate: str):
+        import mediapipe
+        self._mp = mediapipe
+        vision = mediapipe.tasks.vision
+        base_options = mediapipe.tasks.BaseOptions(
+            model_asset_path=model_path,
+            delegate=(mediapipe.tasks.BaseOptions.Delegate.GPU if delegate == 'gpu'
+                      else mediapipe.tasks.BaseOptions.Delegate.CPU))
+        options = vision.HandLandmarkerOptions(
+            base_options=base_options,
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=confidence,
+            min_hand_presence_confidence=confidence,
+            min_tracking_confidence=confidence,
+            result_callback=lambda result, image, timestamp_ms: result_callback(result, timestamp_ms))
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def detect_async(self, image: np.ndarray, timestamp_ms: int):
+        mp_image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=np.ascontiguousarray(image))
+        self.landmarker.detect_async(mp_image, timestamp_ms)
+
+    def close(self):
+        self.landmarker.close()
+
+
+class HandLandmarkerBackend(HandBackend):
+    """Tasks HandLandmarker, LIVE_STREAM - process() inference'i beklemez
+
+    Onceki frame hala işleniyorsa (max_in_flight dolu) yeni frame gonderilmez
+    (atlanir); result_timeout içinde sonucu gelmeyen frame (MediaPipe'in
+    kendi attiği) beklenmez. process() her çağrida son tamamlanan sonucun
+    yeni bir kopyasini dondurur - çağiran taraf (landmark aynalama) sonucu
+    yerinde değiştirebilir. landmarker_factory testler için:
+    factory(callback) -> detect_async/close nesnesi.
+    """
+
+    name = BACKEND_TASKS
+    asynchronous = True
+
+    def __init__(self, model_path: str = DEFAULT_MODEL_PATH, max_num_hands: int = 1, confidence: float = 0.7,
+                 delegate: str = 'cpu', max_in_flight: int = 1, result_timeout: float = 1.0,
+                 landmarker_factory: Optional[Callable[[Callable], Any]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if delegate not in DELEGATES:
+            raise ValueError(f"Geçersiz delegate: {delegate} (seçenekler: {', '.join(DELEGATES)})")
+        self.model_path = model_path
+        self.delegate = delegate
+        self.max_in_flight = max(1, max_in_flight)
+        self.result_timeout = result_timeout
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._in_flight: Dict[int, float] = {}   # timestamp_ms -> gonderim zamani
+        self._last_timestamp_ms = -1
+        self._landmarks = np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._handedness: List[int] = []
+        self.result_timestamp_ms: Optional[int] = None   # Son sonucun ait olduğu frame
+
+        # İstatistikler
+        self.frames_submitted = 0
+        self.frames_dropped = 0
+        self.frames_expired = 0
+        self.results_received = 0
+        self.latency_sum_ms = 0.0
+
+        if landmarker_factory is None:
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"HandLandmarker modeli bulunamadi: {model_path} ({MODEL_URL})")
+            self.landmarker = _TasksLandmarker(self._on_result, model_path, max_num_hands, confidence, delegate)
+        else:
+            self.landmarker = landmarker_factory(self._on_result)
+
+    def _next_timestamp_ms(self) -> int:
+        """LIVE_STREAM zaman damgalari kesin artan olmali"""
+        timestamp_ms = max(int(self.clock() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        return timestamp_ms
+
+    def _on_result(self, result, timestamp_ms: int):
+        """MediaPipe thread'inden gelen sonuç - normalize et ve sakla"""
+        landmarks, handedness = normalize_landmarker_result(result)
+        now = self.clock()
+        with self._lock:
+            submitted = self._in_flight.pop(timestamp_ms, None)
+            # Sira dişi gelen eski sonuç yenisinin uzerine yazilmaz
+            if self.result_timestamp_ms is None or timestamp_ms > self.result_timestamp_ms:
+                self._landmarks = landmarks
+                self._handedness = handedness
+                self.result_timestamp_ms = timestamp_ms
+            self.results_received += 1
+            if submitted is not None:
+                self.latency_sum_ms += (now - submitted) * 1000
+
+    def submit(self, image: np.ndarray) -> bool:
+        """Frame'i async inference'a gonder - meşgulse atla (False)"""
+        now = self.clock()
+        with self._lock:
+            expired = [ts for ts, submitted in self._in_flight.items() if now - submitted > self.result_timeout]
+            for ts in expired:
+                del self._in_flight[ts]
+            self.frames_expired += len(expired)
+
+            if len(self._in_flight) >= self.max_in_flight:
+                self.frames_dropped += 1
+                return False
+            timestamp_ms = self._next_timestamp_ms()
+            self._in_flight[timestamp_ms] = now
+        self.frames_submitted += 1
+        try:
+            self.landmarker.detect_async(image, timestamp_ms)
+        except Exception:
+            with self._lock:
+                self._in_flight.pop(timestamp_ms, None)
+            raise
+        return True
+
+    def latest(self):
+        """Son tamamlanan sonuç - her çağrida yeni nesne"""
+        with self._lock:
+            landmarks, handedness = self._landmarks, self._handedness
+        return results_from_arrays(landmarks, handedness)
+
+    def process(self, image: np.ndarray):
+        """Frame'i gonder ve beklemeden son sonucu dondur"""
+        self.submit(image)
+        return self.latest()
+
+    def close(self):
+        self.landmarker.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'backend': self.name,
+            'delegate': self.delegate,
+            'frames_submitted': self.frames_submitted,
+            'frames_dropped': self.frames_dropped,
+            'frames_expired': self.frames_expired,
+            'results': self.results_received,
+            'avg_latency_ms': self.latency_sum_ms / self.results_received if self.results_received else 0.0
+        }
+
+
+def create_hand_backend(backend: str = BACKEND_SOLUTIONS, max_num_hands: int = 1, confidence: float = 0.7,
+                        model_path: str = DEFAULT_MODEL_PATH, delegate: str = 'cpu') -> HandBackend:
+    """Ada gore el algilayici arka ucu oluştur"""
+    if backend == BACKEND_TASKS:
+        return HandLandmarkerBackend(model_path, max_num_hands=max_num_hands, confidence=confidence,
+                                     delegate=delegate)
+    if backend == BACKEND_SOLUTIONS:
+        return SolutionsHandsBackend(max_num_hands=max_num_hands, confidence=confidence)
+    raise ValueError(f"Geçersiz el arka ucu: {backend} (seçenekler: {', '.join(HAND_BACKENDS)})")
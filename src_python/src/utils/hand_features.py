@@ -0,0 +1,244 @@
+"""
+Toplu el ozellikleri
+Frame'deki tum ellerin landmark'lari tek (el sayisi, 21, 3) diziye alinir ve
+gesture detektorunun kullandiği mesafeler (pinch, orta parmak, bilek-parmak
+uçlari) tek NumPy geçişinde hesaplanir. Her el için Python nesneleri uzerinde
+ayri ayri mesafe hesabi yapilmaz; detektor satirlari hazir değer olarak alir.
+
+Tek el için de ayni yol kullanilir: landmark'lar bir kez bitişik (21, 3)
+float32 diziye alinir (landmark_array - MediaPipe nesneleri için ince
+adaptor). HandFeatures elin o frame'deki tum ozelliklerini (mesafeler, el
+boyutu, avuç merkezi) taşir; detektor, parmak sayimi ve otomatik
+kalibrasyon ayni nesneyi okur, her ozellik ilk erişimde bir kez hesaplanir.
+Yeni bir ozellik burada bir kez eklenir.
+
+Eller handedness etiketiyle ('Left'/'Right') anahtarlanir - her elin
+detektor durumu (pinch, surukleme, filtreler) bu anahtarla ayri tutulur.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+# Landmark indeksleri
+WRIST = 0
+THUMB_TIP = 4
+INDEX_TIP = 8
+MIDDLE_TIP = 12
+FINGER_TIPS = (4, 8, 12, 16, 20)
+
+# Detektorun kullandiği noktalar: 0 bilek, 1-5 başparmaktan serçeye parmak uçlari
+KEY_POINTS = (WRIST,) + FINGER_TIPS
+
+# Mesafe çiftleri - tek tablo (ad, nokta, nokta). Toplu (compute_hand_features,
+# feature_matrix) ve tek el (HandFeatures) hesaplari ile FEATURE_NAMES buradan uretilir
+_DISTANCE_PAIRS = (
+    ('pinch_distance', THUMB_TIP, INDEX_TIP),
+    ('middle_to_thumb', MIDDLE_TIP, THUMB_TIP),
+    ('middle_to_index', MIDDLE_TIP, INDEX_TIP),
+) + tuple((f'tip_{finger}', tip, WRIST)
+          for finger, tip in zip(('thumb', 'index', 'middle', 'ring', 'pinky'), FINGER_TIPS))
+_PAIR_FROM = np.array([pair[1] for pair in _DISTANCE_PAIRS])
+_PAIR_TO = np.array([pair[2] for pair in _DISTANCE_PAIRS])
+DISTANCE_NAMES = tuple(pair[0] for pair in _DISTANCE_PAIRS)
+
+# Bilek-parmak ucu sutunlari ve el boyutu (bilek - orta parmak ucu)
+_TIP_COLUMNS = slice(len(_DISTANCE_PAIRS) - len(FINGER_TIPS), len(_DISTANCE_PAIRS))
+_HAND_SIZE_COLUMN = DISTANCE_NAMES.index('tip_middle')
+_POSITION_POINTS = np.array((THUMB_TIP, INDEX_TIP, MIDDLE_TIP))
+
+# HandFeatures.to_array / feature_matrix sutunlari (trace kaydi)
+FEATURE_NAMES = DISTANCE_NAMES + ('hand_size', 'palm_x', 'palm_y')
+
+
+def landmark_array(landmarks) -> np.ndarray:
+    """Tek elin landmark'lari - bitişik (21, 3) float32 dizi
+
+    Dizi verilirse (trace, HandLandmarker sonuçlari) kopyalanmadan kullanilir.
+    MediaPipe landmark listesi ya da .landmark alanli NormalizedLandmarkList
+    bir kez diziye çevrilir (z alani olmayan noktalarda z = 0).
+    """
+    if isinstance(landmarks, np.ndarray):
+        return np.ascontiguousarray(landmarks, dtype=np.float32)
+    landmarks = getattr(landmarks, 'landmark', landmarks)
+    return np.array([(lm.x, lm.y, getattr(lm, 'z', 0.0)) for lm in landmarks], dtype=np.float32)
+
+
+def hands_to_array(results) -> np.ndarray:
+    """Sonuçtaki tum elleri (el sayisi, 21, 3) float32 diziye al"""
+    hands = getattr(results, 'multi_hand_landmarks', None) or []
+    return np.array([[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in hands],
+                    dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+
+
+def pair_distances(points: np.ndarray) -> np.ndarray:
+    """_DISTANCE_PAIRS mesafeleri (x, y duzleminde) - (..., 21, 3) -> (..., len(DISTANCE_NAMES))
+
+    Tek el ve toplu yol ayni işlemi kullanir; ayni girdide sonuçlar birebir aynidir.
+    """
+    delta = points[..., _PAIR_FROM, :2] - points[..., _PAIR_TO, :2]
+    return np.hypot(delta[..., 0], delta[..., 1])
+
+
+def compute_hand_features(landmarks: np.ndarray) -> Dict[str, np.ndarray]:
+    """Tum eller için detektor mesafelerini tek geçişte hesapla (x, y duzleminde)"""
+    points = np.asarray(landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+    distances = pair_distances(points)
+    positions = points[:, _POSITION_POINTS, :2]
+
+    features = {
+        'thumb': positions[:, 0],
+        'index': positions[:, 1],
+        'middle': positions[:, 2],
+        'distances': distances,
+        # Bilekten beş parmak ucuna mesafeler - (el sayisi, 5)
+        'tip_distances': distances[:, _TIP_COLUMNS],
+    }
+    for column, name in enumerate(DISTANCE_NAMES[:_TIP_COLUMNS.start]):
+        features[name] = distances[:, column]
+    return features
+
+
+def feature_matrix(landmarks: np.ndarray) -> np.ndarray:
+    """Tum ellerin HandFeatures.to_array satirlari - (el sayisi, len(FEATURE_NAMES)) float32"""
+    points = np.asarray(landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+    distances = pair_distances(points)
+    key_points = points[:, list(KEY_POINTS), :2].astype(np.float64)
+    return np.column_stack((distances, distances[:, _HAND_SIZE_COLUMN],
+                            key_points.mean(axis=1))).astype(np.float32)
+
+
+class HandFeatures:
+    """Tek elin bir frame'deki ozellikleri - her grup ilk erişimde bir kez hesaplanir
+
+    points elin (21, 3) float32 dizisidir. frame_id frame bağlamindan gelir;
+    ayni frame için nesne yeniden kullanilir (GestureDetector.hand_features).
+    row verilirse (hand_feature_rows satiri - process_hands'in toplu
+    hesabi) mesafeler ve parmak ucu konumlari yeniden hesaplanmaz.
+    """
+
+    __slots__ = ('points', 'frame_id', '_distances', '_positions', '_key_points', '_palm_center')
+
+    def __init__(self, points: np.ndarray, frame_id: Optional[int] = None,
+                 row: Optional[Dict[str, Any]] = None):
+        self.points = points
+        self.frame_id = frame_id
+        self._distances: Optional[Tuple[float, ...]] = None
+        self._positions: Optional[Tuple[Tuple[float, float], ...]] = None
+        self._key_points: Optional[np.ndarray] = None
+        self._palm_center: Optional[Tuple[float, float]] = None
+        if row is not None:
+            self._distances = tuple(row['distances'])
+            self._positions = (tuple(row['thumb']), tuple(row['index']), tuple(row['middle']))
+
+    @classmethod
+    def from_landmarks(cls, landmarks, frame_id: Optional[int] = None) -> 'HandFeatures':
+        """HandFeatures, (21, 3) dizi ya da MediaPipe landmark'larindan nesne"""
+        if isinstance(landmarks, cls):
+            return landmarks
+        return cls(landmark_array(landmarks), frame_id)
+
+    def _pair_distances(self) -> Tuple[float, ...]:
+        """DISTANCE_NAMES sirasiyla mesafeler - toplu yol ile ayni pair_distances işlemi"""
+        if self._distances is None:
+            self._distances = tuple(pair_distances(self.points).tolist())
+        return self._distances
+
+    def _tip_positions(self) -> Tuple[Tuple[float, float], ...]:
+        if self._positions is None:
+            self._positions = tuple(map(tuple, self.points.take(_POSITION_POINTS, axis=0)[:, :2].tolist()))
+        return self._positions
+
+    @property
+    def thumb(self) -> Tuple[float, float]:
+        return self._tip_positions()[0]
+
+    @property
+    def index(self) -> Tuple[float, float]:
+        return self._tip_positions()[1]
+
+    @property
+    def middle(self) -> Tuple[float, float]:
+        return self._tip_positions()[2]
+
+    @property
+    def pinch_distance(self) -> float:
+        return self._pair_distances()[0]
+
+    @property
+    def middle_to_thumb(self) -> float:
+        return self._pair_distances()[1]
+
+    @property
+    def middle_to_index(self) -> float:
+        return self._pair_distances()[2]
+
+    @property
+    def tip_distances(self) -> Tuple[float, ...]:
+        """Bilekten beş parmak ucuna mesafeler (başparmaktan serçeye)"""
+        return self._pair_distances()[_TIP_COLUMNS]
+
+    @property
+    def hand_size(self) -> float:
+        """El boyutu - bilek ile orta parmak ucu arasi"""
+        return self._pair_distances()[_HAND_SIZE_COLUMN]
+
+    @property
+    def key_points(self) -> np.ndarray:
+        """Bilek + beş parmak ucu (x, y) - (6, 2) float64"""
+        if self._key_points is None:
+            self._key_points = self.points.take(KEY_POINTS, axis=0)[:, :2].astype(np.float64)
+        return self._key_points
+
+    @property
+    def wrist(self) -> Tuple[float, float]:
+        return tuple(self.key_points[0].tolist())
+
+    @property
+    def fingertips(self) -> List[Tuple[float, float]]:
+        return [tuple(point) for point in self.key_points[1:].tolist()]
+
+    @property
+    def palm_center(self) -> Tuple[float, float]:
+        """El merkezi - bilek ve parmak uçlarinin ortalamasi"""
+        if self._palm_center is None:
+            self._palm_center = tuple(self.key_points.mean(axis=0).tolist())
+        return self._palm_center
+
+    def to_array(self) -> np.ndarray:
+        """FEATURE_NAMES sirasiyla tek satir (trace kaydi için)"""
+        return np.array(self._pair_distances() + (self.hand_size,) + self.palm_center, dtype=np.float32)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Ozellik adi -> değer (log için)"""
+        return dict(zip(FEATURE_NAMES, self.to_array().tolist()))
+
+    def __repr__(self) -> str:
+        return f"HandFeatures(frame_id={self.frame_id}, hand_size={self.hand_size:.3f})"
+
+
+def hand_feature_rows(features: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Toplu ozellikleri el başina sozluklere bol (detect_gesture'a verilir)"""
+    columns = {name: values.tolist() for name, values in features.items()}
+    count = len(columns['pinch_distance'])
+    return [{name: (tuple(values[i]) if isinstance(values[i], list) else values[i])
+             for name, values in columns.items()} for i in range(count)]
+
+
+def hand_keys(results) -> List[str]:
+    """Her elin kalici anahtari - handedness etiketi, yoksa/tekrarliysa sira numarasi"""
+    hands = getattr(results, 'multi_hand_landmarks', None) or []
+    handedness = getattr(results, 'multi_handedness', None) or []
+
+    keys = []
+    for i in range(len(hands)):
+        try:
+            key = handedness[i].classification[0].label
+        except (AttributeError, IndexError):
+            key = None
+        if not key or key in keys:
+            key = f"hand{i}"
+        keys.append(key)
+    return keys
@@ -0,0 +1,137 @@
+"""
+El bolgesi (ROI) takibi
+İlk algilamadan sonra inference'i tum frame yerine son el konumunun
+etrafindaki kirpilmiş bolgede çaliştirir. Landmark'lar tekrar tum frame'e
+gore normalize koordinatlara çevrilir; el kaybolursa ya da kirpma kenarina
+yaklaşirsa bir sonraki frame tam goruntu ile işlenir.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# (x0, y0, x1, y1) - tum frame'e gore normalize koordinatlar
+ROI = Tuple[float, float, float, float]
+
+
+class HandROITracker:
+    """Son el konumuna gore kirpma bolgesi hesaplar ve landmark'lari geri eşler"""
+
+    def __init__(self, margin: float = 0.3, edge_margin: float = 0.05, min_size: float = 0.25):
+        self.margin = margin            # Kutu boyutuna gore her yone genişletme orani
+        self.edge_margin = edge_margin  # Kirpma kenarina bu kadar yakin landmark -> tam frame
+        self.min_size = min_size        # En kuçuk kirpma boyutu (frame'e oranla)
+
+        self.roi: Optional[ROI] = None
+
+        # İstatistikler
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.hand_lost_count = 0
+        self.edge_fallback_count = 0
+        self.pixels_processed = 0
+        self.pixels_full = 0
+
+    def crop(self, image) -> Tuple[Any, Optional[ROI]]:
+        """Goruntuyu mevcut ROI'ye gore kirp - ROI yoksa tum goruntu doner"""
+        h, w = image.shape[:2]
+        self.pixels_full += h * w
+
+        if self.roi is None:
+            self.full_frames += 1
+            self.pixels_processed += h * w
+            return image, None
+
+        x0, y0, x1, y1 = self.roi
+        px0, py0 = int(x0 * w), int(y0 * h)
+        px1, py1 = max(px0 + 1, int(round(x1 * w))), max(py0 + 1, int(round(y1 * h)))
+
+        # Piksel sinirlarina yuvarlanmiş gerçek ROI - geri eşleme bununla yapilmali
+        roi = (px0 / w, py0 / h, px1 / w, py1 / h)
+        cropped = np.ascontiguousarray(image[py0:py1, px0:px1])
+
+        self.roi_frames += 1
+        self.pixels_processed += (py1 - py0) * (px1 - px0)
+        return cropped, roi
+
+    def update(self, results, roi: Optional[ROI]):
+        """Inference sonucunu tum frame koordinatlarina çevir ve sonraki ROI'yi hesapla
+
+        results.multi_hand_landmarks yerinde (in-place) guncellenir.
+        """
+        hands = getattr(results, 'multi_hand_landmarks', None)
+        if not hands:
+            if self.roi is not None:
+                self.hand_lost_count += 1
+            self.roi = None
+            return
+
+        near_edge = False
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            rw, rh = x1 - x0, y1 - y0
+
+            # Frame kenarina dayanan kirpma kenarlari kontrol edilmez - dişarida goruntu yok
+            lo_x = self.edge_margin if x0 > 0.0 else float('-inf')
+            hi_x = 1.0 - self.edge_margin if x1 < 1.0 else float('inf')
+            lo_y = self.edge_margin if y0 > 0.0 else float('-inf')
+            hi_y = 1.0 - self.edge_margin if y1 < 1.0 else float('inf')
+
+            for hand in hands:
+                for lm in hand.landmark:
+                    if not (lo_x <= lm.x <= hi_x and lo_y <= lm.y <= hi_y):
+                        near_edge = True
+                    lm.x = x0 + lm.x * rw
+                    lm.y = y0 + lm.y * rh
+                    lm.z = lm.z * rw
+
+        if near_edge:
+            # El kirpma disina taşiyor olabilir - bir sonraki frame tam goruntu
+            self.edge_fallback_count += 1
+            self.roi = None
+            return
+
+        self.roi = self._compute_roi(hands)
+
+    def _compute_roi(self, hands) -> Optional[ROI]:
+        """Tum ellerin sinir kutusunu margin kadar genişlet"""
+        xs = [lm.x for hand in hands for lm in hand.landmark]
+        ys = [lm.y for hand in hands for lm in hand.landmark]
+        if not xs:
+            return None
+
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+
+        # Normalize uzayda kare = frame ile ayni en-boy orani (avuç algilayici buna duyarli)
+        size = max(max_x - min_x, max_y - min_y)
+        size = max(self.min_size, size * (1.0 + 2 * self.margin))
+        cx, cy = (min_x + max_x) / 2, (min_y + max_y) / 2
+
+        x0, x1 = cx - size / 2, cx + size / 2
+        y0, y1 = cy - size / 2, cy + size / 2
+
+        # Frame sinirlarina kaydir/kirp
+        x0, x1 = max(0.0, x0), min(1.0, x1)
+        y0, y1 = max(0.0, y0), min(1.0, y1)
+
+        if x1 - x0 >= 0.95 and y1 - y0 >= 0.95:
+            return None  # Neredeyse tum frame - kirpmaya gerek yok
+        return (x0, y0, x1, y1)
+
+    def reset(self):
+        """Takibi sifirla - sonraki frame tam goruntu ile işlenir"""
+        self.roi = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ROI istatistikleri"""
+        total = self.roi_frames + self.full_frames
+        return {
+            'roi_frames': self.roi_frames,
+            'full_frames': self.full_frames,
+            'roi_ratio': self.roi_frames / total if total else 0.0,
+            'hand_lost_count': self.hand_lost_count,
+            'edge_fallback_count': self.edge_fallback_count,
+            'pixel_ratio': self.pixels_processed / self.pixels_full if self.pixels_full else 1.0,
+            'current_roi': self.roi
+        }
@@ -0,0 +1,119 @@
+"""
+Boşta (idle) guç modu
+Belirli bir sure el gorulmezse işleme hizini ve inference çozunurluğunu
+duşurur; ilk algilamada hemen tam hiza doner. decode_interval yakalayiciya
+verilir - boşta işlenmeyecek frame'ler decode da edilmez. Her durumda geçen sure ve
+işlenen frame orani (duty cycle) raporlanir.
+"""
+
+import time
+from typing import Any, Callable, Dict
+
+STATE_ACTIVE = 'active'
+STATE_IDLE = 'idle'
+
+
+class IdleController:
+    """El gorulmediğinde duşuk guç moduna geçen durum makinesi"""
+
+    def __init__(self, idle_timeout: float = 5.0, idle_fps: float = 5.0,
+                 idle_inference_scale: float = 0.5, clock: Callable[[], float] = time.monotonic):
+        self.idle_timeout = idle_timeout              # Bu kadar saniye el yoksa idle (0 = kapali)
+        self.idle_interval = 1.0 / idle_fps if idle_fps > 0 else 0.0
+        self.idle_inference_scale = idle_inference_scale
+        self.clock = clock
+
+        now = clock()
+        self.state = STATE_ACTIVE
+        self.last_hand_time = now
+        self.last_process_time = 0.0
+        self._state_since = now
+
+        # İstatistikler
+        self.time_in_state = {STATE_ACTIVE: 0.0, STATE_IDLE: 0.0}
+        self.frames_offered = 0
+        self.frames_processed = 0
+        self.wake_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """idle_timeout > 0 ise etkin"""
+        return self.idle_timeout > 0
+
+    @property
+    def is_idle(self) -> bool:
+        return self.state == STATE_IDLE
+
+    def _set_state(self, state: str, now: float):
+        """Durum değiştir - onceki durumda geçen sureyi ekle"""
+        if state == self.state:
+            return
+        self.time_in_state[self.state] += now - self._state_since
+        self.state = state
+        self._state_since = now
+
+    @property
+    def decode_interval(self) -> float:
+        """Yakalayicinin iki decode arasinda beklemesi gereken sure (aktifken 0)"""
+        return self.idle_interval if self.is_idle else 0.0
+
+    def wait_time(self) -> float:
+        """Sonraki frame işlenene kadar beklenmesi gereken sure (saniye)"""
+        if not self.is_idle:
+            return 0.0
+        return max(0.0, self.last_process_time + self.idle_interval - self.clock())
+
+    def should_process(self, frames_since_last: int = 1) -> bool:
+        """Bu frame işlenmeli mi? - idle modda duşuk hiza sinirlanir
+
+        frames_since_last: onceki çağridan beri kameranin urettiği frame
+        sayisi (atlananlar dahil) - duty cycle bununla hesaplanir.
+        """
+        now = self.clock()
+        self.frames_offered += max(1, frames_since_last)
+
+        if self.is_idle and now - self.last_process_time < self.idle_interval:
+            return False
+
+        self.last_process_time = now
+        self.frames_processed += 1
+        return True
+
+    def inference_scale(self, base_scale: float) -> float:
+        """Geçerli inference olçeği - idle modda duşuk çozunurluk"""
+        if self.is_idle:
+            return min(base_scale, self.idle_inference_scale)
+        return base_scale
+
+    def update(self, hand_detected: bool):
+        """Inference sonucuna gore durumu guncelle"""
+        now = self.clock()
+
+        if hand_detected:
+            self.last_hand_time = now
+            if self.is_idle:
+                # El goruldu - hemen tam hiza don
+                self.wake_count += 1
+                self._set_state(STATE_ACTIVE, now)
+            return
+
+        if self.enabled and not self.is_idle and now - self.last_hand_time >= self.idle_timeout:
+            self._set_state(STATE_IDLE, now)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Durum ve guç istatistikleri"""
+        now = self.clock()
+        time_in_state = dict(self.time_in_state)
+        time_in_state[self.state] += now - self._state_since
+        total_time = sum(time_in_state.values())
+
+        return {
+            'state': self.state,
+            'time_active_s': time_in_state[STATE_ACTIVE],
+            'time_idle_s': time_in_state[STATE_IDLE],
+            'idle_ratio': time_in_state[STATE_IDLE] / total_time if total_time else 0.0,
+            'duty_cycle': self.frames_processed / self.frames_offered if self.frames_offered else 1.0,
+            'frames_processed': self.frames_processed,
+            'frames_offered': self.frames_offered,
+            'wake_count': self.wake_count
+        }
@@ -0,0 +1,155 @@
+"""
+Goruntu yardimcilari
+Inference oncesi goruntu hazirlama (kuçultme, renk donuşumu, aynalama)
+işlemleri ve frame tamponlarinin yeniden kullanimi
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+MIN_INFERENCE_SCALE = 0.1
+
+
+def clamp_inference_scale(scale: float) -> float:
+    """Inference olçeğini (0.1, 1.0] araliğinda tut"""
+    try:
+        scale = float(scale)
+    except (TypeError, ValueError):
+        return 1.0
+    return max(MIN_INFERENCE_SCALE, min(1.0, scale))
+
+
+def inference_size(shape: Tuple[int, ...], scale: float) -> Tuple[int, int]:
+    """Olçeklenmiş (genişlik, yukseklik) - cv2.resize sirasiyla"""
+    h, w = shape[:2]
+    return max(1, int(round(w * scale))), max(1, int(round(h * scale)))
+
+
+def resize_for_inference(image, scale: float):
+    """Goruntuyu inference için kuçult
+
+    Landmark'lar normalize koordinatlarda geldiği için geri olçekleme gerekmez;
+    gosterim için tam çozunurluklu frame ayrica saklanir. scale >= 1.0 ise
+    goruntu kopyalanmadan aynen doner.
+    """
+    if scale >= 1.0:
+        return image
+
+    return cv2.resize(image, inference_size(image.shape, scale), interpolation=cv2.INTER_AREA)
+
+
+def mirror_landmarks(results):
+    """Landmark x koordinatlarini aynala (x -> 1 - x) - yerinde (in-place)
+
+    Goruntuyu cv2.flip ile çevirmek yerine kullanilir; sonuç aynalanmiş
+    goruntu uzerinde çaliştirilmiş inference ile ayni koordinatlari verir.
+    """
+    hands = getattr(results, 'multi_hand_landmarks', None)
+    if not hands:
+        return results
+
+    for hand in hands:
+        for lm in hand.landmark:
+            lm.x = 1.0 - lm.x
+    return results
+
+
+class FramePool:
+    """Sabit sayida frame boyutlu tampon havuzu - sahiplik izlenir
+
+    acquire() boştaki bir tamponu verir; tampon, kullanan release() ile geri
+    verene kadar başka kimseye verilmez. Boylece kuyrukta bekleyen ya da
+    işlenen bir frame'in uzerine yazilmaz. Boşta tampon yoksa yeni dizi
+    ayrilir; havuz size tampona kadar bunlari sahiplenir, fazlasi havuza
+    girmez (çop toplayiciya kalir). Tamponlar ilk kullanimda ya da frame
+    boyutu değişince ayrilir; allocations sayaci bunu izler.
+    """
+
+    def __init__(self, size: int, dtype=np.uint8):
+        self.size = max(1, int(size))
+        self.dtype = dtype
+        self._owned: Dict[int, np.ndarray] = {}  # id -> havuza ait tampon
+        self._free: List[np.ndarray] = []
+        self._lock = threading.Lock()  # Alan ve geri veren farkli thread'lerde olabilir
+
+        # İstatistikler
+        self.frames = 0
+        self.allocations = 0
+        self.steady_state_allocations = 0  # Tum tamponlar dolduktan sonraki ayirmalar
+
+    def acquire(self, shape: Optional[Tuple[int, ...]] = None) -> Optional[np.ndarray]:
+        """Boştaki bir tamponu al - shape verilirse gerekirse (yeniden) ayir
+
+        shape verilmezse ve boşta tampon yoksa None doner (or. cap.read(image=None)
+        tamponu kendisi ayirir; sonuç adopt() ile kaydedilir).
+        """
+        with self._lock:
+            self.frames += 1
+            buffer = self._free.pop() if self._free else None
+
+        if shape is not None and (buffer is None or buffer.shape != tuple(shape)):
+            return self.adopt(buffer, np.empty(shape, dtype=self.dtype))
+        return buffer
+
+    def adopt(self, buffer: Optional[np.ndarray], returned: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Dışarida doldurulan tamponun sonucunu kaydet
+
+        OpenCV dst/image tamponu uygun değilse yeni dizi ayirir; bu durumda
+        yeni dizi tamponun yerini alir (havuzda yer varsa sahiplenilir) ve
+        ayirma sayilir.
+        """
+        if returned is not None and returned is not buffer:
+            with self._lock:
+                self._record_allocation()
+                if buffer is not None:
+                    self._owned.pop(id(buffer), None)
+                if len(self._owned) < self.size:
+                    self._owned[id(returned)] = returned
+        return returned
+
+    def release(self, buffer: Optional[np.ndarray]):
+        """Tamponla iş bitti - havuza aitse tekrar verilebilir
+
+        Havuza ait olmayan diziler (or. kuçultulmuş kopya) yok sayilir.
+        """
+        if buffer is None:
+            return
+        with self._lock:
+            if self._owned.get(id(buffer)) is buffer and not any(free is buffer for free in self._free):
+                self._free.append(buffer)
+
+    def _record_allocation(self):
+        """Ayirmayi say - isinma sonrasi ise ayrica işaretle"""
+        self.allocations += 1
+        if self.frames > self.size:
+            self.steady_state_allocations += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tampon istatistikleri"""
+        return {
+            'buffers': self.size,
+            'frames': self.frames,
+            'allocations': self.allocations,
+            'steady_state_allocations': self.steady_state_allocations,
+            'allocations_per_frame': self.allocations / self.frames if self.frames else 0.0
+        }
+
+
+def to_rgb(frame, pool: Optional[FramePool] = None):
+    """BGR -> RGB - pool verilirse sonuç onceden ayrilmiş tampona yazilir
+
+    Sonuç kullanildiktan sonra pool.release() ile havuza geri verilmeli.
+    """
+    if pool is None:
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    buffer = pool.acquire(frame.shape)
+    return pool.adopt(buffer, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buffer))
+
+
+def mirror_in_place(frame):
+    """Frame'i yatayda yerinde aynala - yeni dizi ayirmaz"""
+    return cv2.flip(frame, 1, dst=frame)
@@ -0,0 +1,233 @@
+"""
+Ayri süreçte el algilama
+mp_hands.Hands ayri bir süreçte çalişir; frame'ler paylaşimli bellekteki
+halka slotlarina yazilir (goruntu pickle edilmez), geri sadece kuçuk landmark
+dizileri doner. Ana süreç gesture algilama, filtreleme ve eylemleri yurutur -
+Python tarafindaki yuk inference suresini, inference de onu uzatmaz (GIL).
+
+InferenceWorker, hands.process(rgb) ile ayni arayuzu sunar; ROI kirpma ve
+olçekleme ana süreçte yapilir, işlenecek goruntu slota kopyalanir. Cevabi
+zaman aşimina uğrayan istek, worker cevap verene kadar slotunu tutar - yeni
+goruntu worker'in hala okuduğu slota yazilmaz.
+"""
+
+import multiprocessing as mp
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .landmark_trace import handedness_codes, results_from_arrays
+
+NUM_LANDMARKS = 21
+
+
+def create_mediapipe_hands(max_num_hands: int = 1, confidence: float = 0.7):
+    """Varsayilan fabrika - worker süreçte MediaPipe Hands oluştur"""
+    import mediapipe
+    return mediapipe.solutions.hands.Hands(max_num_hands=max_num_hands,  # type: ignore
+                                           min_detection_confidence=confidence,
+                                           min_tracking_confidence=confidence)
+
+
+def _worker_main(shm_name: str, slot_bytes: int, requests, responses,
+                 hands_factory: Callable, factory_kwargs: Dict[str, Any]):
+    """Worker süreç donguşu - slottaki goruntuyu işle, landmark dizilerini gonder"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        try:
+            hands = hands_factory(**factory_kwargs)
+        except Exception as e:  # MediaPipe yok / model yuklenemedi
+            responses.put(('error', repr(e)))
+            return
+        responses.put(('ready', None))
+
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+
+            request_id, slot, shape = request
+            image = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+
+            start = time.perf_counter()
+            results = hands.process(image)
+            infer_ms = (time.perf_counter() - start) * 1000
+
+            hands_found = getattr(results, 'multi_hand_landmarks', None) or []
+            landmarks = np.array([[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in hands_found],
+                                 dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+            responses.put(('result', (request_id, landmarks, handedness_codes(results), infer_ms)))
+            del image
+
+        close = getattr(hands, 'close', None)
+        if close is not None:
+            close()
+    finally:
+        shm.close()
+
+
+class InferenceWorker:
+    """hands.process uyumlu, ayri süreçte çalişan el algilayici"""
+
+    def __init__(self, frame_shape: Tuple[int, int, int], slots: int = 2, max_num_hands: int = 1,
+                 confidence: float = 0.7, hands_factory: Callable = create_mediapipe_hands,
+                 start_timeout: float = 30.0, result_timeout: float = 2.0, context: str = 'spawn'):
+        self.frame_shape = tuple(frame_shape)
+        self.slots = max(1, slots)
+        self.slot_bytes = int(np.prod(self.frame_shape))   # Slot en buyuk (tam) frame kadar
+        self.start_timeout = start_timeout
+        self.result_timeout = result_timeout
+
+        self._context = mp.get_context(context)
+        self._hands_factory = hands_factory
+        self._factory_kwargs = {'max_num_hands': max_num_hands, 'confidence': confidence}
+
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._requests = None
+        self._responses = None
+        self._process = None
+        self._next_slot = 0
+        self._next_id = 0
+        self._in_flight: Dict[int, int] = {}   # request_id -> slot (worker henuz cevap vermedi)
+
+        # İstatistikler
+        self.frames = 0
+        self.timeouts = 0
+        self.infer_time_sum = 0.0
+        self.roundtrip_time_sum = 0.0
+
+    def start(self) -> 'InferenceWorker':
+        """Paylaşimli belleği ayir, worker süreci başlat ve hazir olmasini bekle"""
+        if self._process is not None:
+            return self
+
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slot_bytes * self.slots)
+        self._requests = self._context.Queue()
+        self._responses = self._context.Queue()
+        self._process = self._context.Process(
+            target=_worker_main, name='hci-inference-worker', daemon=True,
+            args=(self._shm.name, self.slot_bytes, self._requests, self._responses,
+                  self._hands_factory, self._factory_kwargs))
+        self._process.start()
+
+        try:
+            kind, payload = self._responses.get(timeout=self.start_timeout)
+        except queue.Empty:
+            kind, payload = 'error', f"{self.start_timeout}s içinde hazir olmadi"
+        if kind != 'ready':
+            self.close()
+            raise RuntimeError(f"Inference worker başlatilamadi: {payload}")
+        return self
+
+    def _free_slot(self) -> Optional[int]:
+        """Worker'in okumadiği siradaki slot - hepsi meşgulse None"""
+        busy = set(self._in_flight.values())
+        for step in range(self.slots):
+            slot = (self._next_slot + step) % self.slots
+            if slot not in busy:
+                self._next_slot = (slot + 1) % self.slots
+                return slot
+        return None
+
+    def _receive(self) -> Tuple[str, Any]:
+        """Sonraki cevap - sonucu gelen isteğin slotu serbest kalir"""
+        kind, payload = self._responses.get(timeout=self.result_timeout)
+        if kind == 'result':
+            self._in_flight.pop(payload[0], None)
+        return kind, payload
+
+    def _timed_out(self):
+        """Cevap gelmedi - bos sonuç (worker oldu ise hata)"""
+        self.timeouts += 1
+        if not self._process.is_alive():
+            raise RuntimeError("Inference worker beklenmedik şekilde durdu")
+        return results_from_arrays(np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32), [])
+
+    def process(self, image: np.ndarray):
+        """Goruntuyu worker'a gonder ve sonucu bekle - hands.process ile ayni donuş"""
+        if self._process is None:
+            raise RuntimeError("Inference worker başlatilmadi")
+        if image.dtype != np.uint8 or image.nbytes > self.slot_bytes:
+            raise ValueError(f"Goruntu slota sigmiyor: {image.shape} {image.dtype}")
+
+        start = time.perf_counter()
+
+        # Tum slotlar zaman aşimina uğramiş isteklerde - worker birini bitirene kadar bekle
+        slot = self._free_slot()
+        while slot is None:
+            try:
+                self._receive()
+            except queue.Empty:
+                return self._timed_out()
+            slot = self._free_slot()
+
+        # Goruntuyu slota kopyala - tek kopya, pickle yok
+        target = np.ndarray(image.shape, dtype=np.uint8, buffer=self._shm.buf, offset=slot * self.slot_bytes)
+        np.copyto(target, image)
+        del target
+
+        request_id = self._next_id
+        self._next_id += 1
+        self._in_flight[request_id] = slot
+        self._requests.put((request_id, slot, image.shape))
+
+        while True:
+            try:
+                kind, payload = self._receive()
+            except queue.Empty:
+                return self._timed_out()
+
+            # Zaman aşimina uğramiş eski isteklerin cevaplari atlanir
+            if kind == 'result' and payload[0] == request_id:
+                break
+
+        _, landmarks, handedness, infer_ms = payload
+        self.frames += 1
+        self.infer_time_sum += infer_ms
+        self.roundtrip_time_sum += (time.perf_counter() - start) * 1000
+        return results_from_arrays(landmarks, handedness)
+
+    def close(self, timeout: float = 2.0):
+        """Worker'i durdur ve paylaşimli belleği serbest birak"""
+        if self._process is not None:
+            if self._process.is_alive():
+                self._requests.put(None)
+                self._process.join(timeout=timeout)
+                if self._process.is_alive():
+                    self._process.terminate()
+                    self._process.join(timeout=timeout)
+            self._process = None
+        self._in_flight.clear()
+
+        for q in (self._requests, self._responses):
+            if q is not None:
+                q.close()
+                q.join_thread()
+        self._requests = self._responses = None
+
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> 'InferenceWorker':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Worker istatistikleri - inference ve gidiş-donuş (kopya + kuyruk) sureleri"""
+        return {
+            'frames': self.frames,
+            'timeouts': self.timeouts,
+            'slots': self.slots,
+            'slots_in_flight': len(self._in_flight),
+            'avg_infer_ms': self.infer_time_sum / self.frames if self.frames else 0.0,
+            'avg_roundtrip_ms': self.roundtrip_time_sum / self.frames if self.frames else 0.0,
+            'avg_overhead_ms': ((self.roundtrip_time_sum - self.infer_time_sum) / self.frames
+                                if self.frames else 0.0)
+        }
@@ -0,0 +1,289 @@
+"""
+Landmark izi (trace) kaydi ve tekrar oynatma
+Her frame için el landmark'lari (21x3 float32), el yonu (handedness) ve
+yakalama zamani kompakt bir .npz dosyasina yazilir. El olmayan frame'ler
+sadece zaman damgasi kadar yer tutar. Her el için detektorun kullandiği
+ozellikler (hand_features.FEATURE_NAMES) kayit sirasinda tek toplu geçişte
+hesaplanip yanina yazilir - analiz araçlari landmark'lardan yeniden
+hesaplamadan okuyabilir. Tekrar oynatici bu dosyayi kamera ve
+MediaPipe olmadan dogrudan GestureDetector.detect_gesture ya da
+GestureControlSystem.process_frame'e verir.
+"""
+
+import json
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .frame_context import FrameContext
+from .hand_features import FEATURE_NAMES, feature_matrix
+
+TRACE_VERSION = 1
+NUM_LANDMARKS = 21
+
+# Handedness kodlari (MediaPipe etiketleri)
+HANDEDNESS_CODES = {'Left': 0, 'Right': 1}
+HANDEDNESS_LABELS = {code: label for label, code in HANDEDNESS_CODES.items()}
+HANDEDNESS_UNKNOWN = -1
+
+
+class TraceLandmark:
+    """Tek landmark - MediaPipe NormalizedLandmark ile ayni alanlar"""
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x: float, y: float, z: float):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def HasField(self, name: str) -> bool:
+        """mp_drawing.draw_landmarks uyumu - visibility/presence alani yok"""
+        return False
+
+
+class TraceHand:
+    """Kayittan okunan el - NormalizedLandmarkList gibi .landmark listesi"""
+
+    __slots__ = ('landmark',)
+
+    def __init__(self, points: np.ndarray):
+        self.landmark = [TraceLandmark(x, y, z) for x, y, z in points.tolist()]
+
+
+def _handedness_entry(code: int):
+    """multi_handedness girdisi taklidi (classification[0].label)"""
+    label = HANDEDNESS_LABELS.get(code, 'Unknown')
+    return SimpleNamespace(classification=[SimpleNamespace(label=label, score=1.0, index=code)])
+
+
+def landmarks_to_array(hand) -> np.ndarray:
+    """Tek elin landmark'larini (21, 3) float32 diziye çevir"""
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand.landmark], dtype=np.float32)
+
+
+def results_from_arrays(landmarks: np.ndarray, handedness) -> SimpleNamespace:
+    """(el sayisi, 21, 3) dizi ve yon kodlarindan hands.process benzeri sonuç"""
+    if len(landmarks) == 0:
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+    return SimpleNamespace(
+        multi_hand_landmarks=[TraceHand(points) for points in landmarks],
+        multi_handedness=[_handedness_entry(int(code)) for code in handedness]
+    )
+
+
+def handedness_codes(results) -> List[int]:
+    """Sonuçtaki her elin yon kodu"""
+    hands = getattr(results, 'multi_hand_landmarks', None) or []
+    return [_handedness_code(results, i) for i in range(len(hands))]
+
+
+def _handedness_code(results, index: int) -> int:
+    handedness = getattr(results, 'multi_handedness', None)
+    if not handedness or index >= len(handedness):
+        return HANDEDNESS_UNKNOWN
+    try:
+        return HANDEDNESS_CODES.get(handedness[index].classification[0].label, HANDEDNESS_UNKNOWN)
+    except (AttributeError, IndexError):
+        return HANDEDNESS_UNKNOWN
+
+
+class TraceRecorder:
+    """Frame başina el landmark'larini bellekte biriktirir, save() ile yazar"""
+
+    def __init__(self, path: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.metadata = dict(metadata or {})
+        self.clock = clock
+
+        self._timestamps: List[float] = []
+        self._hand_counts: List[int] = []
+        self._landmarks: List[np.ndarray] = []
+        self._handedness: List[int] = []
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def hand_count(self) -> int:
+        return len(self._landmarks)
+
+    def record(self, results, timestamp: Optional[float] = None):
+        """hands.process sonucunu kaydet - el yoksa sadece zaman damgasi"""
+        hands = getattr(results, 'multi_hand_landmarks', None) or []
+        self._timestamps.append(self.clock() if timestamp is None else timestamp)
+        self._hand_counts.append(len(hands))
+        for i, hand in enumerate(hands):
+            self._landmarks.append(landmarks_to_array(hand))
+            self._handedness.append(_handedness_code(results, i))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Kayit dizileri - landmark'lar el sayisina gore arka arkaya (duzensiz)"""
+        landmarks = (np.stack(self._landmarks) if self._landmarks
+                     else np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32))
+        return {
+            'timestamps': np.asarray(self._timestamps, dtype=np.float64),
+            'hand_counts': np.asarray(self._hand_counts, dtype=np.uint8),
+            'landmarks': landmarks,
+            'handedness': np.asarray(self._handedness, dtype=np.int8),
+            'features': feature_matrix(landmarks),
+        }
+
+    def save(self, path: Optional[str] = None) -> str:
+        """İzi sikiştirilmiş .npz olarak yaz"""
+        path = path or self.path
+        if not path:
+            raise ValueError("Trace dosya yolu verilmedi")
+
+        metadata = dict(self.metadata, version=TRACE_VERSION, frames=self.frame_count, hands=self.hand_count,
+                        feature_names=list(FEATURE_NAMES))
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, metadata=np.array(json.dumps(metadata)), **self.to_arrays())
+        return path
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Kayit istatistikleri"""
+        return {
+            'frames': self.frame_count,
+            'hands': self.hand_count,
+            'bytes_raw': self.hand_count * NUM_LANDMARKS * 3 * 4 + self.frame_count * 9 + self.hand_count
+        }
+
+
+class LandmarkTrace:
+    """Kayitli iz - diziler ve frame bazinda erişim"""
+
+    def __init__(self, timestamps: np.ndarray, hand_counts: np.ndarray, landmarks: np.ndarray,
+                 handedness: np.ndarray, metadata: Optional[Dict[str, Any]] = None,
+                 features: Optional[np.ndarray] = None):
+        self.timestamps = timestamps
+        self.hand_counts = hand_counts
+        self.landmarks = landmarks
+        self.handedness = handedness
+        self.metadata = metadata or {}
+        # El başina ozellik satirlari - eski kayitlarda yoksa ilk erişimde hesaplanir
+        self._features = features
+
+        # Frame i'nin elleri: landmarks[offsets[i]:offsets[i + 1]]
+        self.offsets = np.concatenate(([0], np.cumsum(hand_counts, dtype=np.int64)))
+
+    @classmethod
+    def load(cls, path: str) -> 'LandmarkTrace':
+        """save() ile yazilmiş .npz dosyasini oku"""
+        with np.load(path, allow_pickle=False) as data:
+            metadata = json.loads(str(data['metadata'])) if 'metadata' in data else {}
+            return cls(data['timestamps'], data['hand_counts'], data['landmarks'].astype(np.float32, copy=False),
+                       data['handedness'], metadata, data['features'] if 'features' in data else None)
+
+    @classmethod
+    def from_recorder(cls, recorder: TraceRecorder) -> 'LandmarkTrace':
+        """Kaydi dosyaya yazmadan izi oluştur"""
+        return cls(**recorder.to_arrays(), metadata=dict(recorder.metadata))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def duration(self) -> float:
+        return float(self.timestamps[-1] - self.timestamps[0]) if len(self) > 1 else 0.0
+
+    @property
+    def features(self) -> np.ndarray:
+        """Tum ellerin ozellik satirlari - (el sayisi, len(FEATURE_NAMES))"""
+        if self._features is None:
+            self._features = feature_matrix(self.landmarks)
+        return self._features
+
+    def hand_features(self, index: int) -> np.ndarray:
+        """Frame'in ellerinin ozellik satirlari (FEATURE_NAMES sirasiyla)"""
+        return self.features[self.offsets[index]:self.offsets[index + 1]]
+
+    def hands(self, index: int) -> np.ndarray:
+        """Frame'in elleri - (el sayisi, 21, 3) gorunum (kopya yok)"""
+        return self.landmarks[self.offsets[index]:self.offsets[index + 1]]
+
+    def results(self, index: int):
+        """Frame'i hands.process sonucu gibi dondur (el yoksa alanlar None)"""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return results_from_arrays(self.landmarks[start:end], self.handedness[start:end])
+
+    def __iter__(self) -> Iterator[Tuple[float, Any]]:
+        """(zaman damgasi, sonuç) çiftleri"""
+        for index in range(len(self)):
+            yield float(self.timestamps[index]), self.results(index)
+
+
+class TraceReplayer:
+    """İzi gesture sistemine ya da detektore kamera/MediaPipe olmadan verir"""
+
+    def __init__(self, trace: LandmarkTrace):
+        self.trace = trace
+
+    def replay(self, target, on_frame: Optional[Callable[[float, Any, List[Dict[str, Any]]], None]] = None,
+               clock=None, landmark_objects: bool = False) -> Dict[str, Any]:
+        """Tum frame'leri sirayla işle
+
+        target process_hands'e sahipse (GestureControlSystem) frame'in tum
+        elleri onunla (el başina ayri detektor), process_frame varsa her el
+        onunla, aksi halde detect_gesture ile (GestureDetector) işlenir.
+        Detektore kayittaki (21, 3) diziler verilir - on_frame yoksa landmark
+        nesneleri hiç oluşturulmaz; landmark_objects=True eski nesne girdisini
+        (karşilaştirma için) kullanir. El olmayan frame'lerde varsa
+        clear_last_hand çağrilir. on_frame her frame'den sonra (timestamp,
+        results, gesture_infos) ile çağrilir. clock (FrameClock/VirtualClock)
+        verilirse her frame'den once kayit zamanina ayarlanir - hedef ayni
+        saatle oluşturulmuşsa bekleme sureleri canli çalişmadaki gibi işler.
+        Her frame hedefe kayittaki sira ve zamandan bir FrameContext ile verilir.
+        """
+        process_hands = getattr(target, 'process_hands', None)
+        process_frame = getattr(target, 'process_frame', None)
+        clear_last_hand = getattr(target, 'clear_last_hand', None)
+        detect_gesture = None if process_hands or process_frame else target.detect_gesture
+        needs_results = detect_gesture is None or landmark_objects or on_frame is not None
+
+        frames = hand_frames = 0
+        action_counts: Counter = Counter()
+        start = time.perf_counter()
+        for index in range(len(self.trace)):
+            timestamp = float(self.trace.timestamps[index])
+            frames += 1
+            if clock is not None:
+                clock.set(timestamp)
+            # Canli çalişmadaki gibi frame bağlami - filtreler kayit zamanini kullanir
+            context = FrameContext(index, timestamp)
+            results = self.trace.results(index) if needs_results else None
+            hands = self.trace.hands(index)
+            infos = []
+            if len(hands):
+                hand_frames += 1
+                if process_hands is not None:
+                    infos = process_hands(None, results, context)
+                elif process_frame is not None:
+                    infos = [process_frame(None, hand, context=context) for hand in results.multi_hand_landmarks]
+                elif landmark_objects:
+                    infos = [detect_gesture(hand.landmark, context=context) for hand in results.multi_hand_landmarks]
+                else:
+                    infos = [detect_gesture(points, context=context) for points in hands]
+                action_counts.update(info['action'] for info in infos if info.get('action'))
+            elif clear_last_hand is not None:
+                clear_last_hand()
+
+            if on_frame is not None:
+                on_frame(timestamp, results, infos)
+        elapsed = time.perf_counter() - start
+
+        return {
+            'frames': frames,
+            'hand_frames': hand_frames,
+            'actions': sum(action_counts.values()),
+            'action_counts': dict(action_counts),
+            'elapsed_s': elapsed,
+            'per_frame_us': elapsed / frames * 1e6 if frames else 0.0,
+            'replay_fps': frames / elapsed if elapsed > 0 else 0.0,
+            'realtime_factor': self.trace.duration / elapsed if elapsed > 0 else 0.0
+        }
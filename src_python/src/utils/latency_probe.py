@@ -0,0 +1,182 @@
+"""
+Gecikme olçum modu (latency probe)
+Her frame için yakalama zamani, inference bitişi, detect_gesture bitişi ve
+ActionHandler.move_cursor / execute_action'in (pyautogui) donduğu an
+kaydedilir. Ardişik damgalar arasindaki sureler aşama başina yuzdelik
+dilimlerle raporlanir:
+
+- inference: yakalama -> el algilama bitti (kuyrukta bekleme dahil)
+- gesture:   el algilama -> detect_gesture bitti (filtreler dahil)
+- output:    detect_gesture -> pyautogui dondu (X11 / işletim sistemi)
+- total:     yakalama -> pyautogui dondu
+
+Yakalama damgasi grab() anidir; kameranin pozlama ve aktarim gecikmesi bu
+zincirde gorunmez. Onu olçmek için FlashTest onizlemeyi beyaza boyar ve
+kameranin parlaklik siçramasini gorduğu frame'in yakalama zamanini
+ekranda gosterildiği anla karşilaştirir (ekran + kamera gecikmesi).
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+STAGES = ('capture', 'inference', 'gesture', 'output')
+SEGMENTS = {
+    'inference': ('capture', 'inference'),
+    'gesture': ('inference', 'gesture'),
+    'output': ('gesture', 'output'),
+    'total': ('capture', 'output'),
+}
+PERCENTILES = (50, 90, 95, 99)
+
+
+def latency_summary(samples: Iterable[float]) -> Dict[str, float]:
+    """Sure orneklerinin (ms) sayi, ortalama, yuzdelik ve en buyuk değeri"""
+    values = np.asarray(list(samples), dtype=np.float64)
+    if not len(values):
+        return {'count': 0}
+    summary = {'count': len(values), 'mean_ms': float(values.mean())}
+    for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f'p{p}_ms'] = float(value)
+    summary['max_ms'] = float(values.max())
+    return summary
+
+
+class LatencyProbe:
+    """Frame başina aşama damgalari ve aşama gecikmesi ornekleri
+
+    mark() farkli thread'lerden (inference, eylem) çağrilabilir; frame'ler
+    kamera ve frame_id ile ayirt edilir (çoklu kamera tek olçer). finish()
+    frame'in damgalarindan aşama surelerini hesaplar; eylem uretmeyen
+    frame'ler sadece inference/gesture orneği verir.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time, max_samples: int = 10000,
+                 max_pending: int = 256):
+        self.clock = clock
+        self.max_pending = max_pending
+
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[Any, int], Dict[str, float]] = {}   # (kamera, frame_id) -> damgalar
+        self.samples: Dict[str, Deque[float]] = {name: deque(maxlen=max_samples) for name in SEGMENTS}
+        self.frames = 0
+
+    def mark(self, context, stage: str, timestamp: Optional[float] = None):
+        """Frame'in (FrameContext) aşamasi şimdi bitti - ilk damga yakalama zamanidir"""
+        if context is None:
+            return
+        now = self.clock() if timestamp is None else timestamp
+        key = (context.camera_id, context.frame_id)
+        with self._lock:
+            marks = self._pending.get(key)
+            if marks is None:
+                if len(self._pending) >= self.max_pending:
+                    # finish() çağrilmayan (atilan) frame'ler birikmesin
+                    self._pending.pop(next(iter(self._pending)))
+                marks = self._pending[key] = {'capture': context.capture_time}
+            marks[stage] = now
+
+    def finish(self, context):
+        """Frame işlendi - aşama surelerini orneklere ekle"""
+        if context is None:
+            return
+        with self._lock:
+            marks = self._pending.pop((context.camera_id, context.frame_id), None)
+            if marks is None:
+                return
+            self.frames += 1
+            for name, (start, end) in SEGMENTS.items():
+                if start in marks and end in marks:
+                    self.samples[name].append((marks[end] - marks[start]) * 1000)
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Aşama başina yuzdelik gecikme raporu (ms)"""
+        with self._lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+        return {name: latency_summary(values) for name, values in samples.items()}
+
+
+class FlashTest:
+    """Onizleme flaşi ile ekran -> kamera gecikmesi
+
+    update() her frame'in parlakliği ve yakalama zamaniyla çağrilir; True
+    dondurduğunde onizleme beyaz gosterilmeli, gosterildikten (imshow +
+    waitKey) hemen sonra displayed() çağrilir. Kamera ekrani gormelidir.
+    Flaştan sonraki ilk frame'in parlakliği taban değerini threshold kadar
+    aşarsa gecikme kaydedilir, timeout içinde aşmazsa flaş kaçirilmiş sayilir.
+    """
+
+    IDLE, REQUESTED, FLASHING = 'idle', 'requested', 'flashing'
+
+    def __init__(self, interval: float = 1.0, threshold: float = 40.0, timeout: float = 1.0,
+                 clock: Callable[[], float] = time.time, max_samples: int = 1000):
+        self.interval = interval
+        self.threshold = threshold
+        self.timeout = timeout
+        self.clock = clock
+
+        self.state = self.IDLE
+        self.baseline = 0.0
+        self.flash_time = 0.0
+        self._last_end = clock()
+
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+        self.missed = 0
+
+    @staticmethod
+    def measure(frame: np.ndarray) -> float:
+        """Frame'in ortalama parlakliği (seyrek ornekleme, 0-255)"""
+        return float(frame[::8, ::8].mean())
+
+    def update(self, brightness: float, capture_time: float, now: Optional[float] = None) -> bool:
+        """Frame'i işle - onizleme beyaz gosterilmeli mi?"""
+        now = self.clock() if now is None else now
+        if self.state == self.IDLE:
+            self.baseline = brightness
+            if now - self._last_end >= self.interval:
+                self.state = self.REQUESTED
+        elif self.state == self.FLASHING:
+            if capture_time > self.flash_time and brightness - self.baseline >= self.threshold:
+                self.samples.append((capture_time - self.flash_time) * 1000)
+                self._end(now)
+            elif now - self.flash_time > self.timeout:
+                self.missed += 1
+                self._end(now)
+        return self.state != self.IDLE
+
+    def displayed(self, now: Optional[float] = None):
+        """Beyaz onizleme ekrana verildi"""
+        if self.state == self.REQUESTED:
+            self.flash_time = self.clock() if now is None else now
+            self.state = self.FLASHING
+
+    def _end(self, now: float):
+        self.state = self.IDLE
+        self._last_end = now
+
+    @staticmethod
+    def flash_frame(frame: np.ndarray) -> np.ndarray:
+        """Flaş karesi - onizleme ile ayni boyutta beyaz goruntu"""
+        return np.full_like(frame, 255)
+
+    def report(self) -> Dict[str, Any]:
+        return dict(latency_summary(self.samples), missed=self.missed)
+
+
+def format_report(report: Dict[str, Dict[str, Any]]) -> str:
+    """Raporu satir başina bir aşama olacak şekilde metne çevir"""
+    lines = []
+    for name, summary in report.items():
+        if summary.get('count'):
+            percentiles = ', '.join(f"p{p} {summary[f'p{p}_ms']:.1f}" for p in PERCENTILES)
+            line = (f"   {name}: {summary['count']} ornek, ort. {summary['mean_ms']:.1f} ms "
+                    f"({percentiles}, maks. {summary['max_ms']:.1f})")
+        else:
+            line = f"   {name}: ornek yok"
+        if 'missed' in summary:
+            line += f", kaçirilan {summary['missed']}"
+        lines.append(line)
+    return '\n'.join(lines)
@@ -0,0 +1,143 @@
+"""
+Hareket kapisi
+Inference oncesi kuçultulmuş gri goruntude, inference'a giden son frame ile
+fark alinir (yavaş hareket birikir, frame'den frame'e kaybolmaz). Hareket,
+farkin bolge ortalamalarinin en buyuğudur; kuçuk bir bolgedeki hareket (or.
+pinch) tum goruntunun ortalamasinda kaybolmaz. Sahne durağan ve el takip
+edilmiyorsa hands.process atlanir; el takip ediliyor ama hareket eşiğin
+altindaysa son landmark'lar yeniden kullanilir.
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+GATE_INFER = 'infer'      # Inference çaliştir
+GATE_STATIC = 'static'    # Durağan sahne, el yok - inference atla
+GATE_REUSE = 'reuse'      # El var, hareket yok - son landmark'lari kullan
+
+# Atlanan frame için "el yok" sonucu (hands.process çiktisi ile ayni alanlar)
+NO_HANDS = SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+
+class MotionGate:
+    """Ucuz frame farki ile inference gerekip gerekmediğine karar verir"""
+
+    def __init__(self, motion_threshold: float = 2.5, hand_motion_threshold: float = 1.5,
+                 size: Tuple[int, int] = (64, 48), max_gated_frames: int = 15, block: int = 8):
+        self.motion_threshold = motion_threshold            # El yokken: bolge ortalamasi gri fark eşiği (0-255)
+        self.hand_motion_threshold = hand_motion_threshold  # El varken landmark yeniden kullanma eşiği
+        self.size = size                                    # Fark goruntusu boyutu (genişlik, yukseklik)
+        self.max_gated_frames = max_gated_frames            # Bu kadar ardişik atlamadan sonra zorla inference
+
+        # Tamponlar tek seferlik ayrilir (capture thread'i)
+        w, h = size
+        self._small: Optional[np.ndarray] = None
+        self._gray = np.empty((h, w), dtype=np.uint8)
+        self._ref = np.empty((h, w), dtype=np.uint8)   # Inference'a giden son frame
+        self._diff = np.empty((h, w), dtype=np.uint8)
+        # Fark bolgeleri - block x block piksellik bolgelerin ortalamasi
+        self._blocks_size = (max(1, w // block), max(1, h // block))
+        self._blocks = np.empty((self._blocks_size[1], self._blocks_size[0]), dtype=np.uint8)
+        self._has_ref = False
+
+        # Karar durumu - son inference sonucu (GATE_REUSE'da tekrar verilir)
+        self.hand_tracked = False
+        self.last_results = NO_HANDS
+        self._gated_run = 0
+
+        # İstatistikler
+        self.frames = 0
+        self.frames_inferred = 0
+        self.frames_static = 0
+        self.frames_reused = 0
+        self.motion_sum = 0.0
+        self.motion_samples = 0
+        self.measurements = 0
+        self.measure_time_sum = 0.0
+
+    def measure(self, frame) -> float:
+        """Inference'a giden son frame'e gore hareket - en hareketli bolgenin gri farki
+
+        İlk frame'de ya da boyut değişiminde sonsuz doner (inference zorlanir).
+        Olçulen frame, decide() inference kararini verirse yeni referans olur.
+        """
+        start = time.perf_counter()
+
+        small_shape = (self.size[1], self.size[0]) + frame.shape[2:]
+        if self._small is None or self._small.shape != small_shape:
+            self._small = np.empty(small_shape, dtype=frame.dtype)
+            self._has_ref = False
+
+        cv2.resize(frame, self.size, dst=self._small, interpolation=cv2.INTER_AREA)
+        if self._small.ndim == 3:
+            cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        else:
+            self._gray[...] = self._small
+
+        if self._has_ref:
+            cv2.absdiff(self._gray, self._ref, dst=self._diff)
+            cv2.resize(self._diff, self._blocks_size, dst=self._blocks, interpolation=cv2.INTER_AREA)
+            motion = float(self._blocks.max())
+        else:
+            motion = float('inf')
+
+        self.measurements += 1
+        self.measure_time_sum += time.perf_counter() - start
+        return motion
+
+    def decide(self, motion: float) -> str:
+        """Hareket değerine ve el takibine gore karar ver"""
+        self.frames += 1
+        if motion != float('inf'):
+            self.motion_sum += motion
+            self.motion_samples += 1
+
+        threshold = self.hand_motion_threshold if self.hand_tracked else self.motion_threshold
+        if motion < threshold and self._gated_run < self.max_gated_frames:
+            self._gated_run += 1
+            if self.hand_tracked:
+                self.frames_reused += 1
+                return GATE_REUSE
+            self.frames_static += 1
+            return GATE_STATIC
+
+        # Bu frame inference'a gidiyor - yeni referans (tamponlari takas et, kopya yok)
+        self._ref, self._gray = self._gray, self._ref
+        self._has_ref = True
+
+        self._gated_run = 0
+        self.frames_inferred += 1
+        return GATE_INFER
+
+    def update(self, results):
+        """Inference sonucunu kaydet - sonraki kararlar el durumuna gore verilir"""
+        self.hand_tracked = bool(getattr(results, 'multi_hand_landmarks', None))
+        self.last_results = results if self.hand_tracked else NO_HANDS
+
+    def gated_results(self, decision: str):
+        """Atlanan frame için kullanilacak sonuç"""
+        return self.last_results if decision == GATE_REUSE else NO_HANDS
+
+    def reset(self):
+        """Referans frame'i unut - sonraki frame'de inference zorlanir"""
+        self._has_ref = False
+        self.hand_tracked = False
+        self.last_results = NO_HANDS
+        self._gated_run = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Kapi istatistikleri"""
+        gated = self.frames_static + self.frames_reused
+        return {
+            'frames': self.frames,
+            'frames_inferred': self.frames_inferred,
+            'frames_static': self.frames_static,
+            'frames_reused': self.frames_reused,
+            'skip_ratio': gated / self.frames if self.frames else 0.0,
+            'avg_motion': self.motion_sum / self.motion_samples if self.motion_samples else 0.0,
+            'avg_measure_ms': self.measure_time_sum * 1000 / self.measurements if self.measurements else 0.0
+        }
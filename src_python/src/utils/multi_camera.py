@@ -0,0 +1,109 @@
+"""
+Çoklu kamera zamanlayicisi
+Birden fazla kamera tek bir inference motorunu paylaşir: her adimda sadece
+bir kameranin frame'i işlenir. El goren kamera her frame'de işlenir, diğerleri
+sadece poll_interval araliklarla yoklanir; hiçbir kamera el gormuyorsa sirayla
+işlenir ve toplam inference hizi idle_interval ile sinirlanir. Boylece iki
+kamera tek kameranin iki kati CPU harcamaz. Kamera başina
+inference hizi ve yakalama->sonuç gecikmesi ayri raporlanir.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+
+def parse_sources(sources: Union[str, Iterable, None]) -> List[Union[int, str]]:
+    """"0,2" ya da [0, 'video.mp4'] -> kaynak listesi (rakamlar kamera numarasi)"""
+    if sources is None:
+        return []
+    if isinstance(sources, str):
+        sources = [part.strip() for part in sources.split(',')]
+    parsed = []
+    for source in sources:
+        if source == '' or source is None:
+            continue
+        parsed.append(int(source) if str(source).isdigit() else source)
+    return parsed
+
+
+class CameraScheduler:
+    """Hangi kameranin frame'inin işleneceğine karar verir"""
+
+    def __init__(self, camera_ids: List[Any], poll_interval: float = 0.5, idle_interval: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.camera_ids = list(camera_ids)
+        self.poll_interval = poll_interval   # El gormeyen kamera en az bu aralikla yoklanir (el başka kameradayken)
+        self.idle_interval = idle_interval   # Hiç el yokken iki inference arasi en az bu kadar (tum kameralar toplami)
+        self.clock = clock
+
+        self.hand_active = {cam: False for cam in self.camera_ids}
+        self.last_infer_time = {cam: float('-inf') for cam in self.camera_ids}
+        self.last_any_infer_time = float('-inf')
+        self._cursor = 0   # Sirali seçim için son seçilen kameranin indeksi
+
+        # Kamera başina istatistikler
+        self._start_time = clock()
+        self.frames_inferred = {cam: 0 for cam in self.camera_ids}
+        self.frames_with_hand = {cam: 0 for cam in self.camera_ids}
+        self.latency_sum_ms = {cam: 0.0 for cam in self.camera_ids}
+
+    def _round_robin(self, candidates: List[Any]) -> Optional[Any]:
+        """Adaylar arasindan son seçilenden sonraki kamera"""
+        if not candidates:
+            return None
+        count = len(self.camera_ids)
+        for step in range(1, count + 1):
+            cam = self.camera_ids[(self._cursor + step) % count]
+            if cam in candidates:
+                self._cursor = self.camera_ids.index(cam)
+                return cam
+        return None
+
+    def next_camera(self, ready: Iterable[Any]) -> Optional[Any]:
+        """Yeni frame'i olan kameralardan işlenecek olani seç (yoksa None)"""
+        ready = set(ready)  # Uretec (generator) de verilebilir - bir kez tuketilir
+        ready = [cam for cam in self.camera_ids if cam in ready]
+        if not ready:
+            return None
+
+        active = [cam for cam in ready if self.hand_active[cam]]
+        now = self.clock()
+        if not any(self.hand_active.values()):
+            # Kimse el gormuyor - sirayla, ama toplam hiz tek kamera hizini aşmasin
+            if now - self.last_any_infer_time < self.idle_interval:
+                return None
+            return self._round_robin(ready)
+
+        # El başka kamerada - vakti gelen boştaki kamerayi yokla
+        due = [cam for cam in ready if not self.hand_active[cam]
+               and now - self.last_infer_time[cam] >= self.poll_interval]
+        if due:
+            return self._round_robin(due)
+        return self._round_robin(active)
+
+    def record(self, camera_id: Any, hand_detected: bool, latency_ms: Optional[float] = None):
+        """İşlenen frame'in sonucunu kaydet"""
+        self.hand_active[camera_id] = hand_detected
+        self.last_infer_time[camera_id] = self.last_any_infer_time = self.clock()
+        self.frames_inferred[camera_id] += 1
+        if hand_detected:
+            self.frames_with_hand[camera_id] += 1
+        if latency_ms is not None:
+            self.latency_sum_ms[camera_id] += latency_ms
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Kamera başina inference hizi, gecikme ve el durumu"""
+        elapsed = self.clock() - self._start_time
+        total = sum(self.frames_inferred.values())
+        stats = {}
+        for cam in self.camera_ids:
+            inferred = self.frames_inferred[cam]
+            stats[str(cam)] = {
+                'hand_active': self.hand_active[cam],
+                'frames_inferred': inferred,
+                'frames_with_hand': self.frames_with_hand[cam],
+                'fps': inferred / elapsed if elapsed > 0 else 0.0,
+                'avg_latency_ms': self.latency_sum_ms[cam] / inferred if inferred else 0.0,
+                'share': inferred / total if total else 0.0
+            }
+        return stats
@@ -0,0 +1,294 @@
+"""
+Gorsel geri bildirim
+Onizleme frame'i uzerine landmark, gesture ve sistem durumu çizimi.
+Algilama yolundan ayridir; headless çaliştirmada hiç oluşturulmaz.
+
+Sadece tuşa basinca ya da mod değişince değişen oğeler (yardim metni, mod
+bantlari, kalibrasyon kutusu) bir kez BGRA katmana çizilip onbelleğe alinir
+ve her frame tek bir maskeli kopya (cv2.copyTo) ile frame'e uygulanir.
+Landmark'lar, FPS ve pinch mesafesi gibi dinamik oğeler her frame çizilir.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import cv2
+import numpy as np
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Mod bantlari dinamik satirlarin (kalibrasyon, pinch, gesture) altinda sabit konumda
+BANNER_START_Y = 90
+
+
+def _bgra(color: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
+    """BGR rengi opak BGRA rengine çevir"""
+    return (color[0], color[1], color[2], 255)
+
+
+class StaticLayerCache:
+    """Durum anahtarina gore onbelleğe alinan BGRA katmanlar
+
+    Katman ilk istendiğinde render fonksiyonu ile şeffaf BGRA goruntuye
+    çizilir; sadece dolu piksellerin sinir kutusu ve maskesi saklanir.
+    Anahtar değişince (mod/boyut değişimi) yeni katman oluşturulur; el
+    girip çiktikça gorunum değiştiği için son birkaç katman tutulur.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._layers: Dict[Hashable, Optional[Tuple[Any, ...]]] = {}
+
+        # İstatistikler
+        self.builds = 0
+        self.hits = 0
+
+    def get(self, key: Hashable, shape: Tuple[int, int], render: Callable[[np.ndarray], None]):
+        """Anahtara ait katmani dondur - yoksa oluştur"""
+        if key in self._layers:
+            self.hits += 1
+            return self._layers[key]
+
+        h, w = shape
+        layer = np.zeros((h, w, 4), dtype=np.uint8)
+        render(layer)
+        entry = self._compact(layer)
+
+        if len(self._layers) >= self.max_entries:
+            self._layers.pop(next(iter(self._layers)))
+        self._layers[key] = entry
+        self.builds += 1
+        return entry
+
+    @staticmethod
+    def _compact(layer: np.ndarray) -> Optional[Tuple[Any, ...]]:
+        """BGRA katmani (y0, y1, x0, x1, bgr, maske) bolgesine indir - boşsa None"""
+        alpha = layer[..., 3] > 0
+        rows = np.flatnonzero(alpha.any(axis=1))
+        if rows.size == 0:
+            return None
+        cols = np.flatnonzero(alpha.any(axis=0))
+
+        y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        bgr = np.ascontiguousarray(layer[y0:y1, x0:x1, :3])
+        mask = alpha[y0:y1, x0:x1].astype(np.uint8)
+        return (y0, y1, x0, x1, bgr, mask)
+
+    @staticmethod
+    def blend(frame: np.ndarray, entry) -> np.ndarray:
+        """Katmani frame'e uygula - metin opak (alfa 0/255) oldugu için maskeli tek kopya"""
+        if entry is not None:
+            y0, y1, x0, x1, bgr, mask = entry
+            region = frame[y0:y1, x0:x1]
+            result = cv2.copyTo(bgr, mask, region)
+            if result is not region:
+                # OpenCV hedefi yeniden ayirdiysa (beklenmez) sonucu geri yaz
+                region[...] = result
+        return frame
+
+    def clear(self):
+        """Tum katmanlari geçersiz kil"""
+        self._layers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Onbellek istatistikleri"""
+        total = self.builds + self.hits
+        return {
+            'layers': len(self._layers),
+            'builds': self.builds,
+            'hits': self.hits,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+class OverlayRenderer:
+    """GestureControlSystem durumunu onizleme frame'ine çizer"""
+
+    def __init__(self, system, drawing=None, hand_connections=None, screen_size: Tuple[int, int] = (0, 0)):
+        self.system = system                      # Durum kaynaği (GestureControlSystem)
+        self.drawing = drawing                    # mp.solutions.drawing_utils (opsiyonel)
+        self.hand_connections = hand_connections  # mp_hands.HAND_CONNECTIONS
+        self.screen_w, self.screen_h = screen_size
+
+        self.layers = StaticLayerCache()
+
+    # --- Statik katmanlar -------------------------------------------------
+
+    def _static_key(self, view: str, h: int, w: int) -> Tuple:
+        """Statik katmani etkileyen durum - değişince katman yeniden çizilir"""
+        system = self.system
+        if view == 'feedback':
+            status = system.action_handler.get_status()
+            return (view, h, w, system.show_help, status['safe_mode'], system.tutorial_mode,
+                    status['disabled'], status['cursor_frozen'], status['drag_mode'])
+
+        countdown_sec = system.calibration_countdown // 30 if system.calibration_countdown > 0 else -1
+        return (view, h, w, countdown_sec)
+
+    def _blend_static(self, frame, view: str):
+        """Gorunume ait statik katmani frame'e uygula"""
+        h, w = frame.shape[:2]
+        key = self._static_key(view, h, w)
+        renderers = {
+            'feedback': self._render_feedback_layer,
+            'calibration': self._render_calibration_layer,
+            'no_hand': self._render_no_hand_layer,
+        }
+        self.layers.blend(frame, self.layers.get(key, (h, w), renderers[view]))
+
+    def _render_calibration_layer(self, layer):
+        """Kalibrasyon geri sayimi ve hedef kutusu"""
+        h, w = layer.shape[:2]
+        countdown = self.system.calibration_countdown
+        if countdown <= 0:
+            return
+
+        # Geri sayim goster
+        countdown_sec = countdown // 30
+        cv2.putText(layer, f"Kalibrasyon: {countdown_sec + 1}",
+                    (w // 2 - 100, h // 2), FONT, 1, _bgra((0, 255, 255)), 3)
+
+        # Hedef alan çiz
+        center_x, center_y = w // 2, h // 2
+        cv2.rectangle(layer, (center_x - 100, center_y - 100),
+                      (center_x + 100, center_y + 100), _bgra((0, 255, 255)), 2)
+        cv2.putText(layer, "Elinizi burada tutun",
+                    (center_x - 80, center_y + 130), FONT, 0.6, _bgra((0, 255, 255)), 2)
+
+    def _render_no_hand_layer(self, layer):
+        """El algilanmadi mesaji (+ kalibrasyon kutusu)"""
+        cv2.putText(layer, "El algilanmadi - Elinizi kameranin onune getirin",
+                    (10, 30), FONT, 0.6, _bgra((0, 0, 255)), 2)
+
+        # Kalibrasyon durumunda yardim goster
+        self._render_calibration_layer(layer)
+
+    def _render_feedback_layer(self, layer):
+        """Mod bantlari ve yardim metni"""
+        h = layer.shape[0]
+        system = self.system
+        system_status = system.action_handler.get_status()
+        status_y = BANNER_START_Y
+
+        if system_status['disabled']:
+            cv2.putText(layer, "DEVRE DIŞI", (10, status_y), FONT, 0.8, _bgra((0, 0, 255)), 2)
+            status_y += 30
+
+        if system_status['safe_mode']:
+            cv2.putText(layer, "GUVENLI MOD", (10, status_y), FONT, 0.6, _bgra((0, 255, 0)), 2)
+            status_y += 25
+
+        if system_status['cursor_frozen']:
+            cv2.putText(layer, "İMLEÇ DONDURULDU", (10, status_y), FONT, 0.6, _bgra((255, 0, 255)), 2)
+            status_y += 25
+
+        if system_status['drag_mode']:
+            cv2.putText(layer, "SuRuKLEME MODU", (10, status_y), FONT, 0.6, _bgra((0, 255, 0)), 2)
+            status_y += 25
+
+        # Tutorial modu
+        if system.tutorial_mode:
+            cv2.putText(layer, "TUTORIAL MODU - Eylemler çaliştirilmiyor",
+                        (10, status_y), FONT, 0.5, _bgra((255, 255, 0)), 2)
+            status_y += 20
+
+        # Yardim metni
+        if system.show_help:
+            help_y = h - 40
+            cv2.putText(layer, 'q: çik | c: kalibre et | h: yardimi gizle | t: tutorial | s: guvenli mod',
+                        (10, help_y), FONT, 0.4, _bgra((255, 255, 255)), 1)
+            help_y += 15
+            cv2.putText(layer, 'f: imleç dondur | d: devre dişi | SPACE: durakla | `: debug',
+                        (10, help_y), FONT, 0.4, _bgra((255, 255, 255)), 1)
+
+    # --- Frame başina çizim -----------------------------------------------
+
+    def draw_calibration(self, frame):
+        """Kalibrasyon için overlay çiz"""
+        if self.system.calibration_countdown > 0:
+            self._blend_static(frame, 'calibration')
+
+    def draw_feedback(self, frame, landmarks, gesture_info: Dict):
+        """Gelişmiş gorsel geri bildirim - akilli sistem bilgileri"""
+        h, w, _ = frame.shape
+        system = self.system
+
+        # Kalibrasyon overlay'i
+        if system.calibration_countdown > 0:
+            self.draw_calibration(frame)
+            return
+
+        # Mod bantlari ve yardim metni (onbellekten)
+        self._blend_static(frame, 'feedback')
+
+        # El landmark'larini çiz
+        if self.drawing and self.hand_connections:
+            self.drawing.draw_landmarks(frame, landmarks, self.hand_connections)
+
+        # İşaret parmaği pozisyonu (mavi)
+        index_finger = landmarks.landmark[8]
+        cam_x, cam_y = int(index_finger.x * w), int(index_finger.y * h)
+        cv2.circle(frame, (cam_x, cam_y), 8, (255, 0, 0), -1)
+
+        # Filtrelenmiş cursor pozisyonu (yeşil)
+        if 'cursor_pos' in gesture_info:
+            filter_x, filter_y = gesture_info['cursor_pos']
+            vis_filter_x = int((filter_x / (self.screen_w or w)) * w)
+            vis_filter_y = int((filter_y / (self.screen_h or h)) * h)
+            cv2.circle(frame, (vis_filter_x, vis_filter_y), 6, (0, 255, 0), -1)
+
+        # Gesture durumunu goster
+        status_y = 30
+
+        # Kalibrasyon durumu - geliştirilmiş
+        cal_status = system.detector.get_calibration_status()
+        if cal_status['is_calibrated']:
+            cv2.putText(frame, f"✓ Akilli kalibrasyon (boyut: {cal_status.get('hand_size', 0):.3f})", (10, status_y),
+                        FONT, 0.5, (0, 255, 0), 2)
+        else:
+            progress = (cal_status.get('frames_processed', 0) / 90) * 100
+            cv2.putText(frame, f"⏳ Otomatik kalibrasyon: {progress:.0f}%", (10, status_y),
+                        FONT, 0.5, (0, 255, 255), 2)
+        status_y += 20
+
+        # Pinch durumu - detayli
+        if gesture_info.get('pinch_active', False):
+            pinch_dist = gesture_info.get('raw_pinch_distance', 0)
+            pinch_thresh = gesture_info.get('pinch_threshold', 0)
+            cv2.putText(frame, f"Pinch aktif ({pinch_dist:.3f} < {pinch_thresh:.3f})", (10, status_y),
+                        FONT, 0.5, (255, 255, 0), 2)
+            status_y += 20
+
+        # Mevcut gesture
+        if gesture_info.get('action'):
+            confidence = gesture_info.get('confidence', 0)
+
+            action_text = f"Gesture: {gesture_info['action']} ({confidence:.2f})"
+            cv2.putText(frame, action_text, (10, status_y), FONT, 0.5, (0, 255, 255), 2)
+            status_y += 20
+
+        # Performans istatistikleri (debug modu)
+        if system.debug_mode:
+            perf_stats = system.detector.get_performance_stats()
+            cv2.putText(frame, f"İşlenen frame: {perf_stats['total_frames']}",
+                        (10, h - 80), FONT, 0.4, (255, 255, 255), 1)
+
+            cursor_stats = perf_stats.get('cursor_filter_stats', {})
+            if cursor_stats.get('total_movements', 0) > 0:
+                filter_rate = cursor_stats.get('filter_rate', 0) * 100
+                cv2.putText(frame, f"Filtreleme orani: {filter_rate:.1f}%",
+                            (10, h - 60), FONT, 0.4, (255, 255, 255), 1)
+
+            layer_stats = self.layers.get_stats()
+            cv2.putText(frame, f"Overlay onbellek: %{layer_stats['hit_rate'] * 100:.0f}",
+                        (10, h - 100), FONT, 0.4, (255, 255, 255), 1)
+
+    def draw_no_hand(self, frame):
+        """El algilanmadiğinda bilgi goster"""
+        self._blend_static(frame, 'no_hand')
+
+    def draw_fps(self, frame, fps: Optional[float]):
+        """FPS değerini sağ ust koşeye yaz"""
+        if fps is None:
+            return
+        cv2.putText(frame, f"FPS: {fps:.1f}", (frame.shape[1] - 100, 30),
+                    FONT, 0.6, (255, 255, 255), 2)
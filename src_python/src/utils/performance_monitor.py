@@ -8,6 +8,7 @@ for integration with GNOME Shell extension and other services.
 import os
 import sys
 import time
+import contextlib
 import cv2
 import threading
 import json
@@ -27,6 +28,15 @@ except ImportError as e:
     GestureDetector = None
     ActionHandler = None
 
+try:
+    from src.utils.frame_grabber import LatestFrameGrabber
+    from src.utils.image_ops import FramePool, mirror_in_place, to_rgb
+    from src.utils.motion_gate import GATE_INFER
+except ImportError:
+    from utils.frame_grabber import LatestFrameGrabber
+    from utils.image_ops import FramePool, mirror_in_place, to_rgb
+    from utils.motion_gate import GATE_INFER
+
 
 class PerformanceMonitor:
     """
@@ -83,13 +93,21 @@ class HCIGestureService:
         self.extension_dir = Path(extension_dir)
         self.running = False
         self.camera = None
+        self.frame_grabber = None
         self.gesture_system = None
+
+        # Multi-camera mode (more than one entry in the 'sources' setting):
+        # one source, grabber and gesture system (detector/filter state) per camera
+        self.cameras: Dict[str, Any] = {}
+        self.camera_grabbers: Dict[str, Any] = {}
+        self.camera_systems: Dict[str, Any] = {}
         self.performance_monitor = None
 
         # Status tracking
         self.status = {
             'active': False,
             'calibrated': False,
+            'power_state': 'active',
             'stats': {
                 'frames_processed': 0,
                 'gestures_detected': 0,
@@ -98,7 +116,9 @@ class HCIGestureService:
             },
             'performance': {
                 'fps': 0.0,
-                'avg_processing_time': 0.0
+                'avg_processing_time': 0.0,
+                'frames_dropped': 0,
+                'frames_skipped': 0
             }
         }
 
@@ -118,7 +138,8 @@ class HCIGestureService:
         try:
             # Create gesture control system
             config_path = self.extension_dir / "config" / "gesture_map.json"
-            self.gesture_system = GestureControlSystem(str(config_path))
+            # The service never shows frames: skip all overlay rendering
+            self.gesture_system = GestureControlSystem(str(config_path), settings_override={'headless': True})
 
             # Create performance monitor if available
             if PerformanceMonitor:
@@ -132,16 +153,65 @@ class HCIGestureService:
             print(f"[X] Failed to initialize service components: {e}")
             self.status['stats']['errors'] += 1
 
+    def _init_cameras(self):
+        """Open every configured source; each camera gets its own gesture system"""
+        config_path = self.extension_dir / "config" / "gesture_map.json"
+        try:
+            for index, spec in enumerate(self.gesture_system.sources):
+                if index == 0:
+                    system = self.gesture_system
+                else:
+                    # Own detector and SmartCursor state, shared ActionHandler (one pointer, one rate limit)
+                    system = GestureControlSystem(str(config_path), settings_override={'headless': True},
+                                                  action_handler=self.gesture_system.action_handler)
+                    # One latency probe for all cameras (frames are keyed by camera id)
+                    system.latency_probe = self.gesture_system.latency_probe
+
+                source = system.create_frame_source(spec)
+                if not source.isOpened():
+                    raise RuntimeError(f"Could not open {source.description}")
+                profile = system.configure_capture(source)
+
+                camera_id = str(spec)
+                self.cameras[camera_id] = source
+                self.camera_systems[camera_id] = system
+                self.status.setdefault('capture_profiles', {})[camera_id] = profile
+
+            # Single-camera attributes point at the first camera
+            self.camera = next(iter(self.cameras.values()))
+            print(f"[✓] {len(self.cameras)} cameras initialized ({', '.join(self.cameras)})")
+
+        except Exception as e:
+            print(f"[X] Failed to initialize cameras: {e}")
+            self.status['stats']['errors'] += 1
+            for source in self.cameras.values():
+                source.release()
+            self.cameras.clear()
+            self.camera_systems.clear()
+            raise
+
     def _init_camera(self):
         """Initialize camera"""
+        if self.gesture_system and len(getattr(self.gesture_system, 'sources', [])) > 1:
+            self._init_cameras()
+            return
+
         try:
             camera_index = getattr(self.gesture_system, 'camera_index', 0) if self.gesture_system else 0
-            self.camera = cv2.VideoCapture(camera_index)
+            if self.gesture_system and hasattr(self.gesture_system, 'create_frame_source'):
+                # Camera, or a video file / image directory from the 'source' setting
+                self.camera = self.gesture_system.create_frame_source()
+            else:
+                self.camera = cv2.VideoCapture(camera_index)
 
             if not self.camera.isOpened():
-                raise RuntimeError(f"Could not open camera {camera_index}")
+                raise RuntimeError(f"Could not open {getattr(self.camera, 'description', f'camera {camera_index}')}")
 
-            print(f"[✓] Camera initialized (index: {camera_index})")
+            # Request resolution/FPS/fourcc and record what the driver granted
+            if self.gesture_system and hasattr(self.gesture_system, 'configure_capture'):
+                self.status['capture_profile'] = self.gesture_system.configure_capture(self.camera)
+
+            print(f"[✓] Camera initialized ({getattr(self.camera, 'description', f'index: {camera_index}')})")
 
         except Exception as e:
             print(f"[X] Failed to initialize camera: {e}")
@@ -163,9 +233,26 @@ class HCIGestureService:
             if self.camera is None:
                 self._init_camera()
 
+            # Capture thread keeps only the newest frame for the processing loop.
+            # Buffers in flight: one being written, one in the slot, one being processed.
+            # The loops are single-threaded, so a frame goes back to the pool on the next read.
+            # Recorded sources read with 'fast' pacing deliver every frame (no drops).
+            if self.cameras:
+                self.camera_grabbers = {
+                    camera_id: LatestFrameGrabber(source, name=f"hci-frame-grabber-{camera_id}",
+                                                  pool=FramePool(3), release_previous=True).start()
+                    for camera_id, source in self.cameras.items()
+                }
+                self.frame_grabber = next(iter(self.camera_grabbers.values()))
+                loop = self._multi_camera_loop
+            else:
+                self.frame_grabber = LatestFrameGrabber(self.camera, pool=FramePool(3), release_previous=True,
+                                                        lossless=getattr(self.camera, 'lossless', False)).start()
+                loop = self._processing_loop
+
             # Start processing thread
             self.stop_event.clear()
-            self.processing_thread = threading.Thread(target=self._processing_loop, daemon=True)
+            self.processing_thread = threading.Thread(target=loop, daemon=True)
             self.processing_thread.start()
 
             self.running = True
@@ -188,72 +275,365 @@ class HCIGestureService:
         self.running = False
         self.status['active'] = False
 
+        if self.frame_grabber:
+            self.frame_grabber.stop()
+        for grabber in self.camera_grabbers.values():
+            grabber.stop()
+
         if self.processing_thread and self.processing_thread.is_alive():
             self.processing_thread.join(timeout=2.0)
 
+        self.frame_grabber = None
+        self.camera_grabbers = {}
+
+        if self.cameras:
+            for source in self.cameras.values():
+                source.release()
+            self.cameras.clear()
+            self.camera_systems.clear()
+            self.camera = None
+
         if self.camera:
             self.camera.release()
             self.camera = None
 
         print("🛑 HCI Gesture Service stopped")
 
+    @staticmethod
+    def _state_lock(system):
+        """Lock guarding the gesture system's detector state (no-op if it has none)"""
+        lock = getattr(system, 'state_lock', None)
+        return lock if lock is not None else contextlib.nullcontext()
+
+    @staticmethod
+    def _probe_mark(system, context, stage: str):
+        """Latency probe stamp (latency_probe setting) - capture time comes from the context"""
+        probe = getattr(system, 'latency_probe', None)
+        if probe is not None:
+            probe.mark(context, stage)
+
+    @staticmethod
+    def _probe_finish(system, context):
+        """Turn the frame's latency stamps into per-stage samples"""
+        probe = getattr(system, 'latency_probe', None)
+        if probe is not None:
+            probe.finish(context)
+
+    def _save_latency_report(self):
+        """Print/save the latency report when the probe is on and expose it in the status"""
+        if self.gesture_system and getattr(self.gesture_system, 'latency_probe', None) is not None:
+            self.status['performance']['latency'] = self.gesture_system.save_latency_report()
+
+    def _handle_results(self, frame, results, system=None, context=None):
+        """Run gesture processing on hand-detection results and update status
+
+        context (FrameContext) carries the frame's capture time down to the
+        detector, filters and action handler.
+        """
+        system = system or self.gesture_system
+        if not system:
+            return
+
+        # Calibration commands arrive from other threads; hold the system's state lock
+        with self._state_lock(system):
+            if not results.multi_hand_landmarks:
+                gesture_infos = []
+                if hasattr(system, 'clear_last_hand'):
+                    system.clear_last_hand()
+            elif hasattr(system, 'process_hands'):
+                # All hands in one batched pass, each with its own detector state
+                gesture_infos = system.process_hands(frame, results, context)
+            else:
+                gesture_infos = [system.process_frame(frame, landmarks)
+                                 for landmarks in results.multi_hand_landmarks]
+
+        # Gesture and output marks are taken by the gesture system; close the frame's samples
+        self._probe_finish(system, context)
+
+        for gesture_info in gesture_infos:
+            # Update status
+            if gesture_info.get('action'):
+                self.status['stats']['gestures_detected'] += 1
+
+            # Update calibration status
+            if hasattr(system, 'detector'):
+                cal_status = system.detector.get_calibration_status()
+                self.status['calibrated'] = cal_status.get('is_calibrated', False)
+
+            # Call gesture callback
+            if self.on_gesture_detected and gesture_info.get('action'):
+                self.on_gesture_detected(gesture_info)
+
+    def _multi_camera_loop(self):
+        """Processing loop for several cameras sharing one inference thread
+
+        Only one frame is inferred at a time. The camera scheduler runs the
+        camera that sees a hand on every frame and polls the others; while no
+        camera sees a hand the total rate is capped at multi_camera_idle_fps, so
+        N cameras cost about as much CPU as one. Each camera keeps its own
+        Hands instance, so MediaPipe's tracker never mixes streams, and its own
+        idle controller, motion gate and frame scheduler. Trace recording is
+        single-stream only and is disabled when several sources are configured.
+        """
+        scheduler = self.gesture_system.create_camera_scheduler(list(self.camera_grabbers))
+        systems = self.camera_systems
+        roi_trackers = {camera_id: system.create_roi_tracker() for camera_id, system in systems.items()}
+        # One RGB buffer per camera, so cameras with different resolutions never reallocate it
+        rgb_pools = {camera_id: FramePool(1) for camera_id in systems}
+        idles = {camera_id: system.create_idle_controller() for camera_id, system in systems.items()}
+        gates = {camera_id: system.create_motion_gate() for camera_id, system in systems.items()}
+        frame_schedulers = {camera_id: system.create_frame_scheduler() for camera_id, system in systems.items()}
+        last_ids = {camera_id: 0 for camera_id in systems}
+
+        with contextlib.ExitStack() as stack:
+            hands = {camera_id: stack.enter_context(system.create_hands())
+                     for camera_id, system in systems.items()}
+
+            frame_count = 0
+            start_time = time.time()
+
+            while not self.stop_event.is_set():
+                try:
+                    grabbers = self.camera_grabbers
+                    if not any(grabber.isOpened() for grabber in grabbers.values()):
+                        break
+
+                    # An idle camera is only offered once its low-power interval has passed
+                    camera_id = scheduler.next_camera(
+                        camera_id for camera_id, grabber in grabbers.items()
+                        if grabber.has_new_frame and idles[camera_id].wait_time() <= 0)
+                    if camera_id is None:
+                        # No new frame yet, or no hand anywhere and the idle rate cap is reached
+                        self.stop_event.wait(0.002)
+                        continue
+
+                    grabber = grabbers[camera_id]
+                    system = systems[camera_id]
+                    idle = idles[camera_id]
+                    gate = gates[camera_id]
+                    ok, frame = grabber.read(timeout=0)
+                    if not ok:
+                        continue
+
+                    frames_since_last = grabber.last_frame_id - last_ids[camera_id]
+                    last_ids[camera_id] = grabber.last_frame_id
+                    if not idle.should_process(frames_since_last):
+                        continue
+                    context = grabber.frame_context(camera_id)
+
+                    frame_count += 1
+                    self.status['stats']['frames_processed'] = frame_count
+
+                    decision = gate.decide(gate.measure(frame)) if gate is not None else GATE_INFER
+
+                    process_start = None
+                    if decision != GATE_INFER:
+                        # Static scene: no inference, last landmarks are replayed if a hand is tracked
+                        results = gate.gated_results(decision)
+                    elif not frame_schedulers[camera_id].should_infer():
+                        # Over budget: reuse last landmarks and the cursor predictor
+                        with self._state_lock(system):
+                            system.process_skipped_frame(frame, context)
+                        self._probe_finish(system, context)
+                        continue
+                    else:
+                        process_start = time.perf_counter()
+                        frame, rgb = system.prepare_frame(frame, rgb_pools[camera_id])
+                        scale = idle.inference_scale(system.inference_scale)
+                        results = system.infer_hands(hands[camera_id], rgb, roi_trackers[camera_id], scale)
+                        rgb_pools[camera_id].release(rgb)
+                        self._probe_mark(system, context, 'inference')
+                        if gate is not None:
+                            gate.update(results)
+
+                    hand_detected = bool(results.multi_hand_landmarks)
+                    idle.update(hand_detected)
+                    # While idle the camera's grabber only decodes frames at the idle rate
+                    grabber.decode_interval = idle.decode_interval
+                    self._handle_results(frame, results, system, context)
+                    if process_start is not None:
+                        frame_schedulers[camera_id].record((time.perf_counter() - process_start) * 1000)
+
+                    latency_ms = context.age_ms()
+                    scheduler.record(camera_id, hand_detected, latency_ms)
+
+                    if frame_count % 30 == 0:
+                        elapsed = time.time() - start_time
+                        self.status['performance']['fps'] = frame_count / elapsed if elapsed > 0 else 0.0
+                        self.status['cameras'] = scheduler.get_stats()
+                        for cam, camera_stats in self.status['cameras'].items():
+                            camera_stats['power_state'] = idles[cam].state
+                            camera_stats['frames_skipped'] = frame_schedulers[cam].frames_skipped
+                            if gates[cam] is not None:
+                                camera_stats['motion_gate'] = gates[cam].get_stats()
+                        self.status['power_state'] = ('idle' if all(idle.is_idle for idle in idles.values())
+                                                      else 'active')
+                        self.status['performance']['buffer_allocations'] = {
+                            camera_id: {
+                                'capture': grabbers[camera_id].pool.get_stats() if grabbers[camera_id].pool else None,
+                                'rgb': pool.get_stats()
+                            }
+                            for camera_id, pool in rgb_pools.items()
+                        }
+
+                    if self.on_status_change:
+                        self.on_status_change(self.status)
+
+                except Exception as e:
+                    print(f"Error in multi-camera loop: {e}")
+                    self.status['stats']['errors'] += 1
+                    time.sleep(0.1)  # Brief pause on error
+
+            self._save_latency_report()
+
     def _processing_loop(self):
         """Main processing loop"""
         import mediapipe as mp
 
         mp_hands = mp.solutions.hands
-        mp_drawing = mp.solutions.drawing_utils
 
         confidence_level = getattr(self.gesture_system, 'confidence_minimum', 0.7) if self.gesture_system else 0.7
 
-        with mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=confidence_level,
-            min_tracking_confidence=confidence_level
-        ) as hands:
+        # In-process landmark backend (solutions or async tasks), or a worker process
+        # when inference_worker is set
+        if self.gesture_system and hasattr(self.gesture_system, 'create_hands'):
+            hands_context = self.gesture_system.create_hands()
+        else:
+            hands_context = mp_hands.Hands(
+                max_num_hands=getattr(self.gesture_system, 'max_num_hands', 1),
+                min_detection_confidence=confidence_level,
+                min_tracking_confidence=confidence_level
+            )
+
+        with hands_context as hands:
 
             frame_count = 0
             start_time = time.time()
 
-            while not self.stop_event.is_set() and self.camera and self.camera.isOpened():
-                try:
-                    ok, frame = self.camera.read()
-                    if not ok:
-                        break
+            # Optional hand-ROI tracking: run inference on a crop around the last hand
+            roi_tracker = None
+            if self.gesture_system and hasattr(self.gesture_system, 'create_roi_tracker'):
+                roi_tracker = self.gesture_system.create_roi_tracker()
 
-                    frame_count += 1
-                    self.status['stats']['frames_processed'] = frame_count
+            # Skip inference on some frames when over the settings.performance budget
+            scheduler = None
+            if self.gesture_system and hasattr(self.gesture_system, 'create_frame_scheduler'):
+                scheduler = self.gesture_system.create_frame_scheduler()
 
-                    # Flip frame
-                    frame = cv2.flip(frame, 1)
-                    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Low-power idle mode: after idle_timeout seconds without a hand, poll slowly
+            idle = None
+            if self.gesture_system and hasattr(self.gesture_system, 'create_idle_controller'):
+                idle = self.gesture_system.create_idle_controller()
 
-                    # Process with MediaPipe
-                    results = hands.process(rgb)
+            # Optional motion gate: skip inference on a static scene
+            gate = None
+            if self.gesture_system and hasattr(self.gesture_system, 'create_motion_gate'):
+                gate = self.gesture_system.create_motion_gate()
 
-                    if results.multi_hand_landmarks:
-                        for landmarks in results.multi_hand_landmarks:
-                            # Process frame with gesture system
-                            if self.gesture_system:
-                                gesture_info = self.gesture_system.process_frame(frame, landmarks)
+            # Optional landmark trace recording (record_trace setting)
+            recorder = None
+            if self.gesture_system and hasattr(self.gesture_system, 'create_trace_recorder'):
+                recorder = self.gesture_system.create_trace_recorder()
 
-                                # Update status
-                                if gesture_info.get('action'):
-                                    self.status['stats']['gestures_detected'] += 1
+            # RGB conversion writes into a reused buffer (the loop is single-threaded)
+            rgb_pool = FramePool(1)
 
-                                # Update calibration status
-                                if hasattr(self.gesture_system, 'detector'):
-                                    cal_status = self.gesture_system.detector.get_calibration_status()
-                                    self.status['calibrated'] = cal_status.get('is_calibrated', False)
+            grabber = self.frame_grabber
+            while not self.stop_event.is_set() and grabber and grabber.isOpened():
+                try:
+                    if idle is not None:
+                        # While idle the grabber only decodes frames at the idle rate
+                        grabber.decode_interval = idle.decode_interval
+                        wait = idle.wait_time()
+                        if wait > 0:
+                            # Frames captured meanwhile are dropped by the grabber
+                            self.stop_event.wait(wait)
+
+                    last_id = grabber.last_frame_id
+                    ok, frame = grabber.read()
+                    if not ok:
+                        break
 
-                                # Call gesture callback
-                                if self.on_gesture_detected and gesture_info.get('action'):
-                                    self.on_gesture_detected(gesture_info)
+                    if idle is not None and not idle.should_process(grabber.last_frame_id - last_id):
+                        continue
+                    context = grabber.frame_context()
+
+                    frame_count += 1
+                    self.status['stats']['frames_processed'] = frame_count
+
+                    decision = gate.decide(gate.measure(frame)) if gate is not None else GATE_INFER
+
+                    if decision != GATE_INFER:
+                        # Static scene: no inference, last landmarks are replayed if a hand is tracked
+                        results = gate.gated_results(decision)
+                        if idle is not None:
+                            idle.update(bool(results.multi_hand_landmarks))
+                        if recorder is not None:
+                            recorder.record(results, context.capture_time)
+                        self._handle_results(frame, results, context=context)
+                    elif scheduler is not None and not scheduler.should_infer():
+                        # Over budget: reuse last landmarks and the cursor predictor
+                        with self._state_lock(self.gesture_system):
+                            self.gesture_system.process_skipped_frame(frame, context)
+                        self._probe_finish(self.gesture_system, context)
+                    else:
+                        process_start = time.perf_counter()
+
+                        # Mirror in place, or leave it to landmark mirroring (no image flip)
+                        if self.gesture_system and hasattr(self.gesture_system, 'prepare_frame'):
+                            frame, rgb = self.gesture_system.prepare_frame(frame, rgb_pool)
+                        else:
+                            mirror_in_place(frame)
+                            rgb = to_rgb(frame, rgb_pool)
+
+                        # Process with MediaPipe (ROI crop / inference scale per settings)
+                        if self.gesture_system and hasattr(self.gesture_system, 'infer_hands'):
+                            scale = idle.inference_scale(self.gesture_system.inference_scale) if idle else None
+                            results = self.gesture_system.infer_hands(hands, rgb, roi_tracker, scale)
+                        else:
+                            results = hands.process(rgb)
+                        rgb_pool.release(rgb)
+                        self._probe_mark(self.gesture_system, context, 'inference')
+
+                        if idle is not None:
+                            idle.update(bool(results.multi_hand_landmarks))
+
+                        if gate is not None:
+                            gate.update(results)
+                        if recorder is not None:
+                            recorder.record(results, context.capture_time)
+
+                        self._handle_results(frame, results, context=context)
+
+                        if scheduler is not None:
+                            scheduler.record((time.perf_counter() - process_start) * 1000)
 
                     # Update performance stats
                     if frame_count % 30 == 0:  # Every 30 frames
                         elapsed = time.time() - start_time
                         self.status['performance']['fps'] = frame_count / elapsed
+                        self.status['performance']['frames_dropped'] = grabber.frames_dropped
+                        if roi_tracker is not None:
+                            self.status['performance']['roi'] = roi_tracker.get_stats()
+                        self.status['performance']['buffer_allocations'] = {
+                            'capture': grabber.pool.get_stats() if grabber.pool else None,
+                            'rgb': rgb_pool.get_stats()
+                        }
+                        if idle is not None:
+                            idle_stats = idle.get_stats()
+                            self.status['power_state'] = idle_stats['state']
+                            self.status['performance']['idle'] = idle_stats
+                        if gate is not None:
+                            self.status['performance']['motion_gate'] = gate.get_stats()
+                        if hasattr(hands, 'get_stats'):
+                            # Landmark backends (solutions/tasks) carry a name; the worker keeps its own key
+                            key = 'hand_backend' if getattr(hands, 'name', None) else 'inference_worker'
+                            self.status['performance'][key] = hands.get_stats()
+                        if hasattr(self.camera, 'get_stats'):
+                            self.status['performance']['source'] = self.camera.get_stats()
+                        if scheduler is not None:
+                            self.status['performance']['frames_skipped'] = scheduler.frames_skipped
+                            self.status['performance']['scheduler'] = scheduler.get_stats()
 
                         if self.performance_monitor:
                             perf_stats = self.performance_monitor.get_stats()
@@ -268,6 +648,11 @@ class HCIGestureService:
                     self.status['stats']['errors'] += 1
                     time.sleep(0.1)  # Brief pause on error
 
+            # Write the trace once the loop ends (service stopped or source exhausted)
+            if recorder is not None:
+                self.gesture_system.save_trace(recorder)
+            self._save_latency_report()
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get current service status
@@ -325,7 +710,8 @@ class HCIGestureService:
     def reset_calibration(self):
         """Reset calibration"""
         if self.gesture_system and hasattr(self.gesture_system, 'detector'):
-            self.gesture_system.detector.reset_calibration()
+            with self._state_lock(self.gesture_system):
+                self.gesture_system.detector.reset_calibration()
             self.status['calibrated'] = False
 
     def __del__(self):
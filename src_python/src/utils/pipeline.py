@@ -0,0 +1,297 @@
+"""
+Frame işleme hatti (pipeline)
+Yakalama, inference ve eylem aşamalarini ayri thread'lerde çaliştirir.
+Aşamalar arasinda kuçuk, sinirli kuyruklar vardir; boylece toplam verim
+seri toplam yerine en yavaş aşamanin hizina yaklaşir.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BACKPRESSURE_POLICIES = ('drop_oldest', 'block')
+
+# Kuyruk sonu işareti - kaynak bittiğinde aşamalar boyunca iletilir
+_END_OF_STREAM = object()
+
+
+class StageQueue:
+    """Sinirli kuyruk - dolunca en eskiyi at ya da yer açilana kadar bekle"""
+
+    def __init__(self, maxsize: int = 2, policy: str = 'drop_oldest', name: str = '',
+                 on_drop: Optional[Callable[[Any], None]] = None):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Bilinmeyen backpressure politikasi: {policy}")
+
+        self.maxsize = max(1, int(maxsize))
+        self.policy = policy
+        self.name = name
+        # Atilan oğe için geri çağirma - or. frame tamponunu havuza geri vermek
+        self.on_drop = on_drop
+
+        self._items = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        # İstatistikler
+        self.max_depth = 0
+        self.items_put = 0
+        self.items_dropped = 0
+
+    def put(self, item, force: bool = False) -> bool:
+        """Oğe ekle. Kuyruk kapaliysa False doner.
+
+        force=True kapasiteyi yok sayar (sadece akiş sonu işareti için).
+        """
+        with self._condition:
+            if not force:
+                if self.policy == 'block':
+                    self._condition.wait_for(lambda: len(self._items) < self.maxsize or self._closed)
+                elif len(self._items) >= self.maxsize:
+                    # En eski oğeyi at - gecikme birikmesin
+                    dropped = self._items.popleft()
+                    self.items_dropped += 1
+                    if self.on_drop is not None:
+                        self.on_drop(dropped)
+
+            if self._closed:
+                return False
+
+            self._items.append(item)
+            if not force:
+                self.items_put += 1
+                self.max_depth = max(self.max_depth, len(self._items))
+            self._condition.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None):
+        """Oğe al. Kuyruk kapali ve boşsa ya da timeout olursa None doner."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._items or self._closed, timeout=timeout):
+                return None
+            if not self._items:
+                return None
+
+            item = self._items.popleft()
+            self._condition.notify_all()
+            return item
+
+    def close(self):
+        """Kuyruğu kapat ve bekleyenleri uyandir"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    @property
+    def depth(self) -> int:
+        """Anlik kuyruk derinliği"""
+        return len(self._items)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Kuyruk istatistikleri"""
+        return {
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'capacity': self.maxsize,
+            'items_put': self.items_put,
+            'items_dropped': self.items_dropped
+        }
+
+
+class PipelineStage:
+    """Tek bir aşama - kendi thread'inde girdi kuyruğundan okuyup işler"""
+
+    def __init__(self, name: str, func: Callable, input_queue: Optional[StageQueue],
+                 output_queue: StageQueue):
+        self.name = name
+        self.func = func
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.thread: Optional[threading.Thread] = None
+
+        # Oğe işleniyor mu - FramePipeline.pause() bunun bitmesini bekler
+        self.busy = False
+
+        # Zamanlama istatistikleri
+        self.items_processed = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+
+    def _run_func(self, item) -> Tuple[bool, Any]:
+        """Aşama fonksiyonunu çaliştir - (hatasiz_mi, sonuç)"""
+        start = time.perf_counter()
+        try:
+            result = self.func(item) if self.input_queue is not None else self.func()
+            return True, result
+        except Exception as e:
+            print(f"Pipeline aşamasi hatasi ({self.name}): {e}")
+            self.errors += 1
+            return False, None
+        finally:
+            self.last_time = time.perf_counter() - start
+            self.total_time += self.last_time
+
+    def run(self, stop_event: threading.Event, resume_event: Optional[threading.Event] = None):
+        """Aşama dongusu - resume_event temizse (duraklatildi) oğeler arasinda bekler"""
+        while not stop_event.is_set():
+            item = None
+            if self.input_queue is not None:
+                item = self.input_queue.get()
+                if item is None or item is _END_OF_STREAM:
+                    break
+            # busy, duraklatma kontrolunden once işaretlenir; boylece pause()
+            # ya bu oğeyi bekler ya da aşama oğeyi işlemeden once durur
+            self.busy = True
+            if resume_event is not None and not resume_event.is_set():
+                self.busy = False
+                resume_event.wait()
+                if stop_event.is_set():
+                    break
+                self.busy = True
+
+            ok, result = self._run_func(item)
+            self.busy = False
+            if self.input_queue is None and ok and result is None:
+                # Kaynak aşamasi: hatasiz None dondurmesi kaynağin bittiği anlamina gelir
+                break
+
+            if not ok:
+                time.sleep(0.01)  # Hata sonrasi kisa bekleme
+                continue
+            if result is None:
+                continue
+
+            self.items_processed += 1
+            if not self.output_queue.put(result):
+                break
+
+        # Sonraki aşamaya akişin bittiğini bildir
+        self.output_queue.put(_END_OF_STREAM, force=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Aşama istatistikleri"""
+        processed = self.items_processed
+        return {
+            'items_processed': processed,
+            'errors': self.errors,
+            'avg_time_ms': (self.total_time / processed * 1000) if processed else 0.0,
+            'last_time_ms': self.last_time * 1000
+        }
+
+
+class FramePipeline:
+    """Çok aşamali frame hatti
+
+    source: argumansiz fonksiyon, her çağrida yeni oğe (ya da bitti için None) dondurur
+    stages: [(isim, fonksiyon), ...] - her fonksiyon oğeyi alir, yeni oğe dondurur
+    Son aşamanin çiktilari ana thread'de get_output() ile alinir (ornek: cv2.imshow).
+    on_drop: kuyruklarda atilan her oğe için çağrilir (drop_oldest politikasi)
+    """
+
+    def __init__(self, source: Callable[[], Any], stages: List[Tuple[str, Callable]],
+                 queue_size: int = 2, backpressure: str = 'drop_oldest',
+                 source_name: str = 'capture', on_drop: Optional[Callable[[Any], None]] = None):
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self.queues: List[StageQueue] = []
+        self.stages: List[PipelineStage] = []
+
+        names = [source_name] + [name for name, _ in stages]
+        funcs = [source] + [func for _, func in stages]
+
+        input_queue = None
+        for name, func in zip(names, funcs):
+            output_queue = StageQueue(queue_size, backpressure, name=f"{name}_out", on_drop=on_drop)
+            self.queues.append(output_queue)
+            self.stages.append(PipelineStage(name, func, input_queue, output_queue))
+            input_queue = output_queue
+
+        self.output_queue = self.queues[-1]
+        self._finished = False
+
+    @staticmethod
+    def max_items_in_flight(stage_count: int, queue_size: int) -> int:
+        """Ayni anda hatta bulunabilecek en fazla oğe sayisi
+
+        Her aşama bir oğe işlerken çikiş kuyruğu dolu olabilir; get_output()
+        ile alinan son oğe de ana thread'de kullanimdadir. Oğeler frame
+        tamponu taşiyorsa, tamponlar işleri bitince (ya da kuyrukta atilinca,
+        bkz. on_drop) havuza geri verilir; FramePool bu kadar tampon (+
+        uretici tarafinda tutulanlar) ile kararli durumda yeni ayirma yapmaz.
+        """
+        return stage_count * (queue_size + 1) + 1
+
+    def start(self) -> 'FramePipeline':
+        """Tum aşama thread'lerini başlat"""
+        self._stop_event.clear()
+        for stage in self.stages:
+            stage.thread = threading.Thread(target=stage.run, args=(self._stop_event, self._resume_event),
+                                            name=f"hci-pipeline-{stage.name}", daemon=True)
+            stage.thread.start()
+        return self
+
+    def get_output(self, timeout: Optional[float] = None):
+        """Son aşamanin bir sonraki çiktisi. Akiş bittiyse None doner."""
+        if self._finished:
+            return None
+
+        item = self.output_queue.get(timeout=timeout)
+        if item is _END_OF_STREAM:
+            self._finished = True
+            return None
+        return item
+
+    def pause(self, timeout: float = 1.0) -> bool:
+        """Tum aşamalari durdur - işlenmekte olan oğelerin bitmesini bekler
+
+        Donuşten sonra hiçbir aşama (eylem dahil) yeni oğe işlemez; kuyruktaki
+        oğeler resume() ile kaldiği yerden devam eder. timeout içinde bitmeyen
+        aşama varsa False doner.
+        """
+        self._resume_event.clear()
+        deadline = time.monotonic() + timeout
+        while any(stage.busy for stage in self.stages):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def resume(self):
+        """Duraklatilmiş hatti devam ettir"""
+        self._resume_event.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._resume_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        """Kaynak bitti ve tum çiktilar tuketildi mi?"""
+        return self._finished
+
+    def stop(self, timeout: float = 2.0):
+        """Hatti durdur ve thread'leri bekle"""
+        self._stop_event.set()
+        self._resume_event.set()  # Duraklatilmiş aşamalar da çikabilsin
+        for queue in self.queues:
+            queue.close()
+        for stage in self.stages:
+            if stage.thread is not None and stage.thread.is_alive():
+                stage.thread.join(timeout=timeout)
+
+    def get_queue_depths(self) -> Dict[str, int]:
+        """Aşama çikiş kuyruklarinin anlik derinlikleri"""
+        return {stage.name: stage.output_queue.depth for stage in self.stages}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Aşama ve kuyruk istatistikleri"""
+        return {
+            stage.name: {
+                **stage.get_stats(),
+                'queue': stage.output_queue.get_stats()
+            }
+            for stage in self.stages
+        }
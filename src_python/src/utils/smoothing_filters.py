@@ -5,24 +5,32 @@ El hareketlerindeki titremeleri minimize eder ve daha hassas kontrol sağlar
 
 import numpy as np
 import math
-from typing import Tuple, List, Optional, Dict, Any
+from typing import Tuple, List, Optional, Dict, Any, Callable
 from collections import deque
+
 import time
 
+try:
+    from .hand_features import HandFeatures
+except ImportError:
+    # Duz import (utils dizini sys.path'te, paket olmadan)
+    from hand_features import HandFeatures
+
 
 class AdaptiveFilter:
     """El hareketlerine uyum sağlayan akilli filtre"""
     
-    def __init__(self, window_size: int = 5):
+    def __init__(self, window_size: int = 5, clock: Callable[[], float] = time.time):
         self.window_size = window_size
+        self.clock = clock  # Zaman kaynaği (tekrar oynatmada frame zamani)
         self.position_history = deque(maxlen=window_size)
         self.velocity_history = deque(maxlen=window_size)
         self.last_position = None
         self.last_time = None
         
-    def add_position(self, x: float, y: float) -> Tuple[float, float]:
-        """Yeni pozisyon ekle ve filtrelenmiş pozisyon dondur"""
-        current_time = time.time()
+    def add_position(self, x: float, y: float, timestamp: Optional[float] = None) -> Tuple[float, float]:
+        """Yeni pozisyon ekle ve filtrelenmiş pozisyon dondur (timestamp: frame yakalama zamani)"""
+        current_time = self.clock() if timestamp is None else timestamp
         
         if self.last_position is not None and self.last_time is not None:
             # Hiz hesapla
@@ -121,6 +129,16 @@ class KalmanFilter:
         
         return (self.state[0], self.state[1])
     
+    def predict(self) -> Tuple[float, float]:
+        """Olçum olmadan bir adim ileri tahmin et (atlanan frame'ler için)"""
+        if not self.initialized:
+            return (self.state[0], self.state[1])
+        
+        self.state = self.F @ self.state
+        self.P = self.F @ self.P @ self.F.T + self.Q
+        
+        return (self.state[0], self.state[1])
+    
     def reset(self):
         """Filtreyi sifirla"""
         self.initialized = False
@@ -169,8 +187,9 @@ class JitterReduction:
 class SmartCursor:
     """Akilli cursor kontrolu - titreme onleyici ve hassasiyet optimizasyonu"""
     
-    def __init__(self):
-        self.adaptive_filter = AdaptiveFilter()
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.adaptive_filter = AdaptiveFilter(clock=clock)
         self.kalman_filter = KalmanFilter()
         self.jitter_reducer = JitterReduction()
         
@@ -188,7 +207,8 @@ class SmartCursor:
         self.movement_stats = {
             'total_movements': 0,
             'filtered_movements': 0,
-            'precision_movements': 0
+            'precision_movements': 0,
+            'predicted_movements': 0
         }
     
     def add_precision_zone(self, x: float, y: float, width: float, height: float):
@@ -205,15 +225,30 @@ class SmartCursor:
                 return True
         return False
     
-    def process_movement(self, raw_x: float, raw_y: float, screen_width: int, screen_height: int) -> Tuple[float, float]:
+    def process_movement(self, raw_x: float, raw_y: float, screen_width: int, screen_height: int,
+                         timestamp: Optional[float] = None) -> Tuple[float, float]:
         """Ham koordinatlari işle ve optimize edilmiş cursor pozisyonu dondur"""
         self.movement_stats['total_movements'] += 1
         
         # 1. Kalman filtresi ile temel filtreleme
         filtered_x, filtered_y = self.kalman_filter.update(raw_x, raw_y)
         
-        # 2. Adaptif filtreleme
-        adaptive_x, adaptive_y = self.adaptive_filter.add_position(filtered_x, filtered_y)
+        return self._finish_movement(filtered_x, filtered_y, screen_width, screen_height, timestamp)
+    
+    def predict_movement(self, screen_width: int, screen_height: int,
+                         timestamp: Optional[float] = None) -> Tuple[float, float]:
+        """Inference atlanan frame için Kalman tahminiyle cursor pozisyonu dondur"""
+        self.movement_stats['predicted_movements'] += 1
+        
+        predicted_x, predicted_y = self.kalman_filter.predict()
+        
+        return self._finish_movement(predicted_x, predicted_y, screen_width, screen_height, timestamp)
+    
+    def _finish_movement(self, filtered_x: float, filtered_y: float, screen_width: int, screen_height: int,
+                         timestamp: Optional[float] = None) -> Tuple[float, float]:
+        """Kalman sonrasi filtreleme ve ekran eşlemesi"""
+        # 2. Adaptif filtreleme (hiz frame yakalama zamanlarindan)
+        adaptive_x, adaptive_y = self.adaptive_filter.add_position(filtered_x, filtered_y, timestamp)
         
         # 3. Titreme azaltma
         final_x, final_y = self.jitter_reducer.filter_position(adaptive_x, adaptive_y)
@@ -276,20 +311,22 @@ class SmartCursor:
     
     def reset(self):
         """Tum filtreleri sifirla"""
-        self.adaptive_filter = AdaptiveFilter()
+        self.adaptive_filter = AdaptiveFilter(clock=self.clock)
         self.kalman_filter = KalmanFilter()
         self.jitter_reducer = JitterReduction()
         self.movement_stats = {
             'total_movements': 0,
             'filtered_movements': 0,
-            'precision_movements': 0
+            'precision_movements': 0,
+            'predicted_movements': 0
         }
 
 
 class AutoCalibrator:
     """Otomatik el kalibrasyonu sistemi"""
     
-    def __init__(self):
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
         self.calibration_data = []
         self.is_calibrating = False
         self.calibration_start_time = None
@@ -301,21 +338,21 @@ class AutoCalibrator:
         self.natural_rest_position = None
         self.sensitivity_multiplier = 1.0
         
-    def start_calibration(self):
+    def start_calibration(self, timestamp: Optional[float] = None):
         """Otomatik kalibrasyonu başlat"""
         print("Otomatik kalibrasyon başlatildi...")
         print("3 saniye boyunca elinizi doğal şekilde hareket ettirin")
         
         self.is_calibrating = True
-        self.calibration_start_time = time.time()
+        self.calibration_start_time = self.clock() if timestamp is None else timestamp
         self.calibration_data = []
     
-    def add_calibration_sample(self, landmarks) -> bool:
+    def add_calibration_sample(self, landmarks, timestamp: Optional[float] = None) -> bool:
         """Kalibrasyon orneği ekle. True dondururse kalibrasyon tamamlandi."""
         if not self.is_calibrating or self.calibration_start_time is None:
             return False
         
-        current_time = time.time()
+        current_time = self.clock() if timestamp is None else timestamp
         elapsed = current_time - self.calibration_start_time
         
         # Kalibrasyon suresi doldu mu?
@@ -325,7 +362,7 @@ class AutoCalibrator:
             return True
         
         # ornek ekle
-        hand_data = self._extract_hand_features(landmarks)
+        hand_data = self._extract_hand_features(landmarks, current_time)
         self.calibration_data.append(hand_data)
         
         # İlerleme goster
@@ -335,31 +372,16 @@ class AutoCalibrator:
         
         return False
     
-    def _extract_hand_features(self, landmarks) -> Dict:
-        """El ozelliklerini çikar"""
-        # Temel noktalar
-        wrist = (landmarks[0].x, landmarks[0].y)
-        thumb_tip = (landmarks[4].x, landmarks[4].y)
-        index_tip = (landmarks[8].x, landmarks[8].y)
-        middle_tip = (landmarks[12].x, landmarks[12].y)
-        ring_tip = (landmarks[16].x, landmarks[16].y)
-        pinky_tip = (landmarks[20].x, landmarks[20].y)
-        
-        # El boyutu (bilek-orta parmak)
-        hand_size = math.sqrt((middle_tip[0] - wrist[0])**2 + (middle_tip[1] - wrist[1])**2)
-        
-        # El merkezi
-        palm_center = (
-            (wrist[0] + thumb_tip[0] + index_tip[0] + middle_tip[0] + ring_tip[0] + pinky_tip[0]) / 6,
-            (wrist[1] + thumb_tip[1] + index_tip[1] + middle_tip[1] + ring_tip[1] + pinky_tip[1]) / 6
-        )
-        
+    def _extract_hand_features(self, landmarks, timestamp: Optional[float] = None) -> Dict:
+        """El ozelliklerini çikar - landmarks HandFeatures, (21, 3) dizi ya da MediaPipe landmark'lari"""
+        # Detektorun frame için hesapladiği ozellikler yeniden hesaplanmaz
+        features = HandFeatures.from_landmarks(landmarks)
         return {
-            'hand_size': hand_size,
-            'palm_center': palm_center,
-            'wrist': wrist,
-            'fingertips': [thumb_tip, index_tip, middle_tip, ring_tip, pinky_tip],
-            'timestamp': time.time()
+            'hand_size': features.hand_size,
+            'palm_center': features.palm_center,
+            'wrist': features.wrist,
+            'fingertips': features.fingertips,
+            'timestamp': self.clock() if timestamp is None else timestamp
         }
     
     def _process_calibration_data(self):
@@ -0,0 +1,1157 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src_python', 'src'))
+
+
+class FakeCapture:
+    """cv2.VideoCapture'i taklit eden sahte kamera"""
+
+    def __init__(self, frame_count=10, delay=0.0):
+        self.frame_count = frame_count
+        self.delay = delay
+        self.read_count = 0
+        self.opened = True
+
+    def read(self):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.read_count >= self.frame_count:
+            return False, None
+        self.read_count += 1
+        return True, self.read_count
+
+    def isOpened(self):
+        return self.opened
+
+    def release(self):
+        self.opened = False
+
+
+class FakeGrabCapture(FakeCapture):
+    """grab() destekli sahte kamera - decode edilmeden alinan frame'leri sayar"""
+
+    def __init__(self, frame_count=10, delay=0.0):
+        super().__init__(frame_count, delay)
+        self.grab_count = 0
+
+    def grab(self):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.read_count >= self.frame_count:
+            return False
+        self.read_count += 1
+        self.grab_count += 1
+        return True
+
+
+class TestLatestFrameGrabber(unittest.TestCase):
+    """LatestFrameGrabber (thread'li kamera okuyucu) testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            from utils.frame_grabber import LatestFrameGrabber
+            self.grabber_class = LatestFrameGrabber
+        except ImportError:
+            self.skipTest("Frame grabber module not available")
+
+    def test_delivers_frames_in_order(self):
+        """Frame'ler sirayla ve tekrarsiz verilmeli"""
+        grabber = self.grabber_class(FakeCapture(frame_count=5, delay=0.01)).start()
+
+        frames = []
+        while True:
+            ok, frame = grabber.read(timeout=1.0)
+            if not ok:
+                break
+            frames.append(frame)
+        grabber.stop()
+
+        self.assertEqual(frames, sorted(set(frames)))
+        self.assertEqual(frames[-1], 5)
+
+    def test_slow_consumer_drops_stale_frames(self):
+        """Yavaş tuketici sadece en yeni frame'i almali"""
+        grabber = self.grabber_class(FakeCapture(frame_count=20)).start()
+
+        # Tum frame'ler yakalanana kadar bekle
+        deadline = time.time() + 2.0
+        while grabber.frames_captured < 20 and time.time() < deadline:
+            time.sleep(0.01)
+
+        ok, frame = grabber.read(timeout=1.0)
+        grabber.stop()
+
+        self.assertTrue(ok)
+        self.assertEqual(frame, 20)
+        stats = grabber.get_stats()
+        self.assertEqual(stats['frames_dropped'], 19)
+        self.assertEqual(stats['frames_delivered'], 1)
+
+    def test_stop_unblocks_reader(self):
+        """stop() bekleyen read() çağrisini serbest birakmali"""
+        grabber = self.grabber_class(FakeCapture(frame_count=1000, delay=0.5)).start()
+        result = {}
+
+        def reader():
+            grabber.read()
+            result['ok'], result['frame'] = grabber.read()
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        time.sleep(0.05)
+        grabber.stop(timeout=0.1)
+        thread.join(timeout=2.0)
+
+        self.assertFalse(thread.is_alive())
+
+    def test_frame_context_uses_source_time(self):
+        """Kaynak frame_time veriyorsa bağlam onu, vermiyorsa grabber saatini taşimali"""
+        capture = FakeCapture(frame_count=1)
+        capture.frame_time = 123.5
+        grabber = self.grabber_class(capture, lossless=True).start()
+        ok, frame = grabber.read(timeout=1.0)
+        grabber.stop()
+
+        self.assertTrue(ok)
+        context = grabber.frame_context(camera_id='cam0')
+        self.assertEqual((context.frame_id, context.capture_time, context.camera_id), (1, 123.5, 'cam0'))
+
+        grabber = self.grabber_class(FakeCapture(frame_count=1), lossless=True, clock=lambda: 42.0).start()
+        grabber.read(timeout=1.0)
+        grabber.stop()
+        self.assertEqual(grabber.frame_context().capture_time, 42.0)
+
+    def test_decode_interval_skips_decoding(self):
+        """decode_interval verilince aradaki frame'ler sadece grab() ile alinmali"""
+        capture = FakeGrabCapture(frame_count=30, delay=0.01)
+        grabber = self.grabber_class(capture)
+        grabber.decode_interval = 0.1
+        grabber.start()
+        deadline = time.time() + 2.0
+        while grabber.isOpened() and time.time() < deadline:
+            time.sleep(0.01)
+        grabber.stop()
+
+        stats = grabber.get_stats()
+        self.assertEqual(stats['frames_not_decoded'], capture.grab_count)
+        self.assertGreaterEqual(capture.grab_count, 20)
+        self.assertLessEqual(stats['frames_captured'], 8)
+
+    def test_lossless_delivers_every_frame(self):
+        """lossless modda yavas tuketici de tum frame'leri almali"""
+        grabber = self.grabber_class(FakeCapture(frame_count=20), lossless=True).start()
+
+        frames = []
+        while True:
+            ok, frame = grabber.read(timeout=1.0)
+            if not ok:
+                break
+            frames.append(frame)
+            time.sleep(0.002)
+        grabber.stop()
+
+        self.assertEqual(frames, list(range(1, 21)))
+        self.assertEqual(grabber.get_stats()['frames_dropped'], 0)
+
+
+class TestFramePipeline(unittest.TestCase):
+    """FramePipeline (aşamali işleme hatti) testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            from utils.pipeline import FramePipeline, StageQueue
+            self.pipeline_class = FramePipeline
+            self.queue_class = StageQueue
+        except ImportError:
+            self.skipTest("Pipeline module not available")
+
+    def test_drop_oldest_queue(self):
+        """drop_oldest politikasi dolu kuyrukta en eskiyi atmali"""
+        queue = self.queue_class(maxsize=2, policy='drop_oldest')
+        for i in range(5):
+            queue.put(i)
+
+        self.assertEqual(queue.get(timeout=0.1), 3)
+        self.assertEqual(queue.get(timeout=0.1), 4)
+        self.assertEqual(queue.get_stats()['items_dropped'], 3)
+
+    def test_drop_oldest_reports_dropped_items(self):
+        """Atilan oğeler on_drop ile bildirilmeli (tampon geri verme)"""
+        dropped = []
+        queue = self.queue_class(maxsize=2, policy='drop_oldest', on_drop=dropped.append)
+        for i in range(5):
+            queue.put(i)
+
+        self.assertEqual(dropped, [0, 1, 2])
+
+    def test_block_queue_waits_for_space(self):
+        """block politikasi yer açilana kadar beklemeli"""
+        queue = self.queue_class(maxsize=1, policy='block')
+        queue.put('a')
+
+        thread = threading.Thread(target=queue.put, args=('b',))
+        thread.start()
+        time.sleep(0.05)
+        self.assertTrue(thread.is_alive())
+
+        self.assertEqual(queue.get(timeout=0.1), 'a')
+        thread.join(timeout=1.0)
+        self.assertEqual(queue.get(timeout=0.1), 'b')
+
+    def test_invalid_policy(self):
+        """Bilinmeyen politika reddedilmeli"""
+        with self.assertRaises(ValueError):
+            self.queue_class(policy='newest_only')
+
+    def test_stages_process_all_items_when_blocking(self):
+        """block politikasinda tum oğeler tum aşamalardan geçmeli"""
+        source_items = iter(range(20))
+
+        def source():
+            return next(source_items, None)
+
+        pipeline = self.pipeline_class(
+            source,
+            [('double', lambda x: x * 2), ('inc', lambda x: x + 1)],
+            queue_size=2, backpressure='block'
+        ).start()
+
+        outputs = []
+        while True:
+            item = pipeline.get_output(timeout=1.0)
+            if item is None:
+                break
+            outputs.append(item)
+        pipeline.stop()
+
+        self.assertTrue(pipeline.finished)
+        self.assertEqual(outputs, [i * 2 + 1 for i in range(20)])
+
+        stats = pipeline.get_stats()
+        self.assertEqual(set(stats.keys()), {'capture', 'double', 'inc'})
+        self.assertEqual(stats['double']['items_processed'], 20)
+        self.assertLessEqual(stats['inc']['queue']['max_depth'], 2)
+
+    def test_stage_error_does_not_stop_pipeline(self):
+        """Bir oğede hata olsa da akiş devam etmeli"""
+        source_items = iter([1, 0, 2])
+
+        def source():
+            return next(source_items, None)
+
+        pipeline = self.pipeline_class(source, [('invert', lambda x: 1 / x)],
+                                       backpressure='block').start()
+        outputs = []
+        while True:
+            item = pipeline.get_output(timeout=1.0)
+            if item is None:
+                break
+            outputs.append(item)
+        pipeline.stop()
+
+        self.assertEqual(outputs, [1.0, 0.5])
+        self.assertEqual(pipeline.get_stats()['invert']['errors'], 1)
+
+    def test_pause_stops_all_stages_until_resume(self):
+        """pause() sonrasi hiçbir aşama oğe işlememeli, resume() ile devam etmeli"""
+        processed = []
+        counter = iter(range(1000))
+
+        def source():
+            time.sleep(0.002)
+            return next(counter, None)
+
+        def action(x):
+            processed.append(x)
+            return x
+
+        pipeline = self.pipeline_class(source, [('action', action)], queue_size=2).start()
+        time.sleep(0.05)
+
+        self.assertTrue(pipeline.pause())
+        self.assertTrue(pipeline.paused)
+        count = len(processed)
+        time.sleep(0.05)
+        self.assertEqual(len(processed), count)
+
+        pipeline.resume()
+        time.sleep(0.05)
+        self.assertGreater(len(processed), count)
+        pipeline.stop()
+
+    def test_stop_while_paused(self):
+        """Duraklatilmiş hat stop() ile kapanabilmeli"""
+        pipeline = self.pipeline_class(lambda: 1, [('noop', lambda x: x)]).start()
+        pipeline.pause()
+        pipeline.stop(timeout=1.0)
+        for stage in pipeline.stages:
+            self.assertFalse(stage.thread.is_alive())
+
+
+class FakeV4L2Capture:
+    """Sadece belirli profilleri kabul eden sahte V4L2 kamera"""
+
+    def __init__(self, supported):
+        import cv2
+        self.cv2 = cv2
+        self.supported = supported  # [(width, height, fourcc), ...]
+        self.props = {
+            cv2.CAP_PROP_FRAME_WIDTH: 1920,
+            cv2.CAP_PROP_FRAME_HEIGHT: 1080,
+            cv2.CAP_PROP_FPS: 5,
+            cv2.CAP_PROP_FOURCC: cv2.VideoWriter_fourcc(*'YUYV'),
+        }
+        self.pending = {}
+
+    def set(self, prop, value):
+        self.pending[prop] = value
+        cv2 = self.cv2
+        width = self.pending.get(cv2.CAP_PROP_FRAME_WIDTH, self.props[cv2.CAP_PROP_FRAME_WIDTH])
+        height = self.pending.get(cv2.CAP_PROP_FRAME_HEIGHT, self.props[cv2.CAP_PROP_FRAME_HEIGHT])
+        fourcc = self.pending.get(cv2.CAP_PROP_FOURCC, self.props[cv2.CAP_PROP_FOURCC])
+        for sw, sh, sf in self.supported:
+            if (sw, sh, cv2.VideoWriter_fourcc(*sf)) == (width, height, fourcc):
+                self.props.update({cv2.CAP_PROP_FRAME_WIDTH: sw, cv2.CAP_PROP_FRAME_HEIGHT: sh,
+                                   cv2.CAP_PROP_FOURCC: fourcc})
+        if prop == cv2.CAP_PROP_FPS:
+            self.props[prop] = value
+        return True
+
+    def get(self, prop):
+        return self.props[prop]
+
+
+class FakeNearestCapture(FakeV4L2Capture):
+    """En yakin desteklenen çozunurluğe yuvarlayan, tek fourcc veren sahte kamera"""
+
+    def __init__(self, resolutions, fourcc):
+        super().__init__([])
+        self.resolutions = resolutions
+        self.props[self.cv2.CAP_PROP_FOURCC] = self.cv2.VideoWriter_fourcc(*fourcc)
+
+    def set(self, prop, value):
+        cv2 = self.cv2
+        if prop in (cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT):
+            self.pending[prop] = value
+            width = self.pending.get(cv2.CAP_PROP_FRAME_WIDTH, self.props[cv2.CAP_PROP_FRAME_WIDTH])
+            height = self.pending.get(cv2.CAP_PROP_FRAME_HEIGHT, self.props[cv2.CAP_PROP_FRAME_HEIGHT])
+            sw, sh = min(self.resolutions, key=lambda r: abs(r[0] - width) + abs(r[1] - height))
+            self.props.update({cv2.CAP_PROP_FRAME_WIDTH: sw, cv2.CAP_PROP_FRAME_HEIGHT: sh})
+        elif prop == cv2.CAP_PROP_FPS:
+            self.props[prop] = value
+        return True
+
+
+class TestCaptureProfile(unittest.TestCase):
+    """Kamera profil pazarliği testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            from utils import capture_profile
+            self.capture_profile = capture_profile
+        except ImportError:
+            self.skipTest("Capture profile module not available")
+
+    def test_fourcc_roundtrip(self):
+        """Fourcc kodu metne geri çevrilebilmeli"""
+        import cv2
+        self.assertEqual(self.capture_profile.fourcc_to_str(cv2.VideoWriter_fourcc(*'MJPG')), 'MJPG')
+        self.assertEqual(self.capture_profile.fourcc_to_str(0), '')
+
+    def test_preferred_profile_granted(self):
+        """Desteklenen profil ilk denemede kabul edilmeli"""
+        capture = FakeV4L2Capture([(640, 480, 'MJPG'), (1920, 1080, 'YUYV')])
+        candidates = self.capture_profile.build_capture_candidates(
+            {'camera_width': 640, 'camera_height': 480, 'camera_fourcc': 'mjpg'})
+
+        profile = self.capture_profile.negotiate_capture_profile(capture, 30, candidates)
+
+        self.assertTrue(profile['matched'])
+        self.assertEqual((profile['width'], profile['height'], profile['fourcc']), (640, 480, 'MJPG'))
+        self.assertEqual(profile['fps'], 30)
+
+    def test_fallback_to_next_candidate(self):
+        """İstenen profil yoksa sonraki adaya geçilmeli"""
+        capture = FakeV4L2Capture([(640, 480, 'YUYV')])
+        candidates = self.capture_profile.build_capture_candidates(
+            {'camera_width': 800, 'camera_height': 600, 'camera_fourcc': 'MJPG'})
+
+        profile = self.capture_profile.negotiate_capture_profile(capture, 30, candidates)
+
+        self.assertTrue(profile['matched'])
+        self.assertEqual((profile['width'], profile['height'], profile['fourcc']), (640, 480, 'YUYV'))
+
+    def test_no_candidate_matches(self):
+        """Hiçbir aday kabul edilmezse surucunun profili raporlanmali"""
+        capture = FakeV4L2Capture([])
+        profile = self.capture_profile.negotiate_capture_profile(capture, 30)
+
+        self.assertFalse(profile['matched'])
+        self.assertEqual(profile['width'], 1920)
+
+    def test_no_match_restores_closest_profile(self):
+        """Eşleşme yoksa kamera son yedek profilde kalmamali, en yakin aday yeniden istenmeli"""
+        capture = FakeNearestCapture([(800, 600), (320, 240)], 'NV12')
+        candidates = self.capture_profile.build_capture_candidates(
+            {'camera_width': 800, 'camera_height': 600, 'camera_fourcc': 'MJPG'})
+
+        profile = self.capture_profile.negotiate_capture_profile(capture, 30, candidates)
+
+        self.assertFalse(profile['matched'])
+        self.assertEqual((profile['width'], profile['height']), (800, 600))
+        self.assertEqual(profile['requested']['width'], 800)
+        self.assertEqual(self.capture_profile.read_capture_profile(capture)['width'], 800)
+
+
+class MockLandmark:
+    """MediaPipe landmark'i taklit eden mock sinif"""
+    def __init__(self, x, y, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class MockHand:
+    """MediaPipe NormalizedLandmarkList taklidi"""
+    def __init__(self, points):
+        self.landmark = [MockLandmark(x, y) for x, y in points]
+
+
+class MockResults:
+    """hands.process() sonucu taklidi"""
+    def __init__(self, hands):
+        self.multi_hand_landmarks = hands
+
+
+class TestHandROITracker(unittest.TestCase):
+    """HandROITracker (el bolgesi kirpma) testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            import numpy as np
+            from utils.hand_roi import HandROITracker
+            self.np = np
+            self.tracker = HandROITracker(margin=0.25, min_size=0.1)
+        except ImportError:
+            self.skipTest("Hand ROI module not available")
+
+    def test_first_frame_is_full(self):
+        """ROI yokken tum goruntu işlenmeli"""
+        image = self.np.zeros((480, 640, 3), dtype=self.np.uint8)
+        crop, roi = self.tracker.crop(image)
+        self.assertIs(crop, image)
+        self.assertIsNone(roi)
+
+    def test_crop_and_remap(self):
+        """Kirpilmiş frame'deki landmark'lar tum frame'e geri eşlenmeli"""
+        image = self.np.zeros((480, 640, 3), dtype=self.np.uint8)
+
+        # Tam frame'de el sol ustte
+        self.tracker.update(MockResults([MockHand([(0.2, 0.2), (0.3, 0.3)])]), None)
+        self.assertIsNotNone(self.tracker.roi)
+
+        crop, roi = self.tracker.crop(image)
+        self.assertLess(crop.shape[0] * crop.shape[1], image.shape[0] * image.shape[1])
+
+        # Kirpmanin ortasindaki nokta
+        hand = MockHand([(0.5, 0.5)])
+        self.tracker.update(MockResults([hand]), roi)
+
+        x0, y0, x1, y1 = roi
+        self.assertAlmostEqual(hand.landmark[0].x, (x0 + x1) / 2)
+        self.assertAlmostEqual(hand.landmark[0].y, (y0 + y1) / 2)
+        self.assertIsNotNone(self.tracker.roi)
+
+    def test_hand_lost_falls_back_to_full_frame(self):
+        """El kaybolunca sonraki frame tam goruntu olmali"""
+        self.tracker.update(MockResults([MockHand([(0.4, 0.4), (0.5, 0.5)])]), None)
+        self.tracker.update(MockResults(None), self.tracker.roi)
+
+        self.assertIsNone(self.tracker.roi)
+        self.assertEqual(self.tracker.get_stats()['hand_lost_count'], 1)
+
+    def test_near_crop_edge_falls_back(self):
+        """Kirpma kenarina yakin landmark tam frame'e donmeli"""
+        self.tracker.update(MockResults([MockHand([(0.4, 0.4), (0.5, 0.5)])]), None)
+        roi = self.tracker.roi
+
+        self.tracker.update(MockResults([MockHand([(0.5, 0.5), (0.99, 0.5)])]), roi)
+
+        self.assertIsNone(self.tracker.roi)
+        self.assertEqual(self.tracker.get_stats()['edge_fallback_count'], 1)
+
+
+class FakeBufferCapture(FakeCapture):
+    """cap.read(image=buf) destekli sahte kamera - tampon verilirse ona yazar"""
+
+    def __init__(self, frame_count=10, shape=(48, 64, 3)):
+        super().__init__(frame_count)
+        self.shape = shape
+
+    def read(self, image=None):
+        import numpy as np
+        if self.read_count >= self.frame_count:
+            return False, None
+        self.read_count += 1
+        if image is None or image.shape != self.shape:
+            image = np.empty(self.shape, dtype=np.uint8)
+        image[:] = self.read_count
+        return True, image
+
+
+class TestImageOps(unittest.TestCase):
+    """Inference olcekleme yardimcilari testleri"""
+
+    def setUp(self):
+        try:
+            import numpy as np
+            from utils.image_ops import clamp_inference_scale, resize_for_inference
+        except ImportError as e:
+            self.skipTest(f"Goruntu bagimliliklari yok: {e}")
+        from utils import image_ops
+        self.np = np
+        self.image_ops = image_ops
+        self.clamp = clamp_inference_scale
+        self.resize = resize_for_inference
+
+    def test_clamp_scale(self):
+        """Olcek (0.1, 1.0] araliginda tutulmali"""
+        self.assertEqual(self.clamp(2.0), 1.0)
+        self.assertEqual(self.clamp(0.01), 0.1)
+        self.assertEqual(self.clamp('0.5'), 0.5)
+        self.assertEqual(self.clamp('abc'), 1.0)
+
+    def test_full_scale_is_passthrough(self):
+        """Olcek 1.0 iken goruntu kopyalanmamali"""
+        image = self.np.zeros((480, 640, 3), dtype=self.np.uint8)
+        self.assertIs(self.resize(image, 1.0), image)
+
+    def test_downscale_size(self):
+        """Kucultulmus goruntu boyutu olcege uymali"""
+        image = self.np.zeros((480, 640, 3), dtype=self.np.uint8)
+        small = self.resize(image, 0.5)
+        self.assertEqual(small.shape, (240, 320, 3))
+
+    def test_mirror_landmarks(self):
+        """Landmark x koordinatlari aynalanmali"""
+        results = MockResults([MockHand([(0.2, 0.4), (0.9, 0.1)])])
+        self.image_ops.mirror_landmarks(results)
+
+        landmarks = results.multi_hand_landmarks[0].landmark
+        self.assertAlmostEqual(landmarks[0].x, 0.8)
+        self.assertAlmostEqual(landmarks[1].x, 0.1)
+        self.assertAlmostEqual(landmarks[0].y, 0.4)
+
+    def test_mirror_in_place_matches_flip(self):
+        """Yerinde aynalama yeni dizi ayirmadan cv2.flip ile ayni sonucu vermeli"""
+        frame = self.np.arange(2 * 5 * 3, dtype=self.np.uint8).reshape(2, 5, 3)
+        expected = frame[:, ::-1].copy()
+
+        result = self.image_ops.mirror_in_place(frame)
+        self.assertIs(result, frame)
+        self.assertTrue(self.np.array_equal(frame, expected))
+
+    def test_rgb_pool_reuses_buffers(self):
+        """RGB donusumu isinmadan sonra yeni tampon ayirmamali"""
+        pool = self.image_ops.FramePool(2)
+        frame = self.np.zeros((48, 64, 3), dtype=self.np.uint8)
+
+        # Ayni anda en fazla iki sonuc kullanimda - en eskisi geri verilir
+        outputs = []
+        for _ in range(10):
+            outputs.append(self.image_ops.to_rgb(frame, pool))
+            if len(outputs) >= 2:
+                pool.release(outputs[-2])
+
+        self.assertEqual(len({id(o) for o in outputs}), 2)
+        stats = pool.get_stats()
+        self.assertEqual(stats['allocations'], 2)
+        self.assertEqual(stats['steady_state_allocations'], 0)
+
+    def test_grabber_reuses_capture_buffers(self):
+        """Grabber cap.read(image=...) ile tamponlari yeniden kullanmali"""
+        from utils.frame_grabber import LatestFrameGrabber
+        pool = self.image_ops.FramePool(3)
+        grabber = LatestFrameGrabber(FakeBufferCapture(frame_count=20), pool=pool,
+                                     release_previous=True).start()
+
+        while grabber.read(timeout=1.0)[0]:
+            pass
+        grabber.stop()
+
+        stats = pool.get_stats()
+        self.assertEqual(stats['allocations'], 3)
+        self.assertEqual(stats['steady_state_allocations'], 0)
+
+    def test_grabber_keeps_held_frame(self):
+        """Teslim edilen frame geri verilene kadar uzerine yazilmamali"""
+        from utils.frame_grabber import LatestFrameGrabber
+        pool = self.image_ops.FramePool(3)
+        capture = FakeBufferCapture(frame_count=20)
+        grabber = LatestFrameGrabber(capture, pool=pool).start()
+
+        ok, held = grabber.read(timeout=1.0)
+        self.assertTrue(ok)
+        expected = held.copy()
+
+        # Havuz boyutundan fazla frame yakalanir (cogu okunmadan atilir)
+        deadline = time.time() + 2.0
+        while capture.read_count < capture.frame_count and time.time() < deadline:
+            time.sleep(0.001)
+        self.assertTrue(self.np.array_equal(held, expected))
+
+        # Diger frame'ler okunup geri verilir - tutulan frame yine degismemeli
+        while True:
+            ok, frame = grabber.read(timeout=0.5)
+            if not ok:
+                break
+            self.assertIsNot(frame, held)
+            grabber.release(frame)
+        grabber.stop()
+
+        self.assertTrue(self.np.array_equal(held, expected))
+        self.assertEqual(pool.get_stats()['steady_state_allocations'], 0)
+
+
+class TestFrameScheduler(unittest.TestCase):
+    """FrameScheduler (butce tabanli frame atlama) testleri"""
+
+    def setUp(self):
+        try:
+            from utils.frame_scheduler import FrameScheduler
+        except ImportError:
+            self.skipTest("Frame scheduler module not available")
+        self.FrameScheduler = FrameScheduler
+
+    def _run(self, scheduler, processing_ms, frames):
+        for _ in range(frames):
+            if scheduler.should_infer():
+                scheduler.record(processing_ms)
+
+    def test_within_budget_never_skips(self):
+        """Butce icinde hicbir frame atlanmamali"""
+        scheduler = self.FrameScheduler(max_processing_time_ms=33)
+        self._run(scheduler, 10, 50)
+        self.assertEqual(scheduler.get_stats()['frames_skipped'], 0)
+
+    def test_over_budget_skips_and_recovers(self):
+        """Butce asilinca frame atlanmali, yuk azalinca normale donmeli"""
+        scheduler = self.FrameScheduler(max_processing_time_ms=33, smoothing=1.0)
+        self._run(scheduler, 70, 30)
+
+        stats = scheduler.get_stats()
+        self.assertEqual(stats['skip_interval'], 2)
+        self.assertGreater(stats['frames_skipped'], 0)
+
+        self._run(scheduler, 10, 30)
+        self.assertEqual(scheduler.skip_interval, 0)
+
+    def test_disabled(self):
+        """skip_frames_on_lag false iken atlama yapilmamali"""
+        scheduler = self.FrameScheduler(max_processing_time_ms=33, skip_frames_on_lag=False)
+        self._run(scheduler, 100, 20)
+        self.assertEqual(scheduler.frames_skipped, 0)
+        self.assertEqual(scheduler.over_budget_count, 20)
+
+    def test_budget_from_target_fps(self):
+        """max_processing_time_ms yoksa butce target_fps'in frame suresi olmali"""
+        from utils.frame_scheduler import frame_budget_ms
+        self.assertAlmostEqual(frame_budget_ms({'target_fps': 20}), 50.0)
+        self.assertEqual(frame_budget_ms({'target_fps': 20, 'max_processing_time_ms': 33}), 33.0)
+
+
+class FakeClock:
+    """Elle ilerletilen saat"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestIdleController(unittest.TestCase):
+    """IdleController (bosta guc modu) testleri"""
+
+    def setUp(self):
+        try:
+            from utils.idle_controller import IdleController
+        except ImportError:
+            self.skipTest("Idle controller module not available")
+        self.clock = FakeClock()
+        self.idle = IdleController(idle_timeout=5.0, idle_fps=5, idle_inference_scale=0.5, clock=self.clock)
+
+    def test_enters_idle_after_timeout(self):
+        """El gorulmezse timeout sonunda idle'a gecmeli"""
+        self.clock.now += 4.0
+        self.idle.update(False)
+        self.assertFalse(self.idle.is_idle)
+
+        self.clock.now += 1.5
+        self.idle.update(False)
+        self.assertTrue(self.idle.is_idle)
+        self.assertEqual(self.idle.inference_scale(1.0), 0.5)
+
+    def test_idle_rate_limit_and_wake(self):
+        """Idle modda hiz sinirlanmali, el gorulunce hemen tam hiza donmeli"""
+        self.clock.now += 6.0
+        self.idle.update(False)
+        self.assertTrue(self.idle.should_process())
+        self.assertFalse(self.idle.should_process())
+        self.assertAlmostEqual(self.idle.wait_time(), 0.2)
+        self.assertAlmostEqual(self.idle.decode_interval, 0.2)
+
+        self.idle.update(True)
+        self.assertFalse(self.idle.is_idle)
+        self.assertEqual(self.idle.wait_time(), 0.0)
+        self.assertEqual(self.idle.decode_interval, 0.0)
+        self.assertTrue(self.idle.should_process())
+        self.assertEqual(self.idle.inference_scale(1.0), 1.0)
+
+    def test_stats_report_time_in_state(self):
+        """Durumlarda gecen sure ve duty cycle raporlanmali"""
+        self.clock.now += 5.0
+        self.idle.update(False)
+        self.clock.now += 10.0
+        self.idle.should_process(frames_since_last=30)
+
+        stats = self.idle.get_stats()
+        self.assertEqual(stats['state'], 'idle')
+        self.assertAlmostEqual(stats['time_active_s'], 5.0)
+        self.assertAlmostEqual(stats['time_idle_s'], 10.0)
+        self.assertAlmostEqual(stats['duty_cycle'], 1 / 30)
+
+    def test_disabled_with_zero_timeout(self):
+        """idle_timeout 0 iken idle'a gecilmemeli"""
+        from utils.idle_controller import IdleController
+        idle = IdleController(idle_timeout=0, clock=self.clock)
+        self.clock.now += 1000
+        idle.update(False)
+        self.assertFalse(idle.is_idle)
+
+
+class TestMotionGate(unittest.TestCase):
+    """MotionGate (frame farki ile inference atlama) testleri"""
+
+    def setUp(self):
+        try:
+            import numpy as np
+            from utils.motion_gate import MotionGate, GATE_INFER, GATE_STATIC, GATE_REUSE
+        except ImportError:
+            self.skipTest("Motion gate module not available")
+        self.np = np
+        self.gate = MotionGate(motion_threshold=2.5, hand_motion_threshold=1.5, max_gated_frames=3)
+        self.INFER, self.STATIC, self.REUSE = GATE_INFER, GATE_STATIC, GATE_REUSE
+
+    def _frame(self, value):
+        return self.np.full((120, 160, 3), value, dtype=self.np.uint8)
+
+    def test_static_scene_skips_inference(self):
+        """Ilk frame inference zorlamali, duragan sahne atlanmali"""
+        frame = self._frame(80)
+        self.assertEqual(self.gate.decide(self.gate.measure(frame)), self.INFER)
+        self.assertEqual(self.gate.measure(frame), 0.0)
+        self.assertEqual(self.gate.decide(0.0), self.STATIC)
+        self.assertIsNone(self.gate.gated_results(self.STATIC).multi_hand_landmarks)
+
+    def test_motion_triggers_inference(self):
+        """Sahne degisince inference yapilmali"""
+        self.gate.decide(self.gate.measure(self._frame(80)))
+        motion = self.gate.measure(self._frame(120))
+        self.assertAlmostEqual(motion, 40.0)
+        self.assertEqual(self.gate.decide(motion), self.INFER)
+
+    def test_slow_motion_accumulates(self):
+        """Yavas hareket son inference frame'ine gore birikip inference tetiklemeli"""
+        self.gate.decide(self.gate.measure(self._frame(80)))
+        decisions = [self.gate.decide(self.gate.measure(self._frame(80 + step))) for step in (1, 2, 3)]
+        self.assertEqual(decisions, [self.STATIC, self.STATIC, self.INFER])
+
+        # Referans inference yapilan frame'e ilerler
+        self.assertEqual(self.gate.measure(self._frame(83)), 0.0)
+
+    def test_small_region_motion_detected(self):
+        """Kucuk bir bolgedeki hareket (or. pinch) tum goruntu ortalamasinda kaybolmamali"""
+        frame = self._frame(80)
+        self.gate.decide(self.gate.measure(frame))
+
+        moved = frame.copy()
+        moved[40:60, 60:80] = 120  # Goruntunun ~%2'si
+        motion = self.gate.measure(moved)
+        self.assertGreater(motion, 20.0)
+        self.assertEqual(self.gate.decide(motion), self.INFER)
+
+    def test_tracked_hand_reuses_landmarks(self):
+        """El takip edilirken hareket yoksa son landmark'lar kullanilmali"""
+        results = MockResults([MockHand([(0.5, 0.5)] * 21)])
+        self.gate.update(results)
+        self.assertEqual(self.gate.decide(1.0), self.REUSE)
+        self.assertIs(self.gate.gated_results(self.REUSE), results)
+        # El varken esik daha dusuk
+        self.assertEqual(self.gate.decide(2.0), self.INFER)
+
+    def test_forced_refresh_and_stats(self):
+        """max_gated_frames sonrasi inference zorlanmali, skip_ratio raporlanmali"""
+        decisions = [self.gate.decide(0.0) for _ in range(4)]
+        self.assertEqual(decisions, [self.STATIC] * 3 + [self.INFER])
+
+        stats = self.gate.get_stats()
+        self.assertEqual(stats['frames_static'], 3)
+        self.assertAlmostEqual(stats['skip_ratio'], 0.75)
+
+
+class TestFrameSource(unittest.TestCase):
+    """FrameSource (kamera / video / goruntu klasoru) testleri"""
+
+    def setUp(self):
+        try:
+            import cv2
+            import numpy as np
+            from utils import frame_source
+        except ImportError:
+            self.skipTest("Frame source module not available")
+        import tempfile
+        self.cv2, self.np, self.fs = cv2, np, frame_source
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+        # 5 goruntuluk klasor - her goruntunun degeri sira numarasi
+        for i in range(5):
+            cv2.imwrite(os.path.join(self.tmp.name, f"frame_{i:03d}.png"),
+                        np.full((48, 64, 3), i * 10, dtype=np.uint8))
+
+    def _read_all(self, source, limit=100):
+        values = []
+        while len(values) < limit:
+            ok, frame = source.read()
+            if not ok:
+                break
+            values.append(int(frame[0, 0, 0]))
+        return values
+
+    def test_image_directory_fast(self):
+        """Goruntu klasoru sirayla, beklemeden okunmali"""
+        source = self.fs.open_frame_source(self.tmp.name, pacing=self.fs.PACING_FAST)
+        self.assertIsInstance(source, self.fs.ImageSequenceSource)
+        self.assertTrue(source.isOpened())
+        self.assertTrue(source.lossless)
+        self.assertEqual(source.get(self.cv2.CAP_PROP_FRAME_WIDTH), 64)
+
+        self.assertEqual(self._read_all(source), [0, 10, 20, 30, 40])
+        self.assertEqual(source.get_stats()['frames_read'], 5)
+
+    def test_loop_and_buffer_reuse(self):
+        """loop ile basa donulmeli, verilen tampona yazilmali"""
+        source = self.fs.open_frame_source(self.tmp.name, pacing=self.fs.PACING_FAST, loop=True)
+        buffer = self.np.empty((48, 64, 3), dtype=self.np.uint8)
+        for _ in range(7):
+            ok, frame = source.read(image=buffer)
+            self.assertTrue(ok)
+            self.assertIs(frame, buffer)
+        self.assertEqual(int(buffer[0, 0, 0]), 10)
+        self.assertEqual(source.loops, 1)
+
+    def test_realtime_pacing(self):
+        """Gercek zamanli modda kaynak FPS'ine uyulmali"""
+        source = self.fs.ImageSequenceSource(self.tmp.name, fps=100)
+        self.assertFalse(source.lossless)
+        start = time.perf_counter()
+        self.assertEqual(len(self._read_all(source)), 5)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.035)
+
+    def test_media_timestamps(self):
+        """Kayitli kaynakta frame zamani okuma hizindan bagimsiz, FPS adimli olmali"""
+        source = self.fs.ImageSequenceSource(self.tmp.name, fps=10, pacing=self.fs.PACING_FAST)
+        times = []
+        for _ in range(3):
+            self.assertTrue(source.read()[0])
+            times.append(source.frame_time)
+        self.assertAlmostEqual(times[1] - times[0], 0.1, places=5)
+        self.assertAlmostEqual(times[2] - times[0], 0.2, places=5)
+
+    def test_video_file(self):
+        """Video dosyasi okunmali, bitince durmali"""
+        path = os.path.join(self.tmp.name, 'clip.avi')
+        writer = self.cv2.VideoWriter(path, self.cv2.VideoWriter_fourcc(*'MJPG'), 25, (64, 48))
+        if not writer.isOpened():
+            self.skipTest("VideoWriter not available")
+        for i in range(6):
+            writer.write(self.np.full((48, 64, 3), i * 40, dtype=self.np.uint8))
+        writer.release()
+
+        source = self.fs.open_frame_source(path, pacing=self.fs.PACING_FAST)
+        self.assertIsInstance(source, self.fs.VideoFileSource)
+        self.assertAlmostEqual(source.get(self.cv2.CAP_PROP_FPS), 25)
+        self.assertEqual(len(self._read_all(source)), 6)
+        source.release()
+
+    def test_camera_spec_and_bad_pacing(self):
+        """Rakam camera secmeli, gecersiz pacing reddedilmeli"""
+        source = self.fs.open_frame_source('0')
+        self.assertIsInstance(source, self.fs.CameraSource)
+        self.assertFalse(source.lossless)
+        source.release()
+        with self.assertRaises(ValueError):
+            self.fs.ImageSequenceSource(self.tmp.name, pacing='slow')
+
+    def test_base_class_is_abstract(self):
+        """_read_frame/isOpened olmayan kaynak orneklenememeli"""
+        with self.assertRaises(TypeError):
+            self.fs.FrameSource()
+
+
+class FakeWorkerHands:
+    """Worker surecte calisan sahte el algilayici - landmark x'i goruntu ortalamasi"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def process(self, image):
+        if self.delay:
+            time.sleep(self.delay)  # Goruntu beklemeden sonra okunur - slot ezilirse sonuc bozulur
+        value = float(image.mean()) / 255
+        return MockResults([MockHand([(value, 0.5)] * 21)] if value > 0 else None)
+
+
+def fake_worker_hands_factory(max_num_hands=1, confidence=0.7):
+    return FakeWorkerHands()
+
+
+def slow_worker_hands_factory(max_num_hands=1, confidence=0.7):
+    return FakeWorkerHands(delay=0.3)
+
+
+def failing_worker_hands_factory(max_num_hands=1, confidence=0.7):
+    raise ImportError("mediapipe yok")
+
+
+class TestInferenceWorker(unittest.TestCase):
+    """InferenceWorker (ayri surecte inference) testleri"""
+
+    def setUp(self):
+        try:
+            import numpy as np
+            from utils.inference_worker import InferenceWorker
+        except ImportError:
+            self.skipTest("Inference worker module not available")
+        self.np = np
+        self.InferenceWorker = InferenceWorker
+
+    def test_frames_roundtrip_through_shared_memory(self):
+        """Goruntu paylasimli bellekle gitmeli, landmark'lar geri donmeli"""
+        with self.InferenceWorker((48, 64, 3), hands_factory=fake_worker_hands_factory) as worker:
+            results = worker.process(self.np.full((48, 64, 3), 51, dtype=self.np.uint8))
+            self.assertAlmostEqual(results.multi_hand_landmarks[0].landmark[8].x, 0.2, places=5)
+
+            # Kucuk (olceklenmis / kirpilmis) goruntu da ayni slota sigmali
+            results = worker.process(self.np.full((24, 32, 3), 102, dtype=self.np.uint8))
+            self.assertAlmostEqual(results.multi_hand_landmarks[0].landmark[0].x, 0.4, places=5)
+
+            self.assertIsNone(worker.process(self.np.zeros((48, 64, 3), dtype=self.np.uint8)).multi_hand_landmarks)
+
+            with self.assertRaises(ValueError):
+                worker.process(self.np.zeros((96, 128, 3), dtype=self.np.uint8))
+
+            stats = worker.get_stats()
+            self.assertEqual(stats['frames'], 3)
+            self.assertEqual(stats['timeouts'], 0)
+
+    def test_timed_out_request_keeps_its_slot(self):
+        """Zaman asimindaki istegin slotuna, worker cevap verene kadar yazilmamali"""
+        with self.InferenceWorker((48, 64, 3), slots=2, result_timeout=0.05,
+                                  hands_factory=slow_worker_hands_factory) as worker:
+            for value in (51, 102, 153):
+                results = worker.process(self.np.full((48, 64, 3), value, dtype=self.np.uint8))
+                self.assertIsNone(results.multi_hand_landmarks)
+            # Iki slot da mesgul - ucuncu goruntu hicbir slota yazilmadi
+            self.assertEqual(worker.get_stats()['slots_in_flight'], 2)
+            self.assertEqual(worker.get_stats()['timeouts'], 3)
+
+            worker.result_timeout = 2.0
+            results = worker.process(self.np.full((48, 64, 3), 204, dtype=self.np.uint8))
+            self.assertAlmostEqual(results.multi_hand_landmarks[0].landmark[0].x, 0.8, places=5)
+            self.assertEqual(worker.get_stats()['slots_in_flight'], 0)
+
+    def test_start_failure_is_reported(self):
+        """Worker baslatilamazsa RuntimeError verilmeli"""
+        worker = self.InferenceWorker((48, 64, 3), hands_factory=failing_worker_hands_factory)
+        with self.assertRaises(RuntimeError):
+            worker.start()
+
+
+class FakeLandmarker:
+    """detect_async taklidi - sonuclar test tarafindan complete() ile verilir"""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.pending = []
+        self.closed = False
+
+    def detect_async(self, image, timestamp_ms):
+        self.pending.append((float(image.mean()) / 255, timestamp_ms))
+
+    def complete(self, index=0, label='Right'):
+        from types import SimpleNamespace
+        value, timestamp_ms = self.pending.pop(index)
+        points = [SimpleNamespace(x=value, y=0.5, z=0.0) for _ in range(21)]
+        result = SimpleNamespace(hand_landmarks=[points] if value > 0 else [],
+                                 handedness=[[SimpleNamespace(category_name=label, score=0.9)]] if value > 0 else [])
+        self.callback(result, timestamp_ms)
+
+    def close(self):
+        self.closed = True
+
+
+class TestHandBackends(unittest.TestCase):
+    """El landmark arka uclari (async HandLandmarker) testleri"""
+
+    def setUp(self):
+        try:
+            import numpy as np
+            from utils import hand_backends
+        except ImportError:
+            self.skipTest("Hand backends module not available")
+        self.np = np
+        self.hb = hand_backends
+        self.clock = FakeClock()
+        self.landmarkers = []
+
+        def factory(callback):
+            self.landmarkers.append(FakeLandmarker(callback))
+            return self.landmarkers[-1]
+
+        self.backend = self.hb.HandLandmarkerBackend('model.task', landmarker_factory=factory, clock=self.clock)
+        self.frame = self.np.full((48, 64, 3), 51, dtype=self.np.uint8)
+
+    def test_process_does_not_wait_for_inference(self):
+        """process() sonucu beklememeli, tamamlanan sonuc sonraki cagrida donmeli"""
+        landmarker = self.landmarkers[0]
+        self.assertIsNone(self.backend.process(self.frame).multi_hand_landmarks)
+        self.assertEqual(len(landmarker.pending), 1)
+
+        self.clock.now += 0.02
+        landmarker.complete(label='Left')
+        results = self.backend.process(self.frame)
+        hand = results.multi_hand_landmarks[0]
+        self.assertAlmostEqual(hand.landmark[8].x, 0.2, places=5)
+        self.assertFalse(hand.landmark[8].HasField('visibility'))
+        self.assertEqual(results.multi_handedness[0].classification[0].label, 'Left')
+
+        # Her cagri yeni nesne - yerinde aynalama saklanan sonucu bozmamali
+        results.multi_hand_landmarks[0].landmark[8].x = 0.9
+        self.assertAlmostEqual(self.backend.latest().multi_hand_landmarks[0].landmark[8].x, 0.2, places=5)
+        self.assertAlmostEqual(self.backend.get_stats()['avg_latency_ms'], 20.0)
+
+    def test_busy_frames_dropped_and_stale_requests_expire(self):
+        """Inference suruyorken yeni frame atlanmali, cevapsiz istek zaman asiminda birakilmali"""
+        self.assertTrue(self.backend.submit(self.frame))
+        self.assertFalse(self.backend.submit(self.frame))
+        self.assertEqual(self.backend.get_stats()['frames_dropped'], 1)
+
+        self.clock.now += 2.0
+        self.assertTrue(self.backend.submit(self.frame))
+        self.assertEqual(self.backend.get_stats()['frames_expired'], 1)
+
+    def test_timestamps_increase_and_old_results_ignored(self):
+        """Ayni saatte bile zaman damgalari artmali, sira disi eski sonuc yenisini ezmemeli"""
+        backend = self.hb.HandLandmarkerBackend('model.task', max_in_flight=2,
+                                                landmarker_factory=lambda cb: FakeLandmarker(cb), clock=self.clock)
+        landmarker = backend.landmarker
+        backend.submit(self.frame)
+        backend.submit(self.np.full((48, 64, 3), 102, dtype=self.np.uint8))
+        first, second = [ts for _, ts in landmarker.pending]
+        self.assertGreater(second, first)
+
+        landmarker.complete(1)
+        landmarker.complete(0)
+        self.assertEqual(backend.result_timestamp_ms, second)
+        self.assertAlmostEqual(backend.latest().multi_hand_landmarks[0].landmark[0].x, 0.4, places=5)
+
+    def test_factory_errors(self):
+        """Gecersiz arka uc ve eksik model dosyasi acik hata vermeli"""
+        with self.assertRaises(ValueError):
+            self.hb.create_hand_backend('opencv')
+        with self.assertRaises(FileNotFoundError):
+            self.hb.HandLandmarkerBackend('/yok/hand_landmarker.task')
+        with self.assertRaises(ValueError):
+            self.hb.HandLandmarkerBackend('model.task', delegate='tpu', landmarker_factory=FakeLandmarker)
+        with self.assertRaises(TypeError):
+            self.hb.HandBackend()
+
+
+class TestCameraScheduler(unittest.TestCase):
+    """CameraScheduler (coklu kamera, tek inference) testleri"""
+
+    def setUp(self):
+        try:
+            from utils.multi_camera import CameraScheduler, parse_sources
+        except ImportError:
+            self.skipTest("Multi camera module not available")
+        self.parse_sources = parse_sources
+        self.scheduler_class = CameraScheduler
+        self.clock = FakeClock()
+        self.scheduler = CameraScheduler(['0', '2'], poll_interval=0.5, clock=self.clock)
+
+    def _run(self, frames, hands):
+        """Her adimda iki kamera da hazir - secilenleri dondur"""
+        chosen = []
+        for _ in range(frames):
+            cam = self.scheduler.next_camera(['0', '2'])
+            self.scheduler.record(cam, cam in hands, latency_ms=20.0)
+            chosen.append(cam)
+            self.clock.now += 1 / 30
+        return chosen
+
+    def test_round_robin_without_hand(self):
+        """El yokken kameralar sirayla islenmeli"""
+        self.assertEqual(self._run(4, hands=()), ['2', '0', '2', '0'])
+
+    def test_hand_camera_prioritized(self):
+        """El goren kamera her frame'de, digeri poll_interval'da bir islenmeli"""
+        chosen = self._run(60, hands=('2',))
+        self.assertGreaterEqual(chosen.count('2'), 55)
+        self.assertIn(chosen.count('0'), (3, 4, 5))
+
+        stats = self.scheduler.get_stats()
+        self.assertTrue(stats['2']['hand_active'])
+        self.assertFalse(stats['0']['hand_active'])
+        self.assertAlmostEqual(stats['2']['avg_latency_ms'], 20.0)
+        self.assertAlmostEqual(stats['0']['share'] + stats['2']['share'], 1.0)
+
+    def test_idle_rate_capped_without_hand(self):
+        """El yokken toplam inference hizi idle_interval ile sinirlanmali"""
+        scheduler = self.scheduler_class(['0', '2'], poll_interval=0.5, idle_interval=0.05, clock=self.clock)
+        chosen = []
+        for _ in range(30):  # 1 saniye, 30 FPS iki kamera
+            cam = scheduler.next_camera(['0', '2'])
+            if cam is not None:
+                scheduler.record(cam, False)
+                chosen.append(cam)
+            self.clock.now += 1 / 30
+        self.assertIn(len(chosen), (15, 16))
+        self.assertLessEqual(abs(chosen.count('0') - chosen.count('2')), 1)
+
+    def test_only_ready_cameras_chosen(self):
+        """Yeni frame'i olmayan kamera secilmemeli"""
+        self.assertIsNone(self.scheduler.next_camera([]))
+        self.assertEqual(self.scheduler.next_camera(['0']), '0')
+        # Servis dongusu hazir kameralari uretec olarak verir
+        self.assertEqual(self.scheduler.next_camera(cam for cam in ['0', '2']), '2')
+
+    def test_parse_sources(self):
+        """Virgullu liste kamera numarasi ve dosya yollarina ayrilmali"""
+        self.assertEqual(self.parse_sources("0, 2,clip.mp4"), [0, 2, 'clip.mp4'])
+        self.assertEqual(self.parse_sources(None), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -299,6 +299,187 @@ class TestGestureDetector(unittest.TestCase):
         self.assertIsNone(self.detector.hand_size)
         self.assertEqual(len(self.detector.pinch_events), 0)
 
+    def test_same_frame_processed_once(self):
+        """Ayni frame_id ile ikinci çağri durumu ilerletmeden ayni sonucu dondurmeli"""
+        from utils.frame_context import FrameContext
+        self.detector.hand_size = 0.2
+        self.detector.is_calibrated = True
+        landmarks = self.create_mock_hand_landmarks({
+            'wrist': (0.5, 0.5),
+            'thumb': (0.52, 0.48),
+            'index': (0.53, 0.47),
+            'middle': (0.55, 0.45)
+        })
+
+        first = self.detector.detect_gesture(landmarks, context=FrameContext(1, 10.0))
+        cursor_stats = self.detector.smart_cursor.get_stats()
+        action = first['action']
+        first['action'] = 'mutated'  # Çağiranin değişikliği onbelleğe yansimamali
+        second = self.detector.detect_gesture(landmarks, context=FrameContext(1, 10.0))
+
+        self.assertEqual(self.detector.frame_count, 1)
+        self.assertEqual(self.detector.get_performance_stats()['repeated_frames'], 1)
+        self.assertEqual(second['cursor_pos'], first['cursor_pos'])
+        self.assertEqual(second['action'], action)
+        self.assertEqual(self.detector.smart_cursor.get_stats(), cursor_stats)
+
+        # Yeni frame normal işlenir, frame bağlami olmayan çağrilar onbelleğe girmez
+        self.detector.detect_gesture(landmarks, context=FrameContext(2, 10.033))
+        self.detector.detect_gesture(landmarks)
+        self.detector.detect_gesture(landmarks)
+        self.assertEqual(self.detector.frame_count, 4)
+
+    def test_strict_frames_catches_double_processing(self):
+        """strict_frames açikken ayni frame'in ikinci çağrisi AssertionError vermeli"""
+        from utils.frame_context import FrameContext
+        if not __debug__:
+            self.skipTest("Assert'ler -O ile kapali")
+        self.detector.strict_frames = True
+        landmarks = self.create_mock_hand_landmarks({'wrist': (0.5, 0.5), 'middle': (0.5, 0.3)})
+
+        self.detector.detect_gesture(landmarks, context=FrameContext(5, 1.0))
+        with self.assertRaises(AssertionError):
+            self.detector.detect_gesture(landmarks, context=FrameContext(5, 1.0))
+
+
+class TestGestureRules(unittest.TestCase):
+    """gesture_map.json kural derleyicisi testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            from types import SimpleNamespace
+            from core.gesture_rules import GestureRules, RuleError, compile_rules
+        except ImportError:
+            self.skipTest("Gesture rules module not available")
+        self.GestureRules = GestureRules
+        self.RuleError = RuleError
+        self.compile_rules = compile_rules
+        self.config_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src_python', 'config',
+                                        'gesture_map.json')
+
+        def features(index=(0.0, -0.3), thumb=(-0.1, -0.2)):
+            return SimpleNamespace(wrist=(0.5, 0.7), index=(0.5 + index[0], 0.7 + index[1]),
+                                   thumb=(0.5 + thumb[0], 0.7 + thumb[1]))
+        self.features = features
+
+    def test_shipped_config_compiles(self):
+        """Dağitilan gesture_map.json geçerli olmali - kapali hareket kurallari derlenmez"""
+        rules = self.GestureRules(self.config_path).rules
+        self.assertEqual([rule.name for rule in rules.rules], ['fist_to_open', 'open_to_fist_select'])
+        self.assertEqual(rules.inputs, ('pose',))
+        self.assertIn('zoom', rules.disabled)
+
+    def test_rule_base_is_abstract(self):
+        """Rule temel sinifi evaluate() olmadan orneklenememeli"""
+        from core.gesture_rules import Rule
+        with self.assertRaises(TypeError):
+            Rule('base', 'win_key', 0.9, ('pose',))
+
+    def test_rejects_impossible_rules(self):
+        """İmkansiz kurallar tek RuleError'da toplanmali"""
+        gestures = {
+            'pose_based': {
+                'same': {'action': 'win_key', 'type': 'pose_transition', 'from': 'fist', 'to': 'fist',
+                         'confidence': 0.9},
+                'weak': {'action': 'win_key', 'type': 'pose_transition', 'from': 'fist', 'to': 'open_palm',
+                         'confidence': 0.5},
+                'orphan': {'action': 'left_click', 'type': 'pose_transition', 'from': 'open_palm', 'to': 'fist',
+                           'after': 'missing', 'confidence': 0.9},
+                'window': {'action': 'left_click', 'type': 'pose_transition', 'from': 'open_palm', 'to': 'fist',
+                           'min_delay': 2.0, 'max_delay': 1.0, 'confidence': 0.9},
+            },
+            'movement_based': {
+                'flick': {'action': 'teleport', 'type': 'index_movement', 'movement_threshold': 0.0,
+                          'confidence': 0.9},
+            },
+            'unknown_section': {}
+        }
+        with self.assertRaises(self.RuleError) as caught:
+            self.compile_rules(gestures)
+
+        message = str(caught.exception)
+        for fragment in ('same', 'weak', 'orphan', 'window', 'teleport', 'movement_threshold', 'unknown_section'):
+            self.assertIn(fragment, message)
+
+    def test_after_cycle_rejected(self):
+        """Dongusel 'after' zinciri reddedilmeli"""
+        rule = {'action': 'left_click', 'type': 'pose_transition', 'max_delay': 1.0, 'confidence': 0.9}
+        gestures = {'pose_based': {
+            'a': dict(rule, **{'from': 'fist', 'to': 'open_palm', 'after': 'b'}),
+            'b': dict(rule, **{'from': 'open_palm', 'to': 'fist', 'after': 'a'}),
+        }}
+        with self.assertRaises(self.RuleError):
+            self.compile_rules(gestures)
+
+    def test_pose_chain(self):
+        """Win menusu zinciri: aç, bekle, kapat = seç; zaman aşiminda zincir kapanir"""
+        rules = self.compile_rules(None)  # Varsayilan kurallar
+        features = self.features()
+
+        def step(pose, now):
+            rule = rules.evaluate(features, pose, now)
+            return rule.action if rule else None
+
+        self.assertIsNone(step('fist', 10.0))
+        self.assertEqual(step('open_palm', 10.1), 'win_key')
+        self.assertIsNone(step('fist', 10.3))        # min_delay dolmadi
+        self.assertIsNone(step('open_palm', 10.4))   # Menu açik - tekrar açilmaz
+        self.assertEqual(step('fist', 10.7), 'left_click')
+        self.assertIsNone(step('open_palm', 11.2))   # cooldown (seçimden 1 s)
+        self.assertIsNone(step('fist', 11.5))
+        self.assertEqual(step('open_palm', 12.0), 'win_key')
+        self.assertIsNone(step('fist', 15.5))        # max_delay aşildi - seçim yok
+
+    def test_only_changed_rules_evaluated(self):
+        """Girdisi değişmeyen kural değerlendirilmemeli, bekleyen hareket kurali değerlendirilmeli"""
+        rules = self.compile_rules({
+            'pose_based': {
+                'open': {'action': 'win_key', 'type': 'pose_transition', 'from': 'fist', 'to': 'open_palm',
+                         'confidence': 0.9}},
+            'movement_based': {
+                'flick': {'action': 'left_click', 'type': 'index_movement', 'movement_threshold': 0.05,
+                          'min_duration': 0.2, 'confidence': 0.9}},
+        })
+        rest, moved = self.features(), self.features(index=(0.1, -0.3))
+
+        rules.evaluate(rest, 'partial', 0.0)
+        evaluations = rules.evaluations
+        self.assertIsNone(rules.evaluate(rest, 'partial', 0.1))
+        self.assertEqual(rules.evaluations, evaluations)
+
+        self.assertIsNone(rules.evaluate(moved, 'partial', 0.2))      # Hareket başladi
+        self.assertIsNone(rules.evaluate(moved, 'partial', 0.3))      # Girdi ayni ama zamanlayici bekliyor
+        self.assertEqual(rules.evaluate(moved, 'partial', 0.45).action, 'left_click')
+        self.assertIsNone(rules.evaluate(moved, 'partial', 0.9))      # Bir kez tetiklenir
+
+    def test_hot_reload(self):
+        """Dosya değişince kurallar yeniden derlenmeli, geçersiz dosyada eskiler kalmali"""
+        import json
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'gesture_map.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'gestures': {}}, f)
+            rules = self.GestureRules(path, clock=lambda: 0.0, check_interval=1.0)
+            self.assertEqual(len(rules.rules), 0)
+
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'gestures': {'pose_based': {'open': {
+                    'action': 'win_key', 'type': 'pose_transition', 'from': 'fist', 'to': 'open_palm',
+                    'confidence': 0.9}}}}, f)
+            os.utime(path, (1000, 1000))
+            self.assertFalse(rules.maybe_reload(0.5))   # Kontrol araliği dolmadi
+            self.assertTrue(rules.maybe_reload(1.5))
+            self.assertEqual(len(rules.rules), 1)
+
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'gestures': {'pose_based': {'bad': {'action': 'win_key', 'type': 'pose_transition',
+                                                                'from': 'fist', 'to': 'fist'}}}}, f)
+            os.utime(path, (2000, 2000))
+            self.assertFalse(rules.maybe_reload(3.0))
+            self.assertEqual(rules.rules.rules[0].name, 'open')
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
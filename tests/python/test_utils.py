@@ -76,6 +76,27 @@ class TestSmoothingFilters(unittest.TestCase):
         self.assertNotEqual(default_pos, high_sens_pos)
 
 
+class TestSmartCursorPrediction(unittest.TestCase):
+    """SmartCursor / KalmanFilter tahmin testleri - GUI bagimliligi gerektirmez"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            from utils.smoothing_filters import SmartCursor
+            self.smart_cursor = SmartCursor()
+        except ImportError:
+            self.skipTest("Smoothing filters module not available")
+
+    def test_smart_cursor_prediction(self):
+        """SmartCursor atlanan frame tahmini testi"""
+        for i in range(5):
+            self.smart_cursor.process_movement(0.3 + i * 0.02, 0.5, 1920, 1080)
+
+        predicted = self.smart_cursor.predict_movement(1920, 1080)
+        self.assertIsInstance(predicted, tuple)
+        self.assertEqual(self.smart_cursor.get_stats()['predicted_movements'], 1)
+
+
 class TestPerformanceMonitor(unittest.TestCase):
     """Performance monitor modulu testleri"""
     
@@ -136,6 +157,609 @@ class TestPerformanceMonitor(unittest.TestCase):
         self.assertEqual(frame_count, 0)
 
 
+class TestOverlayRenderer(unittest.TestCase):
+    """Overlay renderer (gorsel geri bildirim) testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            import numpy as np
+            from utils.overlay import OverlayRenderer
+        except ImportError:
+            self.skipTest("Overlay module not available")
+
+        self.np = np
+        self.system = Mock()
+        self.system.calibration_countdown = 0
+        self.renderer = OverlayRenderer(self.system)
+
+    def test_draw_no_hand(self):
+        """El yok mesaji frame'e cizilmeli"""
+        frame = self.np.zeros((120, 320, 3), dtype=self.np.uint8)
+        self.renderer.draw_no_hand(frame)
+        self.assertGreater(frame.sum(), 0)
+
+    def test_draw_calibration_only_during_countdown(self):
+        """Kalibrasyon overlay'i sadece geri sayim varken cizilmeli"""
+        frame = self.np.zeros((240, 320, 3), dtype=self.np.uint8)
+        self.renderer.draw_calibration(frame)
+        self.assertEqual(frame.sum(), 0)
+
+        self.system.calibration_countdown = 30
+        self.renderer.draw_calibration(frame)
+        self.assertGreater(frame.sum(), 0)
+
+    def test_static_layer_matches_direct_drawing(self):
+        """Onbellekten uygulanan katman dogrudan cizimle ayni pikselleri vermeli"""
+        import cv2
+        frame = self.np.zeros((120, 480, 3), dtype=self.np.uint8)
+        self.renderer.draw_no_hand(frame)
+
+        expected = self.np.zeros_like(frame)
+        cv2.putText(expected, "El algilanmadi - Elinizi kameranin onune getirin",
+                    (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
+        self.assertTrue(self.np.array_equal(frame, expected))
+
+    def test_static_layer_cached_until_state_changes(self):
+        """Katman durum degisene kadar yeniden cizilmemeli"""
+        self.system.show_help = True
+        self.system.tutorial_mode = False
+        self.system.action_handler.get_status.return_value = {
+            'safe_mode': True, 'disabled': False, 'cursor_frozen': False, 'drag_mode': False
+        }
+
+        frame = self.np.zeros((240, 320, 3), dtype=self.np.uint8)
+        for _ in range(5):
+            self.renderer._blend_static(frame, 'feedback')
+        self.assertEqual(self.renderer.layers.builds, 1)
+        self.assertEqual(self.renderer.layers.hits, 4)
+
+        self.system.show_help = False
+        self.renderer._blend_static(frame, 'feedback')
+        self.assertEqual(self.renderer.layers.builds, 2)
+
+
+class TestLandmarkTrace(unittest.TestCase):
+    """Landmark izi kaydi ve tekrar oynatma testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            import numpy as np
+            from types import SimpleNamespace
+            from utils.landmark_trace import TraceRecorder, LandmarkTrace, TraceReplayer
+        except ImportError:
+            self.skipTest("Landmark trace module not available")
+
+        self.np = np
+        self.TraceReplayer = TraceReplayer
+        self.LandmarkTrace = LandmarkTrace
+
+        def hand(offset):
+            points = [SimpleNamespace(x=offset + i / 100, y=0.5, z=-i / 1000) for i in range(21)]
+            return SimpleNamespace(landmark=points)
+
+        def handedness(label):
+            return SimpleNamespace(classification=[SimpleNamespace(label=label, score=0.9)])
+
+        # 3 frame: tek el, el yok, iki el
+        self.recorder = TraceRecorder(metadata={'source': 'test'})
+        self.recorder.record(SimpleNamespace(multi_hand_landmarks=[hand(0.1)],
+                                             multi_handedness=[handedness('Right')]), 10.0)
+        self.recorder.record(SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None), 10.033)
+        self.recorder.record(SimpleNamespace(multi_hand_landmarks=[hand(0.2), hand(0.5)],
+                                             multi_handedness=[handedness('Left'), handedness('Right')]), 10.066)
+
+    def test_save_load_roundtrip(self):
+        """Kaydedilen iz ayni landmark, yon ve zamanlarla okunmali"""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.recorder.save(os.path.join(tmp, 'trace.npz'))
+            trace = self.LandmarkTrace.load(path)
+
+        self.assertEqual(len(trace), 3)
+        self.assertEqual(trace.landmarks.dtype, self.np.float32)
+        self.assertEqual(trace.hands(1).shape, (0, 21, 3))
+        self.assertEqual(trace.hands(2).shape, (2, 21, 3))
+        self.assertAlmostEqual(float(trace.hands(2)[1, 3, 0]), 0.53, places=5)
+        self.assertAlmostEqual(trace.duration, 0.066)
+        self.assertEqual(trace.metadata['source'], 'test')
+
+        # El ozellikleri kayitla birlikte yazilir (ilk sutun pinch mesafesi)
+        self.assertEqual(trace.hand_features(2).shape, (2, len(trace.metadata['feature_names'])))
+        self.assertEqual(trace.metadata['feature_names'][0], 'pinch_distance')
+        self.assertAlmostEqual(float(trace.hand_features(2)[0, 0]), 0.04, places=5)
+
+        results = trace.results(2)
+        self.assertEqual(results.multi_handedness[0].classification[0].label, 'Left')
+        self.assertAlmostEqual(results.multi_hand_landmarks[0].landmark[8].x, 0.28, places=5)
+        self.assertIsNone(trace.results(1).multi_hand_landmarks)
+
+    def test_replay_into_detector(self):
+        """detect_gesture'a sahip hedef her el icin cagrilmali"""
+        class Detector:
+            def __init__(self):
+                self.calls = []
+                self.contexts = []
+
+            def detect_gesture(self, landmarks, context=None):
+                self.calls.append(float(landmarks[8][0]))  # Kayittaki (21, 3) dizi
+                self.contexts.append(context)
+                return {'action': 'left_click' if len(self.calls) == 1 else None}
+
+        detector = Detector()
+        stats = self.TraceReplayer(self.LandmarkTrace.from_recorder(self.recorder)).replay(detector)
+
+        self.assertEqual(len(detector.calls), 3)
+        self.assertEqual(stats['frames'], 3)
+        self.assertEqual(stats['hand_frames'], 2)
+        self.assertEqual(stats['actions'], 1)
+        self.assertEqual(stats['action_counts'], {'left_click': 1})
+        # Frame baglami kayittaki sira ve zamandan
+        self.assertEqual([c.frame_id for c in detector.contexts], [0, 2, 2])
+        self.assertEqual(detector.contexts[0].capture_time, 10.0)
+
+    def test_replay_into_system_clears_hand(self):
+        """process_frame hedefi el yokken clear_last_hand almali"""
+        system = Mock(spec=['process_frame', 'clear_last_hand'])
+        system.process_frame.return_value = {'action': None}
+        self.TraceReplayer(self.LandmarkTrace.from_recorder(self.recorder)).replay(system)
+
+        self.assertEqual(system.process_frame.call_count, 3)
+        self.assertEqual(system.clear_last_hand.call_count, 1)
+
+    def test_replay_into_system_batches_hands(self):
+        """process_hands hedefi frame'in tum ellerini tek çağrida almali"""
+        system = Mock(spec=['process_hands', 'process_frame', 'clear_last_hand'])
+        system.process_hands.side_effect = lambda frame, results, context: [
+            {'action': None} for _ in results.multi_hand_landmarks]
+        stats = self.TraceReplayer(self.LandmarkTrace.from_recorder(self.recorder)).replay(system)
+
+        self.assertEqual(system.process_hands.call_count, 2)
+        context = system.process_hands.call_args_list[1][0][2]
+        self.assertEqual(context.frame_id, 2)
+        self.assertAlmostEqual(context.capture_time, 10.066)
+        self.assertEqual(system.process_frame.call_count, 0)
+        self.assertEqual(stats['hand_frames'], 2)
+
+
+class TestClock(unittest.TestCase):
+    """Enjekte edilebilir saat testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            from utils.clock import FrameClock, VirtualClock
+            from utils.smoothing_filters import AutoCalibrator, SmartCursor
+        except ImportError:
+            self.skipTest("Clock module not available")
+        self.FrameClock = FrameClock
+        self.clock = VirtualClock(1000.0)
+        self.AutoCalibrator = AutoCalibrator
+        self.SmartCursor = SmartCursor
+
+    def _landmarks(self, size=0.2):
+        return [Mock(x=0.5, y=0.5 - size * (i == 12), z=0.0) for i in range(21)]
+
+    def test_calibration_uses_injected_clock(self):
+        """Kalibrasyon suresi gercek zaman yerine verilen saatle olculmeli"""
+        calibrator = self.AutoCalibrator(clock=self.clock)
+        calibrator.start_calibration()
+        for _ in range(40):
+            self.assertFalse(calibrator.add_calibration_sample(self._landmarks()))
+            self.clock.advance(1 / 30)
+
+        self.clock.advance(2.0)
+        self.assertTrue(calibrator.add_calibration_sample(self._landmarks()))
+        self.assertAlmostEqual(calibrator.hand_size, 0.2)
+
+    def test_filter_velocity_uses_injected_clock(self):
+        """Adaptif filtre hizi saat farkindan hesaplamali"""
+        cursor = self.SmartCursor(clock=self.clock)
+        cursor.adaptive_filter.add_position(0.0, 0.0)
+        self.clock.advance(0.5)
+        cursor.adaptive_filter.add_position(1.0, 0.0)
+        self.assertEqual(cursor.adaptive_filter.velocity_history[-1], (2.0, 0.0))
+
+        # reset() saati korumali
+        cursor.reset()
+        self.assertIs(cursor.adaptive_filter.clock, self.clock)
+
+    def test_filter_velocity_uses_capture_timestamp(self):
+        """Zaman damgasi verilirse hiz saat yerine yakalama zamanlarindan hesaplanmali"""
+        cursor = self.SmartCursor(clock=self.clock)
+        cursor.adaptive_filter.add_position(0.0, 0.0, timestamp=10.0)
+        self.clock.advance(0.5)  # İşleme gecikmesi hizi etkilememeli
+        cursor.adaptive_filter.add_position(1.0, 0.0, timestamp=10.25)
+        self.assertEqual(cursor.adaptive_filter.velocity_history[-1], (4.0, 0.0))
+
+    def test_detector_uses_frame_context_time(self):
+        """Detektor kalibrasyonu frame bağlamindaki yakalama zamanini kullanmali"""
+        from utils.frame_context import FrameContext
+        from core.gesture_detector import GestureDetector
+
+        detector = GestureDetector(clock=self.clock)
+        context = FrameContext(7, 50.0)
+        detector.detect_gesture(self._landmarks(), context=context)
+        self.assertEqual(detector.auto_calibrator.calibration_start_time, 50.0)
+        self.assertEqual(detector.auto_calibrator.calibration_data[-1]['timestamp'], 50.0)
+
+        self.assertAlmostEqual(context.age_ms(now=50.02), 20.0)
+        self.assertIn('frame_id=7', repr(context))
+
+    def test_frame_clock_fallback(self):
+        """FrameClock frame zamani yokken yedek saati kullanmali"""
+        clock = self.FrameClock(fallback=self.clock)
+        self.assertEqual(clock(), 1000.0)
+        clock.set(5.0)
+        self.clock.advance(10)
+        self.assertEqual(clock(), 5.0)
+
+
+class TestHandFeatures(unittest.TestCase):
+    """Toplu el ozellikleri ve el anahtarlari testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            from types import SimpleNamespace
+            from utils.hand_features import (HandFeatures, compute_hand_features, feature_matrix, hand_feature_rows,
+                                             hand_keys, hands_to_array, landmark_array)
+            from core.gesture_detector import GestureDetector
+        except ImportError:
+            self.skipTest("Hand features module not available")
+        self.compute_hand_features = compute_hand_features
+        self.landmark_array = landmark_array
+        self.HandFeatures = HandFeatures
+        self.feature_matrix = feature_matrix
+        self.hand_feature_rows = hand_feature_rows
+        self.hand_keys = hand_keys
+        self.hands_to_array = hands_to_array
+        self.GestureDetector = GestureDetector
+
+        def hand(pinch):
+            points = [SimpleNamespace(x=0.5, y=0.5, z=0.0) for _ in range(21)]
+            points[4] = SimpleNamespace(x=0.5, y=0.5, z=0.0)          # Başparmak
+            points[8] = SimpleNamespace(x=0.5 + pinch, y=0.5, z=0.0)  # İşaret parmaği
+            points[12] = SimpleNamespace(x=0.5, y=0.3, z=0.0)         # Orta parmak
+            points[20] = SimpleNamespace(x=0.5, y=0.2, z=0.0)         # Serçe parmak
+            return SimpleNamespace(landmark=points)
+
+        def handedness(label):
+            return SimpleNamespace(classification=[SimpleNamespace(label=label, score=0.9)])
+
+        self.hand = hand
+        self.handedness = handedness
+
+    def test_batched_distances(self):
+        """Tum ellerin mesafeleri tek geçişte ve el başina doğru hesaplanmali"""
+        results = Mock(multi_hand_landmarks=[self.hand(0.02), self.hand(0.1)],
+                       multi_handedness=[self.handedness('Left'), self.handedness('Right')])
+        rows = self.hand_feature_rows(self.compute_hand_features(self.hands_to_array(results)))
+
+        self.assertEqual(len(rows), 2)
+        self.assertAlmostEqual(rows[0]['pinch_distance'], 0.02)
+        self.assertAlmostEqual(rows[1]['pinch_distance'], 0.1)
+        self.assertAlmostEqual(rows[1]['middle_to_index'], (0.1 ** 2 + 0.2 ** 2) ** 0.5)
+        self.assertEqual(len(rows[0]['tip_distances']), 5)
+        self.assertAlmostEqual(rows[0]['tip_distances'][4], 0.3)
+        self.assertEqual(len(rows[1]['index']), 2)
+        for value, expected in zip(rows[1]['index'], (0.6, 0.5)):
+            self.assertAlmostEqual(value, expected)  # float32 landmark dizisi
+
+        empty = self.compute_hand_features(self.hands_to_array(Mock(multi_hand_landmarks=None)))
+        self.assertEqual(self.hand_feature_rows(empty), [])
+
+    def test_hand_keys(self):
+        """El anahtari handedness etiketi, yoksa ya da tekrarliysa sira numarasi olmali"""
+        results = Mock(multi_hand_landmarks=[self.hand(0.1)] * 3,
+                       multi_handedness=[self.handedness('Right'), self.handedness('Right')])
+        self.assertEqual(self.hand_keys(results), ['Right', 'hand1', 'hand2'])
+
+    def test_detector_accepts_precomputed_features(self):
+        """Hazir ozelliklerle detect_gesture ayni sonucu vermeli"""
+        hand = self.hand(0.02)
+        row = self.hand_feature_rows(self.compute_hand_features(
+            self.hands_to_array(Mock(multi_hand_landmarks=[hand]))))[0]
+
+        plain, batched = self.GestureDetector(), self.GestureDetector()
+        for detector in (plain, batched):
+            detector.is_calibrated = True
+            detector.hand_size = 0.2
+
+        expected = plain.detect_gesture(hand.landmark)
+        result = batched.detect_gesture(hand.landmark, row)
+        self.assertTrue(result['pinch_active'])
+        self.assertEqual(result['pinch_active'], expected['pinch_active'])
+        self.assertAlmostEqual(result['raw_pinch_distance'], expected['raw_pinch_distance'])
+        self.assertEqual(batched.prev_hand_pose, plain.prev_hand_pose)
+
+    def test_landmark_array_adapter(self):
+        """Landmark nesneleri, listeleri ve diziler ayni (21, 3) float32 diziye donmeli"""
+        from types import SimpleNamespace
+        import numpy as np
+        hand = self.hand(0.1)
+        points = self.landmark_array(hand)
+
+        self.assertEqual(points.shape, (21, 3))
+        self.assertEqual(points.dtype, np.float32)
+        self.assertTrue(points.flags['C_CONTIGUOUS'])
+        np.testing.assert_array_equal(self.landmark_array(hand.landmark), points)
+        self.assertIs(self.landmark_array(points), points)
+
+        # z alani olmayan landmark'lar (eski testlerdeki gibi) 0 kabul edilir
+        flat = [SimpleNamespace(x=lm.x, y=lm.y) for lm in hand.landmark]
+        np.testing.assert_array_equal(self.landmark_array(flat), points)
+
+    def test_hand_features_match_batch(self):
+        """Tek elin HandFeatures değerleri toplu hesaplamanin satiriyla ayni olmali"""
+        hand = self.hand(0.05)
+        points = self.hands_to_array(Mock(multi_hand_landmarks=[hand]))
+        row = self.hand_feature_rows(self.compute_hand_features(points))[0]
+        features = self.HandFeatures(self.landmark_array(hand), frame_id=7)
+
+        for key in ('pinch_distance', 'middle_to_thumb', 'middle_to_index'):
+            self.assertAlmostEqual(getattr(features, key), row[key], places=6)
+        for key in ('tip_distances', 'index', 'thumb', 'middle'):
+            for value, expected in zip(getattr(features, key), row[key]):
+                self.assertAlmostEqual(value, expected, places=6)
+        self.assertAlmostEqual(features.hand_size, row['tip_distances'][2], places=6)
+
+        # Trace satiri toplu feature_matrix ile ayni sutunlar
+        matrix = self.feature_matrix(points)
+        self.assertEqual(matrix.shape, (1, len(features.as_dict())))
+        for value, expected in zip(features.to_array().tolist(), matrix[0].tolist()):
+            self.assertAlmostEqual(value, expected, places=5)
+
+    def test_batch_and_single_rows_identical(self):
+        """Toplu ve tek el yollari ayni mesafe tablosundan birebir ayni satirlari vermeli"""
+        import numpy as np
+        from utils.hand_features import FEATURE_NAMES
+        rng = np.random.default_rng(3)
+        points = rng.random((4, 21, 3), dtype=np.float32)
+
+        matrix = self.feature_matrix(points)
+        rows = self.hand_feature_rows(self.compute_hand_features(points))
+        self.assertEqual(matrix.shape[1], len(FEATURE_NAMES))
+        for i in range(len(points)):
+            single = self.HandFeatures(points[i])
+            np.testing.assert_array_equal(single.to_array(), matrix[i])
+            from_row = self.HandFeatures(points[i], row=rows[i])
+            np.testing.assert_array_equal(from_row.to_array(), matrix[i])
+            self.assertEqual(single.tip_distances, rows[i]['tip_distances'])
+            self.assertEqual(single.index, rows[i]['index'])
+
+    def test_hand_features_shared_per_frame(self):
+        """Ayni frame_id için ozellikler bir kez oluşturulup kalibrasyonla paylaşilmali"""
+        from utils.frame_context import FrameContext
+        detector = self.GestureDetector()
+        hand = self.landmark_array(self.hand(0.05))
+
+        first = detector.hand_features(hand, context=FrameContext(1, 10.0))
+        self.assertIs(detector.hand_features(hand, context=FrameContext(1, 10.0)), first)
+        self.assertIsNot(detector.hand_features(hand, context=FrameContext(2, 10.1)), first)
+
+        # Kalibrator ayni nesneden okur - hazir değerler yeniden hesaplanmaz
+        first._palm_center = (0.25, 0.75)
+        sample = detector.auto_calibrator._extract_hand_features(first, 10.0)
+        self.assertEqual(sample['palm_center'], (0.25, 0.75))
+        self.assertAlmostEqual(sample['hand_size'], first.hand_size)
+        self.assertEqual(len(sample['fingertips']), 5)
+
+    def test_detector_array_and_object_input(self):
+        """detect_gesture dizi ve landmark nesnesi girdisinde ayni sonucu vermeli"""
+        hand = self.hand(0.02)
+        objects, arrays = self.GestureDetector(), self.GestureDetector()
+        for detector in (objects, arrays):
+            detector.is_calibrated = True
+            detector.hand_size = 0.2
+
+        expected = objects.detect_gesture(hand.landmark)
+        result = arrays.detect_gesture(self.landmark_array(hand))
+        self.assertEqual(result['pinch_active'], expected['pinch_active'])
+        self.assertEqual(result['drag_active'], expected['drag_active'])
+        for value, ref in zip(result['cursor_pos'], expected['cursor_pos']):
+            self.assertAlmostEqual(value, ref, places=3)
+        self.assertAlmostEqual(result['raw_pinch_distance'], expected['raw_pinch_distance'])
+
+
+class FakeAnalysisHands:
+    """hands.process taklidi - her frame'de sabit bir el dondurur"""
+
+    def __init__(self, max_num_hands=1, confidence=0.7):
+        from types import SimpleNamespace
+        points = [SimpleNamespace(x=0.5, y=0.5, z=0.0) for _ in range(21)]
+        self.results = SimpleNamespace(multi_hand_landmarks=[SimpleNamespace(landmark=points)],
+                                       multi_handedness=None)
+        self.calls = 0
+
+    def process(self, image):
+        self.calls += 1
+        return self.results
+
+
+class TestBatchAnalysis(unittest.TestCase):
+    """Toplu çevrimdişi analiz testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            import numpy as np
+            from types import SimpleNamespace
+            from utils import batch_analysis
+            from utils.landmark_trace import TraceRecorder
+        except ImportError:
+            self.skipTest("Batch analysis module not available")
+        import tempfile
+
+        self.np = np
+        self.analysis = batch_analysis
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+        # 20 saniyelik iz: kalibrasyon, sonra her 2 saniyede bir pinch
+        recorder = TraceRecorder(os.path.join(self.tmp.name, 'oturum.npz'))
+        for i in range(600):
+            pinch = 0.02 if (i // 20) % 3 == 0 else 0.12
+            points = [SimpleNamespace(x=0.55, y=0.35, z=0.0) for _ in range(21)]
+            points[0] = SimpleNamespace(x=0.5, y=0.8, z=0.0)
+            points[4] = SimpleNamespace(x=0.45, y=0.4, z=0.0)
+            points[8] = SimpleNamespace(x=0.45 + pinch, y=0.4, z=0.0)
+            points[12] = SimpleNamespace(x=0.5, y=0.3, z=0.0)
+            recorder.record(SimpleNamespace(multi_hand_landmarks=[SimpleNamespace(landmark=points)],
+                                            multi_handedness=None), i / 30)
+        self.trace_path = recorder.save()
+
+    def test_trace_timeline(self):
+        """İz analizi olay zaman çizelgesi, eylem sayilari ve aşama sureleri vermeli"""
+        result = self.analysis.analyze_file(self.trace_path)
+
+        self.assertIsNone(result['error'])
+        self.assertEqual(result['kind'], 'trace')
+        self.assertEqual(result['frames'], 600)
+        self.assertGreater(result['actions'].get('left_click', 0), 0)
+        self.assertEqual(sum(result['actions'].values()), len(result['events']))
+        self.assertEqual(result['executed_actions'], result['actions'])
+        times = [event['t'] for event in result['events']]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(set(result['stages']), {'decode', 'gesture'})
+        self.assertEqual(result['stages']['gesture']['count'], 600)
+
+    def test_video_uses_hands_factory(self):
+        """Video frame'leri verilen el algilayicidan geçmeli"""
+        import cv2
+        video_path = os.path.join(self.tmp.name, 'kayit.avi')
+        writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*'MJPG'), 30, (64, 48))
+        for i in range(12):
+            writer.write(self.np.full((48, 64, 3), i * 10, dtype=self.np.uint8))
+        writer.release()
+
+        result = self.analysis.analyze_file(video_path, hands_factory=FakeAnalysisHands)
+        self.assertIsNone(result['error'])
+        self.assertEqual(result['kind'], 'video')
+        self.assertEqual(result['frames'], 12)
+        self.assertEqual(result['hand_frames'], 12)
+        self.assertEqual(result['stages']['inference']['count'], 12)
+
+    def test_process_pool_keeps_order_and_reports_errors(self):
+        """Süreç havuzu sonuçlari girdi sirasiyla dondurmeli, bozuk dosya diğerlerini durdurmamali"""
+        missing = os.path.join(self.tmp.name, 'yok.npz')
+        results = self.analysis.analyze_files([self.trace_path, missing, self.trace_path], workers=2)
+
+        self.assertEqual([r['file'] for r in results], [self.trace_path, missing, self.trace_path])
+        self.assertIsNone(results[0]['error'])
+        self.assertIsNotNone(results[1]['error'])
+        self.assertEqual(results[0]['actions'], results[2]['actions'])
+
+    def test_writers(self):
+        """JSON ve CSV çiktilari dosya başina satir/olay içermeli"""
+        import csv
+        import json
+        results = self.analysis.analyze_files([self.trace_path], workers=1)
+        out = os.path.join(self.tmp.name, 'analiz')
+
+        written = self.analysis.write_csv(results, out)
+        with open(written[0], newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(rows[0]['frames'], '600')
+        self.assertEqual(int(rows[0]['action_left_click']), results[0]['actions']['left_click'])
+        with open(written[1], newline='') as f:
+            self.assertEqual(len(list(csv.DictReader(f))), len(results[0]['events']))
+
+        with open(self.analysis.write_json(results, os.path.join(out, 'analysis.json'))) as f:
+            report = json.load(f)
+        self.assertEqual(report['summary']['frames'], 600)
+        self.assertEqual(len(report['files'][0]['events']), len(results[0]['events']))
+
+
+class TestLatencyProbe(unittest.TestCase):
+    """Gecikme olcum modu testleri"""
+
+    def setUp(self):
+        """Her test için setup"""
+        try:
+            import numpy as np
+            from utils.clock import VirtualClock
+            from utils.frame_context import FrameContext
+            from utils.latency_probe import LatencyProbe, FlashTest, format_report
+        except ImportError:
+            self.skipTest("Latency probe module not available")
+        self.np = np
+        self.clock = VirtualClock(100.0)
+        self.FrameContext = FrameContext
+        self.probe = LatencyProbe(clock=self.clock)
+        self.FlashTest = FlashTest
+        self.format_report = format_report
+
+    def test_stage_segments(self):
+        """Asama sureleri ardisik damgalardan hesaplanmali"""
+        for i in range(10):
+            context = self.FrameContext(i, 100.0 + i)
+            self.probe.mark(context, 'inference', 100.0 + i + 0.020)
+            self.probe.mark(context, 'gesture', 100.0 + i + 0.025)
+            if i % 2 == 0:
+                self.probe.mark(context, 'output', 100.0 + i + 0.030 + i / 1000)
+            self.probe.finish(context)
+
+        report = self.probe.report()
+        self.assertEqual(report['inference']['count'], 10)
+        self.assertAlmostEqual(report['inference']['p50_ms'], 20.0, places=3)
+        self.assertAlmostEqual(report['gesture']['p99_ms'], 5.0, places=3)
+        self.assertEqual(report['output']['count'], 5)
+        self.assertAlmostEqual(report['total']['max_ms'], 38.0, places=3)
+        self.assertIn('p95', self.format_report(report))
+
+    def test_cameras_with_same_frame_id_kept_apart(self):
+        """Coklu kamerada ayni frame_id'li frame'lerin damgalari karismamali"""
+        left = self.FrameContext(1, 100.0, camera_id='0')
+        right = self.FrameContext(1, 100.010, camera_id='2')
+        self.probe.mark(left, 'inference', 100.020)
+        self.probe.mark(right, 'inference', 100.050)
+        self.probe.finish(left)
+        self.probe.finish(right)
+
+        samples = sorted(self.probe.samples['inference'])
+        self.assertEqual(len(samples), 2)
+        self.assertAlmostEqual(samples[0], 20.0, places=3)
+        self.assertAlmostEqual(samples[1], 40.0, places=3)
+
+    def test_unfinished_frames_are_bounded(self):
+        """finish() gelmeyen frame'ler sinirsiz birikmemeli, bağlamsiz damga yok sayilmali"""
+        from utils.latency_probe import LatencyProbe
+        probe = LatencyProbe(clock=self.clock, max_pending=4)
+        for i in range(10):
+            probe.mark(self.FrameContext(i, 100.0), 'inference')
+        probe.mark(None, 'gesture')
+        probe.finish(None)
+        self.assertEqual(len(probe._pending), 4)
+        self.assertEqual(probe.report()['total'], {'count': 0})
+
+    def test_flash_test_measures_display_to_camera(self):
+        """Flas gosterildikten sonra parlaklik sicramasini goren frame gecikme vermeli"""
+        flash = self.FlashTest(interval=1.0, threshold=40.0, timeout=0.5, clock=self.clock)
+        dark = self.np.full((48, 64, 3), 20, dtype=self.np.uint8)
+        self.assertFalse(flash.update(flash.measure(dark), 100.0))
+
+        self.clock.advance(1.0)
+        self.assertTrue(flash.update(20.0, 101.0))
+        self.assertEqual(int(flash.flash_frame(dark)[0, 0, 0]), 255)
+        flash.displayed()  # 101.0'da ekranda
+
+        # Flastan once yakalanan parlak frame sayilmaz, sonraki sayilir
+        self.assertTrue(flash.update(200.0, 100.99))
+        self.clock.advance(0.1)
+        self.assertFalse(flash.update(200.0, 101.08))
+        self.assertAlmostEqual(flash.report()['p50_ms'], 80.0, places=3)
+
+        # Kamera flasi gormezse timeout sonrasi kacirilmis sayilir
+        self.clock.advance(1.0)
+        self.assertTrue(flash.update(20.0, 102.1))
+        flash.displayed()
+        self.clock.advance(0.6)
+        self.assertFalse(flash.update(20.0, 102.7))
+        self.assertEqual(flash.report()['missed'], 1)
+
+
 class TestMainModule(unittest.TestCase):
     """Ana main.py modulu testleri"""
     